@@ -0,0 +1,1004 @@
+#----------------------------------------------------------------------------
+# File          : benchmark.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# ---------------------------------------------------------------------------
+
+
+import sys
+import os
+import time
+import random
+import io
+import tempfile
+import argparse
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+import fitz
+from theses_checker_package import overflow_scan
+from theses_checker_package import rect_index
+from theses_checker_package import content_stream
+from theses_checker_package import annotation_batch
+from theses_checker_package.tolerance_float import ToleranceFloat
+from theses_checker_package.theses_checker import Checker, OverflowEngine, OutputMode
+
+
+## Page sizes (width, height) used by synthetic benchmarks
+PAGE_SIZES = {
+    "A5" : fitz.paper_size("a5"),
+    "A4" : fitz.paper_size("a4"),
+    "A3" : fitz.paper_size("a3"),
+    "A2" : fitz.paper_size("a2"),
+}
+
+## Margin of synthetic pages (left and right)
+PAGE_MARGIN = 72
+
+## Counts of embedded PDF figures on synthetic poster pages
+EMBEDDED_PDF_COUNTS = [1, 10, 50, 200]
+
+## Count of tested rectangles (search hits and text blocks) on one synthetic poster page
+CONTAINMENT_QUERIES = 2000
+
+## Count of pages of synthetic image-heavy document
+IMAGE_PAGE_COUNT = 10
+## Count of photos on one page of synthetic image-heavy document
+IMAGES_PER_PAGE = 4
+
+## Seeds of the page sampler compared by sampling benchmark
+SAMPLING_SEEDS = range(10)
+
+## Memory budgets (in bytes) of cache of extracted pages compared by page_cache benchmark
+PAGE_CACHE_BUDGETS = [0, 1024 * 1024, Checker.PAGE_CACHE_BUDGET]
+
+## Counts of findings (highlights) on one synthetic page, a quarter of them is added as overflow lines and a tenth as arrows
+ANNOTATION_FINDINGS = [10, 50, 200]
+## Color of synthetic annotations in format used in PDF
+ANNOTATION_COLOR = (0.8, 0.0, 0.0)
+
+## Check arguments of Checker.annotate, every check is measured alone by checks benchmark
+CHECK_NAMES = ["borderCheck", "hyphenCheck", "badReferenceCheck", "imageWidthCheck", "TOCCheck", "spaceBracketCheck", "emptySectionCheck"]
+
+## Counts of drawn paths in synthetic TikZ-like content streams
+CONTENT_STREAM_PATHS = [1000, 10000, 100000]
+
+# ---------------------------------------------- HELPERS -----------------------------------------------------
+
+def createSyntheticPage(doc : fitz.Document, width : float, height : float):
+    """
+    Creates a page filled with text lines inside the margins and a few lines overflowing to both sides.
+
+    Args:
+        doc (fitz.Document): Document where the page is created.
+        width (float): Width of the page.
+        height (float): Height of the page.
+
+    Returns:
+        fitz.Page: Created page.
+    """
+    page = doc.new_page(width=width, height=height)
+    y = PAGE_MARGIN
+    lineNumber = 0
+    while y < height - PAGE_MARGIN:
+        text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 10
+        page.insert_textbox(fitz.Rect(PAGE_MARGIN, y, width - PAGE_MARGIN, y + 14), text, fontsize=11)
+        if lineNumber % 10 == 5:
+            page.insert_text((width - PAGE_MARGIN - 20, y + 10), "overflowing text", fontsize=11)
+        if lineNumber % 10 == 8:
+            page.insert_text((PAGE_MARGIN/3, y + 10), "overflow", fontsize=11)
+        y += 14
+        lineNumber += 1
+    return page
+
+def addColumnImage(page : fitz.Page):
+    """
+    Covers the text column of the page with a noisy raster image, which makes rendering of the page expensive.
+
+    Args:
+        page (fitz.Page): Page where the image is inserted.
+    """
+    import numpy
+    column = fitz.Rect(PAGE_MARGIN, PAGE_MARGIN, page.rect.width - PAGE_MARGIN, page.rect.height - PAGE_MARGIN)
+    samples = numpy.random.default_rng(0).integers(0, 256, size=1200*1600*3, dtype=numpy.uint8)
+    image = fitz.Pixmap(fitz.csRGB, 1200, 1600, samples.tobytes(), False)
+    page.insert_image(column, pixmap=image)
+
+def createImageDocument() -> fitz.Document:
+    """
+    Creates image-heavy document: text pages with several noisy photos (noise cannot be compressed, so every photo is big).
+
+    Returns:
+        fitz.Document: Created document.
+    """
+    import numpy
+    generator = numpy.random.default_rng(0)
+    doc = fitz.Document()
+    width, height = PAGE_SIZES["A4"]
+    photoHeight = (height - 2*PAGE_MARGIN) / IMAGES_PER_PAGE
+    for _ in range(IMAGE_PAGE_COUNT):
+        page = createSyntheticPage(doc, width, height)
+        for i in range(IMAGES_PER_PAGE):
+            samples = generator.integers(0, 256, size=800*600*3, dtype=numpy.uint8)
+            photo = fitz.Pixmap(fitz.csRGB, 800, 600, samples.tobytes(), False)
+            y = PAGE_MARGIN + i * photoHeight
+            page.insert_image(fitz.Rect(PAGE_MARGIN, y, width - PAGE_MARGIN, y + photoHeight - 10), pixmap=photo)
+    return doc
+
+def extractImageBlocks(doc : fitz.Document, withPayload : bool) -> list:
+    """
+    Extracts image blocks of all pages page by page (dictionary of previous page is released), the same way as Checker.
+
+    Args:
+        doc (fitz.Document): Document.
+        withPayload (bool): True -> original extraction, "dict" of TextPage with images (binary data of images are copied),
+            False -> "dict" of TextPage with text only and metadata of images from get_image_info (only on pages that can contain images).
+
+    Returns:
+        list: Bounding boxes of image blocks of every page.
+    """
+    bboxes = []
+    for page in doc:
+        if withPayload:
+            textPage = page.get_textpage(flags=(fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_PRESERVE_IMAGES))
+            blocks = page.get_text("dict", textpage=textPage)['blocks']
+        else:
+            textPage = page.get_textpage(flags=fitz.TEXTFLAGS_BLOCKS)
+            blocks = page.get_text("dict", textpage=textPage)['blocks']
+            if page.get_images(full=True) or doc.get_page_xobjects(page.number) or content_stream.mayContainInlineImage(page.read_contents()):
+                blocks += [dict(info, type=1) for info in page.get_image_info()]
+        bboxes.append(sorted(tuple(block['bbox']) for block in blocks if block['type'] == 1))
+    return bboxes
+
+def measurePeakMemory(function):
+    """
+    Runs function once and measures peak memory allocated by Python during the run (binary data of images extracted to Python included).
+
+    Args:
+        function: Function without arguments that is measured.
+
+    Returns:
+        tuple: (time in seconds, peak memory in bytes, result of the run)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (elapsed, peak, result)
+
+def measure(function, repeat : int):
+    """
+    Runs function repeatedly and measures the best time of one run.
+
+    Args:
+        function: Function without arguments that is measured.
+        repeat (int): Number of runs.
+
+    Returns:
+        tuple: (best time in seconds, result of the last run)
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return (best, result)
+
+def createFindings(count : int) -> tuple:
+    """
+    Creates synthetic findings of one A4 page: bracket-like highlights on consecutive text lines (pairs of them touch each other),
+    overflow lines of consecutive text lines at the right border and arrows pointing to borders.
+
+    Args:
+        count (int): Count of highlights.
+
+    Returns:
+        tuple: (highlights, lineRects, arrows), highlights and lineRects are lists of rectangles, arrows are tuples (xPointing, x, y).
+    """
+    highlights = []
+    for i in range(count):
+        x = PAGE_MARGIN + (i // 2 % 20) * 20 + (i % 2) * 6
+        y = PAGE_MARGIN + (i // 40) * 14
+        highlights.append(fitz.Rect(x, y, x + 6, y + 12))
+    lineRects = [fitz.Rect(500, PAGE_MARGIN + i * 14, 530, PAGE_MARGIN + i * 14 + 12) for i in range(count // 4)]
+    arrows = [(PAGE_MARGIN, PAGE_MARGIN + 10, PAGE_MARGIN + i * 30) for i in range(count // 10)]
+    return (highlights, lineRects, arrows)
+
+def writeFindingsImmediately(page : fitz.Page, highlights : list, lineRects : list, arrows : list) -> int:
+    """
+    Writes findings the original way, every finding is written (and its appearance stream created) immediately, arrow consists of three lines.
+
+    Args:
+        page (fitz.Page): Annotated page.
+        highlights (list): Highlighted rectangles.
+        lineRects (list): Rectangles marked by vertical line at the right border.
+        arrows (list): Arrows (xPointing, x, y).
+
+    Returns:
+        int: Count of created annotations.
+    """
+    count = 0
+    for rect in highlights:
+        annot = page.add_highlight_annot(rect)
+        annot.set_colors(stroke=ANNOTATION_COLOR)
+        annot.update()
+        count += 1
+    for rect in lineRects:
+        annot = page.add_line_annot(fitz.Point(530, rect[1] - 20), fitz.Point(530, rect[3] + 20))
+        annot.set_border(width=1)
+        annot.set_colors(stroke=ANNOTATION_COLOR)
+        annot.update()
+        count += 1
+    for xPointing, x, y in arrows:
+        for end in [(x, y), (xPointing + 5, y - 2), (xPointing + 5, y + 2)]:
+            annot = page.add_line_annot(fitz.Point(xPointing, y), fitz.Point(end))
+            annot.set_border(width=1)
+            annot.set_colors(stroke=ANNOTATION_COLOR)
+            annot.update()
+            count += 1
+    return count
+
+def writeFindingsBatched(page : fitz.Page, highlights : list, lineRects : list, arrows : list) -> int:
+    """
+    Writes findings by annotation_batch.AnnotationBatch (merged, one batch per page).
+
+    Args:
+        page (fitz.Page): Annotated page.
+        highlights (list): Highlighted rectangles.
+        lineRects (list): Rectangles marked by vertical line at the right border.
+        arrows (list): Arrows (xPointing, x, y).
+
+    Returns:
+        int: Count of created annotations.
+    """
+    batch = annotation_batch.AnnotationBatch()
+    for rect in highlights:
+        batch.addHighlight(rect, ANNOTATION_COLOR)
+    batch.addLines(530, lineRects, ANNOTATION_COLOR)
+    for xPointing, x, y in arrows:
+        batch.addArrow(xPointing, x, y, ANNOTATION_COLOR)
+    return batch.write(page)
+
+def writeToNewPage(write, findings : tuple) -> int:
+    """
+    Writes findings to a new A4 page.
+
+    Args:
+        write: Function writing findings (writeFindingsImmediately or writeFindingsBatched).
+        findings (tuple): Findings created by createFindings.
+
+    Returns:
+        int: Count of created annotations.
+    """
+    with fitz.open() as doc:
+        return write(doc.new_page(width=PAGE_SIZES["A4"][0], height=PAGE_SIZES["A4"][1]), *findings)
+
+def findOverflows(file : str, engine : OverflowEngine, checker : Checker = None):
+    """
+    Runs only the overflow check on a file with the specified engine.
+
+    Args:
+        file (str): Path to the checked PDF.
+        engine (OverflowEngine): Engine used to find overflow.
+        checker (Checker, optional): Checker used for the check, so that its gathered information can be read afterwards. Defaults to new Checker of file.
+
+    Returns:
+        tuple: (time of the check in seconds, dictionary {page number: list of highlighted rectangles})
+    """
+    checker = checker or Checker(file) # pages are sampled deterministically -> same border for every engine
+    with tempfile.TemporaryDirectory() as tmpDir:
+        annotatedPath = os.path.join(tmpDir, "annotated.pdf")
+        start = time.perf_counter()
+        checker.annotate(annotatedPath, borderCheck=True, hyphenCheck=False, imageWidthCheck=False, TOCCheck=False, spaceBracketCheck=False,
+                         emptySectionCheck=False, badReferenceCheck=False, gatherChaptersInfo=False, overflowEngine=engine)
+        elapsed = time.perf_counter() - start
+
+        overflows = {}
+        with fitz.Document(annotatedPath) as doc:
+            for page in doc:
+                rects = [annot.rect for annot in page.annots(types=[fitz.PDF_ANNOT_HIGHLIGHT])]
+                if rects:
+                    overflows[page.number+1] = rects
+    return (elapsed, overflows)
+
+def annotateAll(file : str, workers : int = 1):
+    """
+    Runs all checks on a file with the specified count of worker processes.
+
+    Args:
+        file (str): Path to the checked PDF.
+        workers (int, optional): Count of worker processes. Defaults to 1.
+
+    Returns:
+        tuple: (time of the check in seconds, comparable result of the check -> found mistakes, information about chapters and annotations)
+    """
+    checker = Checker(file, seed=0) # same sampled pages -> same general information for every run
+    with tempfile.TemporaryDirectory() as tmpDir:
+        annotatedPath = os.path.join(tmpDir, "annotated.pdf")
+        start = time.perf_counter()
+        checker.annotate(annotatedPath, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        with fitz.Document(annotatedPath) as doc:
+            annotations = [(page.number, annot.type[0], tuple(annot.rect)) for page in doc for annot in page.annots()]
+
+    chapters = [checker.chaptersInfo[0]] + checker.chaptersInfo[1] + [checker.chaptersInfo[2]]
+    chaptersInfo = [(chapter.title, chapter.pages.toDict(), vars(chapter.textInfo), chapter.pictures) for chapter in chapters]
+    return (elapsed, (checker.mistakes_found, checker.typographyMistakes.toDict(), chaptersInfo, annotations))
+
+def rectRelativePositionToleranceFloat(rectA, rectB):
+    """
+    Original implementation of relative position of two rectangles, that wraps coordinates in ToleranceFloat.
+
+    Returns:
+        int: -1 -> rectA before rectB, 0 -> rectA inside rectB, 1 -> rectA after rectB
+    """
+    rectA = [ToleranceFloat(rectA[0]), ToleranceFloat(rectA[1]), ToleranceFloat(rectA[2]), ToleranceFloat(rectA[3])]
+    rectB = [ToleranceFloat(rectB[0]), ToleranceFloat(rectB[1]), ToleranceFloat(rectB[2]), ToleranceFloat(rectB[3])]
+
+    if rectA[0]>=rectB[0] and rectA[1]>=rectB[1] and rectA[2]<=rectB[2] and rectA[3]<=rectB[3]:
+        return 0
+    elif rectA[1]<rectB[1]:
+        return -1
+    elif rectA[1]==rectB[1] and rectA[0]<rectB[0]:
+        return -1
+    else:
+        return 1
+
+def createPosterRects(count : int, generator : random.Random):
+    """
+    Creates bounding boxes of embedded PDF figures laid out in a grid on A0 poster page and rectangles tested for containment.
+    Half of tested rectangles lies inside figures (some of them touch figure border), the rest lies anywhere on the page.
+
+    Args:
+        count (int): Count of figures.
+        generator (random.Random): Random generator.
+
+    Returns:
+        tuple[list, list]: Bounding boxes of figures and tested rectangles.
+    """
+    width, height = fitz.paper_size("a0")
+    columns = max(1, round(count ** 0.5))
+    rows = -(-count // columns)
+    cellWidth = (width - 2*PAGE_MARGIN) / columns
+    cellHeight = (height - 2*PAGE_MARGIN) / rows
+    figures = []
+    for i in range(count):
+        x0 = PAGE_MARGIN + (i % columns) * cellWidth
+        y0 = PAGE_MARGIN + (i // columns) * cellHeight
+        figures.append(fitz.Rect(x0 + 5, y0 + 5, x0 + cellWidth - 5, y0 + cellHeight - 5))
+
+    queries = []
+    for i in range(CONTAINMENT_QUERIES):
+        if i % 2 == 0:
+            figure = generator.choice(figures)
+            x = generator.uniform(figure.x0, figure.x1 - 20)
+            y = generator.uniform(figure.y0, figure.y1 - 10)
+            rect = fitz.Rect(x, y, min(x + generator.uniform(5, 40), figure.x1), min(y + 10, figure.y1))
+            if i % 10 == 0:
+                rect.x0 = figure.x0 + 1e-9 # touches border within tolerance
+        else:
+            x = generator.uniform(0, width - 40)
+            y = generator.uniform(0, height - 10)
+            rect = fitz.Rect(x, y, x + generator.uniform(5, 40), y + 10)
+        queries.append(rect)
+    return (figures, queries)
+
+def createTikzContent(pathCount : int, inline : bool, generator : random.Random) -> bytes:
+    """
+    Creates TikZ-like content stream: many short paths in nested graphics states and an embedded PDF figure (/Fm0) invoked after every hundred paths.
+
+    Args:
+        pathCount (int): Count of drawn paths.
+        inline (bool): Whether every path (and every other figure) is written on one line, otherwise every operator is on its own line.
+        generator (random.Random): Random generator.
+
+    Returns:
+        bytes: Content stream.
+    """
+    lines = []
+    for i in range(pathCount):
+        x = generator.uniform(0, 500)
+        y = generator.uniform(0, 700)
+        path = ["q", "1 0 0 1 {:.3f} {:.3f} cm".format(x, y), "0.4 w", "0 0 m", "{:.3f} {:.3f} l".format(generator.uniform(1, 50), generator.uniform(1, 50)), "S", "Q"]
+        lines.extend([" ".join(path)] if inline else path)
+        if i % 100 == 99:
+            figure = ["q", "0.5 0 0 0.5 {:.3f} {:.3f} cm".format(x, y), "/Fm0 Do", "Q"]
+            lines.extend([" ".join(figure)] if inline and i % 200 == 199 else figure)
+    return "\n".join(lines).encode()
+
+def findPlacementsLineBased(content : bytes, name : str) -> list:
+    """
+    Original detection of embedded PDF placements, content stream is split to lines and only operators at the end of a line are recognized.
+    Unlike the original, unbalanced Q (for example "q ... Q" on one line) is ignored instead of raising an exception.
+
+    Returns:
+        list: Transformation matrices (a, b, c, d, e, f) of found placements.
+    """
+    import numpy
+    placements = []
+    CTMStack = []
+    CTM = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    for cmd in str(content, 'utf-8').splitlines():
+        if cmd[-1:] == 'q':
+            CTMStack.append(CTM)
+        elif cmd[-1:] == 'Q':
+            if CTMStack:
+                CTM = CTMStack.pop()
+        elif cmd[-2:] == 'cm':
+            matrix = cmd.split(' ')
+            cm = [[float(matrix[0]), float(matrix[1]), 0.0], [float(matrix[2]), float(matrix[3]), 0.0], [float(matrix[4]), float(matrix[5]), 1.0]]
+            CTM = numpy.matmul(cm, CTM)
+        elif cmd[-2:] == 'Do' and cmd == "/" + name + " Do":
+            placements.append((CTM[0][0], CTM[0][1], CTM[1][0], CTM[1][1], CTM[2][0], CTM[2][1]))
+    return placements
+
+def findPlacementsStreaming(content : bytes, name : str) -> list:
+    """
+    Detection of embedded PDF placements with streaming tokenizer (content_stream.iterOperators) and affine tuples, same as Checker.
+
+    Returns:
+        list: Transformation matrices (a, b, c, d, e, f) of found placements.
+    """
+    placements = []
+    CTMStack = []
+    CTM = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    for operator, operands in content_stream.iterOperators(content, {'q', 'Q', 'cm', 'Do'}):
+        if operator == 'q':
+            CTMStack.append(CTM)
+        elif operator == 'Q':
+            if CTMStack:
+                CTM = CTMStack.pop()
+        elif operator == 'cm':
+            CTM = content_stream.multiplyMatrices(operands, CTM)
+        elif operator == 'Do' and operands and operands[-1] == name:
+            placements.append(CTM)
+    return placements
+
+# ---------------------------------------------- BENCHMARKS --------------------------------------------------
+
+def benchmarkOverflow(args):
+    """
+    Compares pixel by pixel overflow scan with NumPy overflow scan on synthetic pages of different sizes.
+    """
+    doc = fitz.Document()
+    print("page  pixmap        pixelwise [ms]  numpy [ms]  speedup  same result")
+    for name, (width, height) in PAGE_SIZES.items():
+        page = createSyntheticPage(doc, width, height)
+        pixmap = page.get_pixmap()
+        lBorder = PAGE_MARGIN - 1
+        rBorder = round(width - PAGE_MARGIN)
+
+        def scanPixelwise():
+            return (overflow_scan.getLeftOverflowRectsPixelwise(pixmap, lBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE),
+                    overflow_scan.getRightOverflowRectsPixelwise(pixmap, rBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE))
+
+        def scanNumpy():
+            return (overflow_scan.getLeftOverflowRects(pixmap, lBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE),
+                    overflow_scan.getRightOverflowRects(pixmap, rBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE))
+
+        pixelTime, pixelRects = measure(scanPixelwise, args.repeat)
+        numpyTime, numpyRects = measure(scanNumpy, args.repeat)
+        print("{:<5} {:<13} {:>14.2f}  {:>10.2f}  {:>6.1f}x  {}".format(
+            name, str(pixmap.width) + "x" + str(pixmap.height), pixelTime*1000, numpyTime*1000, pixelTime/numpyTime, pixelRects == numpyRects))
+    doc.close()
+
+def benchmarkMarginClip(args):
+    """
+    Compares rendering of the whole page with rendering of both margins only (followed by NumPy overflow scan) on synthetic image-heavy pages.
+    """
+    doc = fitz.Document()
+    print("page  full page [ms]  margins [ms]  speedup  full page [kB]  margins [kB]  same result")
+    for name, (width, height) in PAGE_SIZES.items():
+        page = createSyntheticPage(doc, width, height)
+        addColumnImage(page)
+        lBorder = PAGE_MARGIN - 1
+        rBorder = round(width - PAGE_MARGIN)
+        pageRect = page.rect.irect
+
+        def scanFullPage():
+            pixmap = page.get_pixmap()
+            rects = (overflow_scan.getLeftOverflowRects(pixmap, lBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE),
+                     overflow_scan.getRightOverflowRects(pixmap, rBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE))
+            return (rects, len(pixmap.samples_mv))
+
+        def scanMargins():
+            left = page.get_pixmap(clip=fitz.IRect(pageRect.x0, pageRect.y0, lBorder, pageRect.y1))
+            right = page.get_pixmap(clip=fitz.IRect(rBorder+1, pageRect.y0, pageRect.x1, pageRect.y1))
+            rects = (overflow_scan.getLeftOverflowRects(left, lBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE),
+                     overflow_scan.getRightOverflowRects(right, rBorder, Checker.HIGHLIGHT_PADDING, Checker.WHITE))
+            return (rects, len(left.samples_mv) + len(right.samples_mv))
+
+        fullTime, (fullRects, fullBytes) = measure(scanFullPage, args.repeat)
+        marginTime, (marginRects, marginBytes) = measure(scanMargins, args.repeat)
+        print("{:<5} {:>14.2f}  {:>12.2f}  {:>6.1f}x  {:>14.0f}  {:>12.0f}  {}".format(
+            name, fullTime*1000, marginTime*1000, fullTime/marginTime, fullBytes/1024, marginBytes/1024, fullRects == marginRects))
+    doc.close()
+
+def benchmarkGeometry(args):
+    """
+    Compares geometry-based overflow engine with raster engine (margins only) on given files and reports where their results differ.
+    """
+    print("file                            raster [s]  geometry [s]  pages raster  pages geometry  pages both  rects matched")
+    for file in args.in_files:
+        rasterTime, rasterOverflows = findOverflows(file, OverflowEngine.MARGIN_CLIP)
+        geometryTime, geometryOverflows = findOverflows(file, OverflowEngine.GEOMETRY)
+
+        bothPages = set(rasterOverflows) & set(geometryOverflows)
+        rasterRects = sum(len(rects) for rects in rasterOverflows.values())
+        matchedRects = 0
+        for page, rects in rasterOverflows.items():
+            for rect in rects:
+                if any(rect.intersects(other) for other in geometryOverflows.get(page, [])):
+                    matchedRects += 1
+
+        print("{:<30}  {:>10.2f}  {:>12.2f}  {:>12}  {:>14}  {:>10}  {:>13}".format(
+            os.path.basename(file)[-30:], rasterTime, geometryTime, len(rasterOverflows), len(geometryOverflows), len(bothPages), str(matchedRects) + "/" + str(rasterRects)))
+        onlyRaster = sorted(set(rasterOverflows) - bothPages)
+        onlyGeometry = sorted(set(geometryOverflows) - bothPages)
+        if onlyRaster:
+            print("    overflow found only by raster engine on pages:", onlyRaster)
+        if onlyGeometry:
+            print("    overflow found only by geometry engine on pages:", onlyGeometry)
+
+def benchmarkAdaptive(args):
+    """
+    Compares full resolution RGB rendering of margins with adaptive two pass grayscale rendering on given files.
+    Reports time of the check and pixmap memory in comparison with rendering of whole RGB pages (OverflowEngine.NUMPY, measured on the same files).
+    """
+    print("file                            margins [s]  adaptive [s]  speedup  full pages [s]  saved [s]  rendered [kB]  full pages [kB]  saved  pages same")
+    for file in args.in_files:
+        marginTime, marginOverflows = findOverflows(file, OverflowEngine.MARGIN_CLIP)
+        fullPageTime, fullPageOverflows = findOverflows(file, OverflowEngine.NUMPY)
+        checker = Checker(file)
+        adaptiveTime, adaptiveOverflows = findOverflows(file, OverflowEngine.ADAPTIVE, checker)
+
+        renderedBytes = sum(info["renderedBytes"] for info in checker.overflowScanInfo)
+        fullPageBytes = sum(info["fullPageBytes"] for info in checker.overflowScanInfo)
+        print("{:<30}  {:>11.2f}  {:>12.2f}  {:>6.1f}x  {:>14.2f}  {:>9.2f}  {:>13.0f}  {:>15.0f}  {:>4.0f}%  {}".format(
+            os.path.basename(file)[-30:], marginTime, adaptiveTime, marginTime/adaptiveTime, fullPageTime, fullPageTime - adaptiveTime, renderedBytes/1024, fullPageBytes/1024,
+            100 * (1 - renderedBytes/fullPageBytes) if fullPageBytes else 0, sorted(marginOverflows) == sorted(adaptiveOverflows) == sorted(fullPageOverflows)))
+
+def benchmarkParallel(args):
+    """
+    Measures scaling of annotating (all checks) over counts of worker processes on given files.
+    Results of every run are compared with sequential annotating.
+    """
+    print("file                            workers  time [s]  speedup  same result")
+    for file in args.in_files:
+        sequentialTime, sequentialResult = annotateAll(file, 1)
+        print("{:<30}  {:>7}  {:>8.2f}  {:>6.1f}x  {}".format(os.path.basename(file)[-30:], 1, sequentialTime, 1.0, True))
+        for workers in args.workers:
+            if workers == 1:
+                continue
+            parallelTime, parallelResult = annotateAll(file, workers)
+            print("{:<30}  {:>7}  {:>8.2f}  {:>6.1f}x  {}".format("", workers, parallelTime, sequentialTime/parallelTime, parallelResult == sequentialResult))
+
+def benchmarkStress(args):
+    """
+    Runs many Checkers concurrently in threads of one process and compares their results with serial runs.
+    """
+    serialResults = {}
+    start = time.perf_counter()
+    for file in args.in_files:
+        serialResults[file] = annotateAll(file)[1]
+    serialTime = time.perf_counter() - start
+
+    jobs = [file for file in args.in_files for _ in range(args.runs)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        results = list(executor.map(lambda file: annotateAll(file)[1], jobs))
+    threadedTime = time.perf_counter() - start
+
+    mismatches = [file for file, result in zip(jobs, results) if result != serialResults[file]]
+    print("serial runs: {}  time [s]: {:.2f}".format(len(args.in_files), serialTime))
+    print("threaded runs: {}  threads: {}  time [s]: {:.2f}".format(len(jobs), args.threads, threadedTime))
+    print("runs with result different from serial run: {}".format(len(mismatches)))
+    for file in sorted(set(mismatches)):
+        print("    " + file)
+    if mismatches:
+        sys.exit(1)
+
+def benchmarkExtraction(args):
+    """
+    Counts text extractions during annotating (all checks) on given files. Every created TextPage means one parsing of the page,
+    every call of TextPage method means one pass over already parsed text.
+    """
+    counts = {"textPages" : 0, "textPageCalls" : 0}
+
+    def counted(function, counter):
+        def wrapper(*args, **kwargs):
+            counts[counter] += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    fitz.Page.get_textpage = counted(fitz.Page.get_textpage, "textPages")
+    for method in ["extractDICT", "extractRAWDICT", "extractBLOCKS", "extractWORDS", "extractText", "extractTEXT", "search"]:
+        if hasattr(fitz.TextPage, method):
+            setattr(fitz.TextPage, method, counted(getattr(fitz.TextPage, method), "textPageCalls"))
+
+    print("file                            pages  TextPages / page  TextPage calls / page")
+    for file in args.in_files:
+        counts["textPages"] = counts["textPageCalls"] = 0
+        with fitz.Document(file) as doc:
+            pageCount = len(doc)
+        annotateAll(file)
+        print("{:<30}  {:>5}  {:>16.2f}  {:>21.2f}".format(
+            os.path.basename(file)[-30:], pageCount, counts["textPages"]/pageCount, counts["textPageCalls"]/pageCount))
+
+def benchmarkContainment(args):
+    """
+    Compares containment tests of rectangles in embedded PDFs: original loop with ToleranceFloat, loop with plain floats and spatial index (RectIndex).
+    """
+    generator = random.Random(0)
+    print("figures  tolerance float [ms]  plain floats [ms]  index [ms]  speedup  same result")
+    for count in EMBEDDED_PDF_COUNTS:
+        figures, queries = createPosterRects(count, generator)
+
+        def containsToleranceFloat():
+            return [any(rectRelativePositionToleranceFloat(rect, figure) == 0 for figure in figures) for rect in queries]
+
+        def containsPlainFloats():
+            return [any(rect_index.rectRelativePosition(rect, figure) == 0 for figure in figures) for rect in queries]
+
+        def containsIndex():
+            index = rect_index.RectIndex(figures) # building of index is measured too, it is built once per page
+            return [index.containsRect(rect) for rect in queries]
+
+        toleranceTime, toleranceResult = measure(containsToleranceFloat, args.repeat)
+        plainTime, plainResult = measure(containsPlainFloats, args.repeat)
+        indexTime, indexResult = measure(containsIndex, args.repeat)
+        print("{:>7}  {:>20.2f}  {:>17.2f}  {:>10.2f}  {:>6.0f}x  {}".format(
+            count, toleranceTime*1000, plainTime*1000, indexTime*1000, toleranceTime/indexTime, toleranceResult == plainResult == indexResult))
+
+def benchmarkContentStream(args):
+    """
+    Compares the original line-based detection of embedded PDF placements with the streaming tokenizer on synthetic TikZ-like content streams.
+    """
+    generator = random.Random(0)
+    print("layout              paths  size [MB]  line-based [ms]  streaming [ms]  found line-based  found streaming  same placements")
+    for inline in [False, True]:
+        for pathCount in CONTENT_STREAM_PATHS:
+            content = createTikzContent(pathCount, inline, generator)
+            lineTime, lineResult = measure(lambda: findPlacementsLineBased(content, "Fm0"), args.repeat)
+            streamTime, streamResult = measure(lambda: findPlacementsStreaming(content, "Fm0"), args.repeat)
+            same = len(lineResult) == len(streamResult) and all(
+                rect_index.isClose(valueA, valueB) for placementA, placementB in zip(lineResult, streamResult) for valueA, valueB in zip(placementA, placementB))
+            print("{:<18}  {:>5}  {:>9.2f}  {:>15.2f}  {:>14.2f}  {:>16}  {:>15}  {}".format(
+                "operators per line" if inline else "operator per line", pathCount, len(content)/1e6,
+                lineTime*1000, streamTime*1000, len(lineResult), len(streamResult), same))
+
+def benchmarkImages(args):
+    """
+    Compares extraction of page dictionaries with binary data of images and with metadata of images only on given files
+    (synthetic image-heavy document, if no file is given). Reports time and peak memory allocated by Python.
+    """
+    docs = [(os.path.basename(file), fitz.Document(file)) for file in args.in_files] or [("synthetic ({} photos)".format(IMAGE_PAGE_COUNT * IMAGES_PER_PAGE), createImageDocument())]
+    print("file                            with images [s]  metadata [s]  with images peak [MB]  metadata peak [MB]  same images")
+    for name, doc in docs:
+        payloadTime, payloadPeak, payloadResult = measurePeakMemory(lambda: extractImageBlocks(doc, True))
+        metadataTime, metadataPeak, metadataResult = measurePeakMemory(lambda: extractImageBlocks(doc, False))
+        print("{:<30}  {:>15.2f}  {:>12.2f}  {:>21.1f}  {:>18.1f}  {}".format(
+            name[-30:], payloadTime, metadataTime, payloadPeak/1e6, metadataPeak/1e6, payloadResult == metadataResult))
+
+def benchmarkSampling(args):
+    """
+    Runs sampling of general information of the document (borders and regular font) with different seeds of the page sampler on given files.
+    Reports counts of sampled pages and how many seeds give the same pages with border mistakes as the default seed.
+    """
+    print("file                            pages  sampled pages (min/avg/max)  time [s]  border mistakes (default seed)  same result")
+    for file in args.in_files:
+        sampledCounts = []
+        borderMistakes = []
+        start = time.perf_counter()
+        for seed in SAMPLING_SEEDS:
+            checker = Checker(file, seed=seed)
+            with tempfile.TemporaryDirectory() as tmpDir:
+                checker.annotate(os.path.join(tmpDir, "annotated.pdf"), borderCheck=True, hyphenCheck=False, imageWidthCheck=False, TOCCheck=False,
+                                 spaceBracketCheck=False, emptySectionCheck=False, badReferenceCheck=False, gatherChaptersInfo=False)
+            sampledCounts.append(len(checker.sampledPages))
+            borderMistakes.append(checker.typographyMistakes.toDict()["borderMistakesPages"])
+        elapsed = (time.perf_counter() - start) / len(SAMPLING_SEEDS)
+
+        with fitz.Document(file) as doc:
+            pageCount = len(doc)
+        print("{:<30}  {:>5}  {:>9} / {:>5.1f} / {:>5}  {:>8.2f}  {:>30}  {:>8}/{}".format(
+            os.path.basename(file)[-30:], pageCount, min(sampledCounts), sum(sampledCounts)/len(sampledCounts), max(sampledCounts), elapsed,
+            len(borderMistakes[0]), borderMistakes.count(borderMistakes[0]), len(borderMistakes)))
+
+def benchmarkPageCache(args):
+    """
+    Runs all checks on given files with different memory budgets of cache of extracted pages.
+    Reports time of annotating, counters of the cache and count of created TextPages (parsings of pages).
+    """
+    textPages = [0]
+    getTextPage = fitz.Page.get_textpage
+    def countedGetTextPage(*args, **kwargs):
+        textPages[0] += 1
+        return getTextPage(*args, **kwargs)
+    fitz.Page.get_textpage = countedGetTextPage
+
+    print("file                            budget [MB]  time [s]  hits  misses  evictions  cached [MB]  TextPages")
+    for file in args.in_files:
+        for budget in PAGE_CACHE_BUDGETS:
+            textPages[0] = 0
+            checker = Checker(file)
+            with tempfile.TemporaryDirectory() as tmpDir:
+                start = time.perf_counter()
+                checker.annotate(os.path.join(tmpDir, "annotated.pdf"), pageCacheBudget=budget)
+                elapsed = time.perf_counter() - start
+            info = checker.pageCacheInfo
+            print("{:<30}  {:>11.1f}  {:>8.2f}  {:>4}  {:>6}  {:>9}  {:>11.1f}  {:>9}".format(
+                os.path.basename(file)[-30:] if budget == PAGE_CACHE_BUDGETS[0] else "", budget/1024/1024, elapsed,
+                info["hits"], info["misses"], info["evictions"], info["size"]/1024/1024, textPages[0]))
+
+def benchmarkAnnotations(args):
+    """
+    Compares writing of every finding immediately with batched writing of findings of a page.
+    Synthetic A4 pages with different counts of findings are used, if no files are given.
+    Otherwise all checks are run on given files and information about batched writing of their annotations is reported.
+    """
+    if args.in_files:
+        print("file                            annotated pages  findings  annotations  writing [s]  annotating [s]")
+        for file in args.in_files:
+            checker = Checker(file)
+            with tempfile.TemporaryDirectory() as tmpDir:
+                start = time.perf_counter()
+                checker.annotate(os.path.join(tmpDir, "annotated.pdf"))
+                elapsed = time.perf_counter() - start
+            info = checker.annotationInfo
+            print("{:<30}  {:>15}  {:>8}  {:>11}  {:>11.2f}  {:>14.2f}".format(os.path.basename(file)[-30:], len(info),
+                sum(page["findings"] for page in info), sum(page["annotations"] for page in info), sum(page["time"] for page in info), elapsed))
+        return
+
+    print("findings  immediate [ms]  batched [ms]  speedup  annotations immediate  annotations batched")
+    for count in ANNOTATION_FINDINGS:
+        findings = createFindings(count)
+        results = {}
+        for name, write in [("immediate", writeFindingsImmediately), ("batched", writeFindingsBatched)]:
+            results[name] = measure(lambda: writeToNewPage(write, findings), args.repeat)
+        print("{:>8}  {:>14.1f}  {:>12.1f}  {:>6.1f}x  {:>21}  {:>19}".format(len(findings[0]) + len(findings[1]) + len(findings[2]),
+            results["immediate"][0]*1000, results["batched"][0]*1000, results["immediate"][0]/results["batched"][0], results["immediate"][1], results["batched"][1]))
+
+def benchmarkOutput(args):
+    """
+    Runs all checks on given files and saves annotated document in every output mode (to file) and to bytes buffer.
+    Reports size of annotated document and time of saving.
+    """
+    print("file                            input [kB]  output mode  target  output [kB]  saving [s]  copying [s]")
+    for file in args.in_files:
+        first = True
+        for outputMode, target in [(mode, "file") for mode in OutputMode] + [(OutputMode.FULL, "bytes"), (OutputMode.COMPRESSED, "bytes")]:
+            checker = Checker(file)
+            with tempfile.TemporaryDirectory() as tmpDir:
+                checker.annotate(os.path.join(tmpDir, "annotated.pdf") if target == "file" else io.BytesIO(), outputMode=outputMode)
+            info = checker.outputInfo
+            print("{:<30}  {:>10}  {:>11}  {:>6}  {:>11.0f}  {:>10.3f}  {:>11}".format(
+                os.path.basename(file)[-30:] if first else "", "{:.0f}".format(os.path.getsize(file)/1024) if first else "", info["mode"].lower(), target,
+                info["size"]/1024, info["time"], "{:.3f}".format(info["copyTime"]) if "copyTime" in info else "-"))
+            first = False
+
+def streamFindings(file : str, workers : int = 1) -> tuple:
+    """
+    Streams findings of all checks on a file by iterFindings without writing annotations.
+
+    Args:
+        file (str): Path to the checked PDF.
+        workers (int, optional): Count of worker processes. Defaults to 1.
+
+    Returns:
+        tuple: (time of the first page, time of the first page with findings or None, time of all pages in seconds, count of pages, count of findings)
+    """
+    checker = Checker(file, seed=0)
+    firstPage = firstFinding = None
+    pages = findings = 0
+    start = time.perf_counter()
+    for pageFindings in checker.iterFindings(workers=workers):
+        elapsed = time.perf_counter() - start
+        if firstPage == None:
+            firstPage = elapsed
+        if firstFinding == None and pageFindings['findings']:
+            firstFinding = elapsed
+        pages += 1
+        findings += len(pageFindings['findings'])
+    return (firstPage, firstFinding, time.perf_counter() - start, pages, findings)
+
+def benchmarkFindings(args):
+    """
+    Streams findings of given files page by page and compares latency of the first page and the first finding
+    with annotating (all checks, writing of annotations and saving), which gives results only after the whole document.
+    """
+    print("file                            workers  pages  findings  first page [s]  first finding [s]  stream [s]  annotate [s]")
+    for file in args.in_files:
+        for workers in args.workers:
+            firstPage, firstFinding, streamTime, pages, findings = streamFindings(file, workers)
+            annotateTime = annotateAll(file, workers)[0]
+            print("{:<30}  {:>7}  {:>5}  {:>8}  {:>14.3f}  {:>17}  {:>10.3f}  {:>12.3f}".format(os.path.basename(file)[-30:], workers, pages, findings,
+                firstPage, "{:.3f}".format(firstFinding) if firstFinding != None else "-", streamTime, annotateTime))
+
+def benchmarkChecks(args):
+    """
+    Streams findings of given files with every check enabled alone and with all checks enabled (without gathering of chapters information).
+    Reports time and artifacts required by enabled checks.
+    """
+    print("file                            checks             time [s]  findings  required artifacts")
+    for file in args.in_files:
+        first = True
+        for names in [[name] for name in CHECK_NAMES] + [CHECK_NAMES]:
+            def stream():
+                checker = Checker(file, seed=0)
+                findings = sum(len(pageFindings['findings'])
+                               for pageFindings in checker.iterFindings(gatherChaptersInfo=False, overflowEngine=OverflowEngine[args.engine],
+                                                                        **{name : name in names for name in CHECK_NAMES}))
+                return (findings, checker.requiredArtifacts)
+            elapsed, (findings, artifacts) = measure(stream, args.repeat)
+            print("{:<30}  {:<17}  {:>8.3f}  {:>8}  {}".format(os.path.basename(file)[-30:] if first else "", names[0] if len(names) == 1 else "all",
+                elapsed, findings, ", ".join(artifacts)))
+            first = False
+
+def benchmarkMemory(args):
+    """
+    Annotates given files (all checks) in streaming mode with given memory limits and without streaming mode.
+    Reports time, peak resident set size sampled during annotating, count of checked pages and flushes of annotations.
+    Runs with limits are done first, because resident set size of the process rarely decreases after a run.
+    """
+    print("file                            limit [MB]  time [s]  peak RSS [MB]  checked pages  flushes  partial")
+    for file in args.in_files:
+        first = True
+        for limit in sorted(args.limits, reverse=True) + [None]:
+            checker = Checker(file, seed=0)
+            with tempfile.TemporaryDirectory() as tmpDir:
+                start = time.perf_counter()
+                checker.annotate(os.path.join(tmpDir, "annotated.pdf"), memoryLimit=limit * 1024 * 1024 if limit != None else None)
+                elapsed = time.perf_counter() - start
+            info = checker.memoryInfo
+            print("{:<30}  {:>10}  {:>8.3f}  {:>13.1f}  {:>13}  {:>7}  {:>7}".format(os.path.basename(file)[-30:] if first else "", limit if limit != None else "-",
+                elapsed, info["peakRss"]/(1024*1024), "{}/{}".format(info["checkedPages"], info["pages"]), info["flushes"], "yes" if info["partial"] else "no"))
+            first = False
+
+def benchmarkWatchdog(args):
+    """
+    Annotates given files (all checks) without time budget of pages and with given time budgets of pages (supervised worker processes).
+    Reports time of annotating, the slowest page streamed without time budget and skipped pages.
+    """
+    print("file                            timeout [s]  time [s]  slowest page [s]  skipped pages")
+    for file in args.in_files:
+        first = True
+        for timeout in [None] + sorted(args.timeouts):
+            checker = Checker(file, seed=0)
+            slowest = 0
+            start = previous = time.perf_counter()
+            for _ in checker.iterFindings(overflowEngine=OverflowEngine[args.engine], pageTimeout=timeout):
+                now = time.perf_counter()
+                slowest = max(slowest, now - previous)
+                previous = now
+            elapsed = time.perf_counter() - start
+            skipped = checker.typographyMistakes.toDict()["skippedPages"]
+            print("{:<30}  {:>11}  {:>8.3f}  {:>16.3f}  {}".format(os.path.basename(file)[-30:] if first else "", timeout if timeout != None else "-",
+                elapsed, slowest, ", ".join("{} {}".format(page["page"], page["status"]) for page in skipped) if skipped else "-"))
+            first = False
+
+def benchmarkTiers(args):
+    """
+    Annotates given files (all checks) without tiers and in tiers.
+    Reports time of annotating and time when results of every tier were published (annotated document saved).
+    """
+    print("file                            mode      time [s]  tier  checks                                  published [s]  mistakes")
+    for file in args.in_files:
+        first = True
+        for tiered in [False, True]:
+            checker = Checker(file, seed=0)
+            with tempfile.TemporaryDirectory() as tmpDir:
+                start = time.perf_counter()
+                checker.annotate(os.path.join(tmpDir, "annotated.pdf"), overflowEngine=OverflowEngine[args.engine], tiered=tiered)
+                elapsed = time.perf_counter() - start
+            tiers = checker.tierInfo if tiered else [{"tier" : "-", "checks" : ["all"], "time" : elapsed, "mistakesCount" : checker.typographyMistakes.toDict()["totalMistakesCount"]}]
+            for index, tier in enumerate(tiers):
+                print("{:<30}  {:<8}  {:>8}  {:>4}  {:<38}  {:>13.3f}  {:>8}".format(os.path.basename(file)[-30:] if first else "",
+                    ("tiered" if tiered else "plain") if index == 0 else "", "{:.3f}".format(elapsed) if index == 0 else "",
+                    tier["tier"], ", ".join(tier["checks"])[:38], tier["time"], tier["mistakesCount"]))
+                first = False
+
+def benchmarkTriage(args):
+    """
+    Annotates given files (all checks) and reports result of triage of pages (type of the document and ranges of scanned and born-digital pages),
+    time of the triage, time of annotating, count of checks skipped on pages and estimated time saved by them.
+    """
+    print("file                            type          time [s]  triage [s]  skipped checks  saved [s]  ranges")
+    for file in args.in_files:
+        checker = Checker(file, seed=0)
+        with tempfile.TemporaryDirectory() as tmpDir:
+            start = time.perf_counter()
+            checker.annotate(os.path.join(tmpDir, "annotated.pdf"), overflowEngine=OverflowEngine[args.engine])
+            elapsed = time.perf_counter() - start
+        info = checker.triageInfo
+        if info == None:
+            continue
+        ranges = ", ".join("{}-{} {}{}".format(pageRange["first"], pageRange["last"], pageRange["type"], "" if pageRange["textLayer"] else " (no text layer)")
+                           for pageRange in info["ranges"])
+        print("{:<30}  {:<12}  {:>8.3f}  {:>10.3f}  {:>14}  {:>9.3f}  {}".format(os.path.basename(file)[-30:], info["documentType"], elapsed, info["time"],
+            sum(info["skippedChecks"].values()), info["timeSaved"], ranges))
+
+# ---------------------------------------------- MAIN --------------------------------------------------------
+
+def main():
+    """
+    Parses arguments and runs selected benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Measures performance of parts of Theses Checker.")
+    parser.add_argument('-r', '--repeat', type=int, default=3, help="number of runs of each measurement, best time is shown; default is 3")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+    subparsers.add_parser('overflow', help="compares pixel by pixel and NumPy overflow scan on pages of different sizes").set_defaults(function=benchmarkOverflow)
+    subparsers.add_parser('margin_clip', help="compares rendering of whole page and rendering of margins only on image-heavy pages of different sizes").set_defaults(function=benchmarkMarginClip)
+    geometryParser = subparsers.add_parser('geometry', help="consistency report of geometry-based and raster overflow engine on given files")
+    geometryParser.add_argument('in_files', nargs='+', help="path to PDF files used for comparison")
+    geometryParser.set_defaults(function=benchmarkGeometry)
+    adaptiveParser = subparsers.add_parser('adaptive', help="compares full resolution rendering of margins and adaptive grayscale rendering on given files")
+    adaptiveParser.add_argument('in_files', nargs='+', help="path to PDF files used for comparison")
+    adaptiveParser.set_defaults(function=benchmarkAdaptive)
+    parallelParser = subparsers.add_parser('parallel', help="scaling of annotating over counts of worker processes on given files")
+    parallelParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    parallelParser.add_argument('-w', '--workers', type=int, nargs='+', default=[2, 4, 8], help="measured counts of worker processes; default is 2 4 8")
+    parallelParser.set_defaults(function=benchmarkParallel)
+    stressParser = subparsers.add_parser('stress', help="runs many checkers concurrently in threads and compares their results with serial runs")
+    stressParser.add_argument('in_files', nargs='+', help="path to PDF files used for the test")
+    stressParser.add_argument('-t', '--threads', type=int, default=8, help="count of threads; default is 8")
+    stressParser.add_argument('-n', '--runs', type=int, default=4, help="count of concurrent runs of every file; default is 4")
+    stressParser.set_defaults(function=benchmarkStress)
+    extractionParser = subparsers.add_parser('extraction', help="counts text extractions per page during annotating of given files")
+    extractionParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    extractionParser.set_defaults(function=benchmarkExtraction)
+    subparsers.add_parser('containment', help="compares containment tests in embedded PDFs with ToleranceFloat, plain floats and spatial index on synthetic poster pages").set_defaults(function=benchmarkContainment)
+    imagesParser = subparsers.add_parser('images', help="compares extraction of page dictionaries with binary data of images and with metadata of images only")
+    imagesParser.add_argument('in_files', nargs='*', help="path to PDF files used for measurement; synthetic image-heavy document is used if not given")
+    imagesParser.set_defaults(function=benchmarkImages)
+    subparsers.add_parser('content_stream', help="compares line-based and streaming detection of embedded PDF placements on synthetic TikZ-like content streams").set_defaults(function=benchmarkContentStream)
+    samplingParser = subparsers.add_parser('sampling', help="counts of sampled pages and stability of found border over seeds of the page sampler on given files")
+    samplingParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    samplingParser.set_defaults(function=benchmarkSampling)
+    pageCacheParser = subparsers.add_parser('page_cache', help="compares annotating of given files with different memory budgets of cache of extracted pages")
+    pageCacheParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    pageCacheParser.set_defaults(function=benchmarkPageCache)
+    annotationsParser = subparsers.add_parser('annotations', help="compares immediate and batched writing of annotations on synthetic pages, or reports batched writing of annotations of given files")
+    annotationsParser.add_argument('in_files', nargs='*', help="path to PDF files used for measurement; synthetic pages are used if not given")
+    annotationsParser.set_defaults(function=benchmarkAnnotations)
+    outputParser = subparsers.add_parser('output', help="compares size and time of saving of annotated document in different output modes on given files")
+    outputParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    outputParser.set_defaults(function=benchmarkOutput)
+    findingsParser = subparsers.add_parser('findings', help="compares latency of streamed findings of pages with annotating of whole document on given files")
+    findingsParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    findingsParser.add_argument('-w', '--workers', type=int, nargs='+', default=[1], help="measured counts of worker processes; default is 1")
+    findingsParser.set_defaults(function=benchmarkFindings)
+    checksParser = subparsers.add_parser('checks', help="time and required artifacts of every check enabled alone on given files")
+    checksParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    checksParser.add_argument('-e', '--engine', choices=[engine.name for engine in OverflowEngine], default=OverflowEngine.MARGIN_CLIP.name, help="overflow engine of border check; default is MARGIN_CLIP")
+    checksParser.set_defaults(function=benchmarkChecks)
+    memoryParser = subparsers.add_parser('memory', help="compares peak memory of annotating of given files in streaming mode with memory limits and without it")
+    memoryParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    memoryParser.add_argument('-l', '--limits', type=int, nargs='+', default=[4096], help="memory limits in MB of streaming mode; default is 4096")
+    memoryParser.set_defaults(function=benchmarkMemory)
+    watchdogParser = subparsers.add_parser('watchdog', help="compares annotating of given files without and with time budgets of pages checked in supervised worker processes")
+    watchdogParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    watchdogParser.add_argument('-t', '--timeouts', type=float, nargs='+', default=[10.0], help="time budgets of one page in seconds; default is 10")
+    watchdogParser.add_argument('-e', '--engine', choices=[engine.name for engine in OverflowEngine], default=OverflowEngine.MARGIN_CLIP.name, help="overflow engine of border check; default is MARGIN_CLIP")
+    watchdogParser.set_defaults(function=benchmarkWatchdog)
+    tiersParser = subparsers.add_parser('tiers', help="compares annotating of given files without tiers and in tiers (text checks first, then checks rendering pages)")
+    tiersParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    tiersParser.add_argument('-e', '--engine', choices=[engine.name for engine in OverflowEngine], default=OverflowEngine.MARGIN_CLIP.name, help="overflow engine of border check; default is MARGIN_CLIP")
+    tiersParser.set_defaults(function=benchmarkTiers)
+    triageParser = subparsers.add_parser('triage', help="triage of pages of given files (scanned, born-digital or mixed) and time saved by checks skipped on scanned pages")
+    triageParser.add_argument('in_files', nargs='+', help="path to PDF files used for measurement")
+    triageParser.add_argument('-e', '--engine', choices=[engine.name for engine in OverflowEngine], default=OverflowEngine.MARGIN_CLIP.name, help="overflow engine of border check; default is MARGIN_CLIP")
+    triageParser.set_defaults(function=benchmarkTriage)
+    args = parser.parse_args(sys.argv[1:])
+
+    args.function(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,13 @@
 # Created By    : Michaela Macková
 # Login         : xmacko13
 # Created Date  : 31.1.2023
-# Last Updated  : 21.11.2024
+# Last Updated  : 18.10.2026
 # ---------------------------------------------------------------------------
 
 
 import sys
 import os
-from theses_checker_package.theses_checker import Checker
+from theses_checker_package.theses_checker import Checker, OutputMode
 import argparse
 
 
@@ -20,43 +20,91 @@ COLOR_WARNING = "\u001b[33;1m"
 NO_MISTAKES = " -> " + COLOR_OK + "no mistakes found" + COLOR_RESET
 MISTAKES_FOUND = " -> " + COLOR_WARNING + "mistakes were found" + COLOR_RESET
 
+
+def printTier(tierInfo : dict):
+    """
+    Prints information about finished tier of tiered annotating.
+
+    Args:
+        tierInfo (dict): Information about the tier (see Checker.tierInfo).
+    """
+    print("Tier " + str(tierInfo["tier"]) + " (" + ", ".join(tierInfo["checks"]) + ") finished after " + "{:.2f}".format(tierInfo["time"]) + " s, "
+          + str(tierInfo["mistakesCount"]) + " mistakes found so far.")
+
+
+def printTriage(triageInfo : dict):
+    """
+    Prints result of triage of pages, if the document is not born-digital.
+
+    Args:
+        triageInfo (dict): Result of the triage (see Checker.triageInfo), None if nothing was checked.
+    """
+    if triageInfo == None or triageInfo["scannedPages"] == 0:
+        return
+    print("Document is " + triageInfo["documentType"] + ", " + str(triageInfo["scannedPages"]) + " of " + str(triageInfo["pages"]) + " pages are scanned "
+          + "(" + str(triageInfo["pagesWithoutTextLayer"]) + " without text layer), checks skipped on them saved about " + "{:.2f}".format(triageInfo["timeSaved"]) + " s.")
+    for pageRange in triageInfo["ranges"]:
+        if pageRange["type"] != "born-digital":
+            print("  Pages " + str(pageRange["first"]) + "-" + str(pageRange["last"]) + " are scanned, "
+                  + ("only their text layer was checked." if pageRange["textLayer"] else "they have no text layer and were not checked."))
+
+
 # ---------------------------------------------- MAIN --------------------------------------------------------
 
-parser = argparse.ArgumentParser(description="Makes a new pdf file called '*_annotated.pdf' in the folder, where this program is saved. If no check flag is given, everything will be checked.") # TODO:
-parser.add_argument('in_files', nargs='+', help="path to files to be checked; only '*.pdf' are supported")
-parser.add_argument('--embedded_PDF', action='store_false', help="if used, embedded PDF files will be treated as part of the PDF; otherwise, they will be considered as images")
-parser.add_argument('-o', '--overflow', action='store_true', help="overflow check")
-parser.add_argument('-i', '--image_width', action='store_true', help="image width check")
-parser.add_argument('-H', '--Hyphen', action='store_true', help="hyphen check")
-parser.add_argument('-t', '--TOC', action='store_true', help="table of content section check")
-parser.add_argument('-s', '--space_bracket', action='store_true', help="space before left bracket check")
-parser.add_argument('-e', '--empty_chapter', action='store_true', help="text between titles check")
-parser.add_argument('-b', '--bad_reference', action='store_true', help=" '??' -> bad reference check")
-#parser.add_argument('--out_file', default="annotated.pdf", help="name of created annotated file, default name is 'annotated.pdf'; usable with only one IN_FILES otherwise ignored")
-args = parser.parse_args(sys.argv[1:])
-
-
-
-if(not (args.overflow or args.image_width or args.Hyphen or args.TOC or args.space_bracket or args.empty_chapter or args.bad_reference)):
-    args.overflow = True
-    args.image_width = True
-    args.Hyphen = True
-    args.TOC = True
-    args.space_bracket = True
-    args.empty_chapter = True
-    args.bad_reference = True
-
-for file in args.in_files:
-    if(not os.path.exists(file)):
-        print("File '" + file + "' does not exist.")
-        continue
-    if(file[-4:] != ".pdf"):
-        print("File '" + file + "' is not supported.")
-        continue
-    checker = Checker(file)
-    # if(len(args.in_files) > 1):
-    #     args.out_file = os.path.basename(file)[:-4] + "_annotated.pdf"
-    out_file = os.path.basename(file)[:-4] + "_annotated.pdf"
-    checker.annotate(out_file, args.embedded_PDF, args.overflow, args.Hyphen, args.image_width, args.TOC, args.space_bracket, args.empty_chapter, args.bad_reference)
-    mistake_state = MISTAKES_FOUND if checker.mistakes_found else NO_MISTAKES 
-    print("New file '" + out_file + "' was created." + mistake_state)
\ No newline at end of file
+def main():
+    """
+    Parses arguments and checks given PDF files, annotated files are created in the current folder.
+    """
+    parser = argparse.ArgumentParser(description="Makes a new pdf file called '*_annotated.pdf' in the folder, where this program is saved. If no check flag is given, everything will be checked.") # TODO:
+    parser.add_argument('in_files', nargs='+', help="path to files to be checked; only '*.pdf' are supported")
+    parser.add_argument('--embedded_PDF', action='store_false', help="if used, embedded PDF files will be treated as part of the PDF; otherwise, they will be considered as images")
+    parser.add_argument('-o', '--overflow', action='store_true', help="overflow check")
+    parser.add_argument('-i', '--image_width', action='store_true', help="image width check")
+    parser.add_argument('-H', '--Hyphen', action='store_true', help="hyphen check")
+    parser.add_argument('-t', '--TOC', action='store_true', help="table of content section check")
+    parser.add_argument('-s', '--space_bracket', action='store_true', help="space before left bracket check")
+    parser.add_argument('-e', '--empty_chapter', action='store_true', help="text between titles check")
+    parser.add_argument('-b', '--bad_reference', action='store_true', help=" '??' -> bad reference check")
+    parser.add_argument('-w', '--workers', type=int, default=1, help="count of processes checking pages in parallel; default is 1")
+    parser.add_argument('--output_mode', choices=[mode.name.lower() for mode in OutputMode], default=OutputMode.FULL.name.lower(), help="way the annotated file is saved: full rewrite, incremental (only annotations are appended to copy of the original) or compressed (garbage collection and compressed streams); default is full")
+    parser.add_argument('--page_cache', type=int, default=Checker.PAGE_CACHE_BUDGET // (1024 * 1024), help="memory budget of cache of extracted pages in MB; default is {}".format(Checker.PAGE_CACHE_BUDGET // (1024 * 1024)))
+    parser.add_argument('--memory_limit', type=int, default=None, help="maximum memory of the process in MB, pages are checked in streaming mode (workers, page cache and output mode are ignored) and if the limit would be exceeded, only already checked pages are annotated; default is no limit")
+    parser.add_argument('--page_timeout', type=float, default=None, help="maximum time of checking of one page in seconds, pages are checked in supervised worker processes (count given by --workers) and page exceeding the time is skipped; default is no limit")
+    parser.add_argument('--tiered', action='store_true', help="text checks are run on the whole file first and the annotated file is saved, then checks rendering pages (overflow, image width) are run")
+    #parser.add_argument('--out_file', default="annotated.pdf", help="name of created annotated file, default name is 'annotated.pdf'; usable with only one IN_FILES otherwise ignored")
+    args = parser.parse_args(sys.argv[1:])
+
+    if(not (args.overflow or args.image_width or args.Hyphen or args.TOC or args.space_bracket or args.empty_chapter or args.bad_reference)):
+        args.overflow = True
+        args.image_width = True
+        args.Hyphen = True
+        args.TOC = True
+        args.space_bracket = True
+        args.empty_chapter = True
+        args.bad_reference = True
+
+    for file in args.in_files:
+        if(not os.path.exists(file)):
+            print("File '" + file + "' does not exist.")
+            continue
+        if(file[-4:] != ".pdf"):
+            print("File '" + file + "' is not supported.")
+            continue
+        checker = Checker(file)
+        # if(len(args.in_files) > 1):
+        #     args.out_file = os.path.basename(file)[:-4] + "_annotated.pdf"
+        out_file = os.path.basename(file)[:-4] + "_annotated.pdf"
+        checker.annotate(out_file, args.embedded_PDF, args.overflow, args.Hyphen, args.image_width, args.TOC, args.space_bracket, args.empty_chapter, args.bad_reference, workers=args.workers, pageCacheBudget=args.page_cache * 1024 * 1024, outputMode=OutputMode[args.output_mode.upper()],
+                         memoryLimit=args.memory_limit * 1024 * 1024 if args.memory_limit != None else None, pageTimeout=args.page_timeout,
+                         tiered=args.tiered, tierCallback=printTier)
+        mistake_state = MISTAKES_FOUND if checker.mistakes_found else NO_MISTAKES 
+        print("New file '" + out_file + "' was created." + mistake_state)
+        if checker.memoryInfo["partial"]:
+            print("Memory limit reached, only the first " + str(checker.memoryInfo["checkedPages"]) + " of " + str(checker.memoryInfo["pages"]) + " pages were checked.")
+        for skipped in checker.typographyMistakes.toDict()["skippedPages"]:
+            print("Page " + str(skipped["page"]) + " was " + skipped["status"] + ".")
+        printTriage(checker.triageInfo)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
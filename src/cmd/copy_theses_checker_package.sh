@@ -3,4 +3,15 @@
 cp ../web/theses_checker/bl/theses_checker.py ./theses_checker_package/theses_checker.py
 cp ../web/theses_checker/bl/standard_pages.py ./theses_checker_package/standard_pages.py
 cp ../web/theses_checker/bl/chapter_info.py ./theses_checker_package/chapter_info.py
-cp ../web/theses_checker/bl/chapter_info_advanced.py ./theses_checker_package/chapter_info_advanced.py
\ No newline at end of file
+cp ../web/theses_checker/bl/chapter_info_advanced.py ./theses_checker_package/chapter_info_advanced.py
+cp ../web/theses_checker/bl/overflow_scan.py ./theses_checker_package/overflow_scan.py
+cp ../web/theses_checker/bl/text_scan.py ./theses_checker_package/text_scan.py
+cp ../web/theses_checker/bl/rect_index.py ./theses_checker_package/rect_index.py
+cp ../web/theses_checker/bl/content_stream.py ./theses_checker_package/content_stream.py
+cp ../web/theses_checker/bl/page_cache.py ./theses_checker_package/page_cache.py
+cp ../web/theses_checker/bl/page_watchdog.py ./theses_checker_package/page_watchdog.py
+cp ../web/theses_checker/bl/annotation_batch.py ./theses_checker_package/annotation_batch.py
+cp ../web/theses_checker/bl/check_registry.py ./theses_checker_package/check_registry.py
+cp ../web/theses_checker/bl/memory_usage.py ./theses_checker_package/memory_usage.py
+cp ../web/theses_checker/bl/document_triage.py ./theses_checker_package/document_triage.py
+cp ../web/theses_checker/bl/tolerance_float.py ./theses_checker_package/tolerance_float.py
\ No newline at end of file
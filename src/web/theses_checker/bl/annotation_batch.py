@@ -0,0 +1,202 @@
+#----------------------------------------------------------------------------
+# File          : annotation_batch.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import fitz
+
+## Vertical lines are longer by this on each side than marked rectangles
+LINE_EXTENSION = 20
+## Rectangles closer to each other than this are adjacent
+ADJACENT_GAP = 1.0
+## Width of lines and arrows
+LINE_WIDTH = 1
+## Half of height of arrow head, arrow head is 2.5 times longer than it
+ARROW_HEAD = 2
+
+
+def isAdjacent(rectA, rectB) -> bool:
+    """
+    Determines if two rectangles overlap or touch (with gap up to ADJACENT_GAP).
+
+    Args:
+        rectA: Rectangle (x0, y0, x1, y1).
+        rectB: Rectangle (x0, y0, x1, y1).
+
+    Returns:
+        bool: Whether the rectangles are adjacent.
+    """
+    return (rectA[0] - ADJACENT_GAP <= rectB[2] and rectB[0] - ADJACENT_GAP <= rectA[2]
+            and rectA[1] - ADJACENT_GAP <= rectB[3] and rectB[1] - ADJACENT_GAP <= rectA[3])
+
+
+def mergeSegments(segments : list) -> list:
+    """
+    Merges overlapping segments of a line.
+
+    Args:
+        segments (list): Segments (start, end).
+
+    Returns:
+        list: Sorted segments (start, end), none of them overlap.
+    """
+    merged = []
+    for start, end in sorted(segments):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+
+class AnnotationBatch:
+    """
+    Annotations of one page collected during checks of the page and written at once by write, after all checks of the page.
+    Findings are merged, so that fewer annotations (and their appearance streams) are created:
+    adjacent highlights of the same style become one highlight, overlapping vertical lines at the same x become one line
+    and every arrow is one ink annotation instead of three lines.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        ## Highlights as lists [rects, color, text, title], colors are in format used in PDF
+        self.highlights : list[list] = []
+        ## Vertical lines, (x, color) -> list of segments (y0, y1)
+        self.lines : dict[tuple, list] = {}
+        ## Arrows as tuples (xPointing, x, y, color)
+        self.arrows : list[tuple] = []
+        ## Notes (text annotations) as tuples (point, color, text, title)
+        self.notes : list[tuple] = []
+        ## Count of added findings (highlights, lines and arrows) since the last write
+        self.findings : int = 0
+
+
+    def addHighlight(self, rects : list, color : tuple, text : str = None, title : str = None):
+        """
+        Adds highlight. It is merged with already added highlight of the same style, if any of their rectangles are adjacent.
+
+        Args:
+            rects (list): Highlighted rectangles, or one rectangle.
+            color (tuple): Color in format used in PDF.
+            text (str, optional): Text of the pop-up window. Defaults to None (no pop-up).
+            title (str, optional): Title of the pop-up window. Defaults to None.
+        """
+        if isinstance(rects[0], (int, float)):
+            rects = [rects] # one rectangle
+        rects = [tuple(rect) for rect in rects]
+        self.findings += 1
+        for highlight in self.highlights:
+            if highlight[1] == color and highlight[2] == text and highlight[3] == title \
+                    and any(isAdjacent(rectA, rectB) for rectA in highlight[0] for rectB in rects):
+                highlight[0].extend(rects)
+                return
+        self.highlights.append([rects, color, text, title])
+
+
+    def addLines(self, x : float, rects : list, color : tuple):
+        """
+        Adds vertical lines at x, one for every rectangle (from its top to its bottom, extended by LINE_EXTENSION).
+
+        Args:
+            x (float): X coordinate of the lines.
+            rects (list): Rectangles that specify y coordinates of the lines.
+            color (tuple): Color in format used in PDF.
+        """
+        segments = self.lines.setdefault((x, color), [])
+        for rect in rects:
+            segments.append((rect[1] - LINE_EXTENSION, rect[3] + LINE_EXTENSION))
+            self.findings += 1
+
+
+    def addArrow(self, xPointing : float, x : float, y : float, color : tuple):
+        """
+        Adds horizontal arrow.
+
+        Args:
+            xPointing (float): Start coordinate of arrow. Point of the arrow will be at this coordinate.
+            x (float): End coordinate of arrow.
+            y (float): Vertical position of arrow.
+            color (tuple): Color in format used in PDF.
+        """
+        self.arrows.append((xPointing, x, y, color))
+        self.findings += 1
+
+
+    def addNote(self, point : tuple, color : tuple, text : str, title : str = None):
+        """
+        Adds note (text annotation shown as an icon with a pop-up window).
+
+        Args:
+            point (tuple): Top left corner (x, y) of the icon.
+            color (tuple): Color in format used in PDF.
+            text (str): Text of the pop-up window.
+            title (str, optional): Title of the pop-up window. Defaults to None.
+        """
+        self.notes.append((tuple(point), color, text, title))
+        self.findings += 1
+
+
+    def write(self, page : fitz.Page) -> int:
+        """
+        Writes all added annotations to the page and empties the batch.
+
+        Args:
+            page (fitz.Page): Annotated page.
+
+        Returns:
+            int: Count of created annotations.
+        """
+        count = 0
+        for rects, color, text, title in self.highlights:
+            annot = page.add_highlight_annot([fitz.Rect(rect) for rect in rects])
+            annot.set_colors(stroke=color)
+            if text != None:
+                info = annot.info
+                if title != None:
+                    info["title"] = title
+                info["content"] = text
+                annot.set_info(info)
+            annot.update()
+            count += 1
+
+        for (x, color), segments in self.lines.items():
+            for y0, y1 in mergeSegments(segments):
+                annot = page.add_line_annot(fitz.Point(x, y0), fitz.Point(x, y1))
+                annot.set_border(width=LINE_WIDTH)
+                annot.set_colors(stroke=color)
+                annot.update()
+                count += 1
+
+        for xPointing, x, y, color in self.arrows:
+            head = ARROW_HEAD if xPointing <= x else -ARROW_HEAD
+            annot = page.add_ink_annot([[(x, y), (xPointing, y)],
+                                        [(xPointing + head*2.5, y - head), (xPointing, y), (xPointing + head*2.5, y + head)]])
+            annot.set_border(width=LINE_WIDTH)
+            annot.set_colors(stroke=color)
+            annot.update()
+            count += 1
+
+        for point, color, text, title in self.notes:
+            annot = page.add_text_annot(fitz.Point(point), text)
+            annot.set_colors(stroke=color)
+            if title != None:
+                info = annot.info
+                info["title"] = title
+                annot.set_info(info)
+            annot.update()
+            count += 1
+
+        self.highlights = []
+        self.lines = {}
+        self.arrows = []
+        self.notes = []
+        self.findings = 0
+        return count
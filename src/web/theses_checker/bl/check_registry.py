@@ -0,0 +1,184 @@
+#----------------------------------------------------------------------------
+# File          : check_registry.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+from enum import Enum
+
+
+class PageArtifact(Enum):
+    """
+    Enumeration of artifacts consumed by checks. Page artifacts are extracted once per page and shared by all checks of the page,
+    document artifacts are found once per document (from sampled pages) before pages are checked.
+    Every artifact depends only on artifacts listed before it (see DEPENDENCIES), so order of values is dependency order.
+    """
+    BORDER = 0   # left and right border of text of the document (document artifact)
+    REGULAR_FONT = 1   # font of regular text of the document (document artifact)
+    TEXT_PAGE = 2   # TextPage of the page
+    EMBEDDED_PDFS = 3   # blocks of embedded PDFs invoked by the page (extracted only if embedded PDFs are taken as images)
+    DICTIONARY = 4   # dictionary of the page, blocks of embedded PDFs replace their content if embedded PDFs are taken as images
+    BLOCK_FEATURES = 5   # features and bounding boxes of blocks of the dictionary
+    TEXT_CONTENT = 6   # dehyphenated text of the whole page
+    TEXT_FINDINGS = 7   # matches of all text rules in text of the page
+    PIXMAP = 8   # rendered image of the whole page
+
+    def isDocumentArtifact(self) -> bool:
+        """
+        Determines if artifact is found once per document.
+
+        Returns:
+            bool: True -> document artifact; False -> page artifact
+        """
+        return self in (PageArtifact.BORDER, PageArtifact.REGULAR_FONT)
+
+
+## Tier of checks using only text and structure of pages, they are run first in tiered annotating
+TEXT_TIER = 1
+## Tier of checks rendering pages or depending on border of the document found by sampling, they are run after all checks of TEXT_TIER
+RASTER_TIER = 2
+
+
+## Artifacts from which every artifact is derived (artifacts without dependencies are not listed)
+DEPENDENCIES = {
+    PageArtifact.DICTIONARY : [PageArtifact.TEXT_PAGE, PageArtifact.EMBEDDED_PDFS],
+    PageArtifact.BLOCK_FEATURES : [PageArtifact.DICTIONARY],
+    PageArtifact.TEXT_CONTENT : [PageArtifact.DICTIONARY],
+    PageArtifact.TEXT_FINDINGS : [PageArtifact.DICTIONARY],
+}
+
+
+def getRequiredArtifacts(artifacts : list) -> list:
+    """
+    Gets artifacts together with all artifacts they depend on (directly or indirectly).
+
+    Args:
+        artifacts (list): Consumed artifacts (PageArtifact).
+
+    Returns:
+        list[PageArtifact]: Required artifacts without duplicates in dependency order.
+    """
+    required = set()
+    pending = list(artifacts)
+    while pending:
+        artifact = pending.pop()
+        if artifact not in required:
+            required.add(artifact)
+            pending.extend(DEPENDENCIES.get(artifact, []))
+    return sorted(required, key=lambda artifact: artifact.value)
+
+
+
+class PageCheck:
+    """
+    Check of one page registered in CheckRegistry together with artifacts it consumes.
+    """
+
+    def __init__(self, name : str, function, artifacts : list, lazyArtifacts : list = None, stateful : bool = False, firstPage : bool = True, needsBorder : bool = False,
+                 tier : int = TEXT_TIER, needsTextLayer : bool = True):
+        """
+        Constructor.
+
+        Args:
+            name (str): Name of the check (name of its argument of Checker.annotate).
+            function: Function checking one page, called with page context. Function of stateful check is called with page context and state
+                left by the previous page and returns state for the next page.
+            artifacts (list): Artifacts (PageArtifact) consumed by the check on every checked page, artifacts they depend on are added automatically.
+            lazyArtifacts (list, optional): Artifacts consumed only on some pages (for example block features of table of content pages),
+                the check extracts them itself when needed. Defaults to None.
+            stateful (bool, optional): Determines if result of the check depends on state (bool, initially False) left by the previous page. Defaults to False.
+            firstPage (bool, optional): Determines if the first page is checked. Defaults to True.
+            needsBorder (bool, optional): Determines if the check is skipped when border of the document is not found. Defaults to False.
+            tier (int, optional): Tier of the check in tiered annotating (TEXT_TIER or RASTER_TIER). Defaults to TEXT_TIER.
+            needsTextLayer (bool, optional): Determines if the check reads text of the page. On scanned pages (see document_triage) check reading text is run
+                only if the page has text layer (OCR) and check of graphics of the page is never run. Defaults to True.
+        """
+        ## Name of the check (name of its argument of Checker.annotate)
+        self.name : str = name
+        ## Function checking one page
+        self.function = function
+        ## Artifacts consumed by the check on every checked page and artifacts they depend on, in dependency order (prepared before the check is run)
+        self.artifacts : list[PageArtifact] = getRequiredArtifacts(artifacts)
+        ## Artifacts consumed by the check only on some pages and artifacts they depend on, which are not in artifacts (extracted by the check when needed)
+        self.lazyArtifacts : list[PageArtifact] = [artifact for artifact in getRequiredArtifacts(lazyArtifacts if lazyArtifacts != None else []) if artifact not in self.artifacts]
+        ## Determines if result of the check depends on state left by the previous page
+        self.stateful : bool = stateful
+        ## Determines if the first page is checked
+        self.firstPage : bool = firstPage
+        ## Determines if the check is skipped when border of the document is not found
+        self.needsBorder : bool = needsBorder
+        ## Tier of the check in tiered annotating, checks of lower tier are run on all pages first
+        self.tier : int = tier
+        ## Determines if the check reads text of the page (run on scanned page only if it has text layer), otherwise it checks graphics of the page (not run on scanned pages)
+        self.needsTextLayer : bool = needsTextLayer
+
+
+
+class CheckRegistry:
+    """
+    Registry of page checks. Checks are run in order of registration, every check gets its artifacts prepared before it is run.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        ## Registered checks by their names in order of registration
+        self.checks : dict[str, PageCheck] = {}
+
+
+    def register(self, check : PageCheck):
+        """
+        Registers check. It will be run after all already registered checks.
+
+        Args:
+            check (PageCheck): Registered check.
+        """
+        if check.name in self.checks:
+            raise ValueError("check '" + check.name + "' is already registered")
+        self.checks[check.name] = check
+
+
+    def getEnabled(self, names : list) -> list:
+        """
+        Gets registered checks with given names in order of registration.
+
+        Args:
+            names (list): Names of enabled checks, names of unregistered checks are ignored.
+
+        Returns:
+            list[PageCheck]: Enabled checks.
+        """
+        return [check for name, check in self.checks.items() if name in names]
+
+
+    def getTiers(self, checks : list) -> list:
+        """
+        Splits checks by their tiers.
+
+        Args:
+            checks (list): Enabled checks (PageCheck).
+
+        Returns:
+            list[list[PageCheck]]: Non-empty lists of checks of one tier in order of tiers, checks of one tier are in order of registration.
+        """
+        tiers = sorted(set(check.tier for check in checks))
+        return [[check for check in checks if check.tier == tier] for tier in tiers]
+
+
+    def getArtifacts(self, checks : list, artifacts : list = None) -> list:
+        """
+        Gets all artifacts required by given checks (including artifacts consumed only on some pages).
+
+        Args:
+            checks (list): Enabled checks (PageCheck).
+            artifacts (list, optional): Artifacts consumed outside of checks (for example by gathering of chapters information). Defaults to None.
+
+        Returns:
+            list[PageArtifact]: Required artifacts without duplicates in dependency order.
+        """
+        return getRequiredArtifacts([artifact for check in checks for artifact in check.artifacts + check.lazyArtifacts] + (artifacts if artifacts != None else []))
@@ -0,0 +1,195 @@
+#----------------------------------------------------------------------------
+# File          : content_stream.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import re
+
+## One token of content stream, whitespace between tokens is skipped by searching for the next token.
+## Literal string with nested parentheses is matched only by its opening parenthesis, the rest is skipped separately.
+TOKEN_PATTERN = re.compile(rb"[^\x00\t\n\x0c\r ()<>\[\]{}/%]+|/[^\x00\t\n\x0c\r ()<>\[\]{}/%]*|\((?:[^()\\]|\\.)*\)|<<|>>|<[^>]*>|%[^\r\n]*|[^\x00\t\n\x0c\r ]", re.DOTALL)
+
+## First bytes of tokens that are not regular (numbers, operators, booleans)
+DELIMITERS = frozenset(b"()<>[]{}/%")
+## First bytes of numbers
+NUMBER_START = frozenset(b"+-.0123456789")
+
+## Operator BI (beginning of inline image) as a separate token, it can be also found inside strings or comments
+INLINE_IMAGE_BEGIN_PATTERN = re.compile(rb"(?<![^\x00\t\n\x0c\r ()<>\[\]{}%])BI(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])")
+
+## End of inline image data (EI operator surrounded by whitespace)
+INLINE_IMAGE_END_PATTERN = re.compile(rb"[\x00\t\n\x0c\r ]EI(?=[\x00\t\n\x0c\r ]|$)")
+
+## Escaped character in a name (#xx)
+NAME_ESCAPE_PATTERN = re.compile(rb"#([0-9A-Fa-f]{2})")
+
+
+def skipLiteralString(content : bytes, pos : int) -> int:
+    """
+    Skips literal string (balanced parentheses, escaped characters).
+
+    Args:
+        content (bytes): Content stream.
+        pos (int): Position after the opening parenthesis.
+
+    Returns:
+        int: Position after the closing parenthesis (end of content if string is not closed).
+    """
+    depth = 1
+    length = len(content)
+    while pos < length:
+        char = content[pos]
+        if char == 0x5C:   # backslash -> skip escaped character
+            pos += 2
+            continue
+        if char == 0x28:   # (
+            depth += 1
+        elif char == 0x29:   # )
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    return length
+
+
+def decodeName(token : bytes) -> str:
+    """
+    Decodes name token (without leading slash), escaped characters #xx are replaced.
+
+    Args:
+        token (bytes): Name token including leading slash.
+
+    Returns:
+        str: Decoded name.
+    """
+    return NAME_ESCAPE_PATTERN.sub(lambda match: bytes([int(match.group(1), 16)]), token[1:]).decode('latin-1')
+
+
+def decodeOperand(token : bytes):
+    """
+    Decodes one operand token.
+
+    Args:
+        token (bytes): Operand token.
+
+    Returns:
+        Float for numbers, string (without slash) for names, None for other operands (strings, arrays, dictionaries, booleans).
+            Items of arrays and dictionaries are separate operands.
+    """
+    first = token[0]
+    if first == 0x2F:   # /
+        return decodeName(token)
+    if first in NUMBER_START:
+        try:
+            return float(token)
+        except ValueError:
+            pass
+    return None
+
+
+def iterOperators(content : bytes, operators : set = None):
+    """
+    Walks through content stream and yields its operators one by one, without decoding the whole stream.
+    Several operators on one line, any whitespace, comments, strings (which can contain operator names) and inline images are handled.
+
+    Args:
+        content (bytes): Raw (decompressed) content stream of the page.
+        operators (set, optional): Operators (strings) that are yielded, other operators are skipped and their operands are not decoded.
+            Defaults to None (all operators are yielded).
+
+    Yields:
+        tuple[str, list]: Operator and its operands. Numbers are floats, names are strings (without slash), other operands are None.
+    """
+    wanted = None if operators == None else {operator.encode('latin-1') for operator in operators}
+    operands = []   # raw tokens, decoded only when operator is yielded
+    depth = 0   # depth of arrays and dictionaries, their items are not operators
+    pos = 0
+    length = len(content)
+    while pos < length:
+        # tokens are matched by one scan, it is restarted only after parts that cannot be matched by regular expression
+        for match in TOKEN_PATTERN.finditer(content, pos):
+            token = match.group()
+            first = token[0]
+            if first not in DELIMITERS:
+                if depth > 0 or first in NUMBER_START:
+                    operands.append(token)   # number, or true, false, null inside array or dictionary
+                    continue
+                if token == b"ID":
+                    # inline image data can contain any bytes
+                    end = INLINE_IMAGE_END_PATTERN.search(content, match.end())
+                    pos = end.end() if end else length
+                    if wanted == None:
+                        yield ('ID', [decodeOperand(operand) for operand in operands])
+                        yield ('EI', [])
+                    operands = []
+                    break
+                if wanted == None or token in wanted:
+                    yield (token.decode('latin-1'), [decodeOperand(operand) for operand in operands])
+                operands = []
+            elif token == b"(":
+                # literal string with nested parentheses (or not closed)
+                pos = skipLiteralString(content, match.end())
+                operands.append(token)
+                break
+            elif token == b"<<" or first == 0x5B or first == 0x7B:   # << [ {
+                depth += 1
+                operands.append(token)
+            elif token == b">>" or first == 0x5D or first == 0x7D:   # >> ] }
+                depth = max(depth - 1, 0)
+            elif first != 0x25:   # everything except comment
+                operands.append(token)
+        else:
+            # end of content
+            return
+
+
+def mayContainInlineImage(content : bytes) -> bool:
+    """
+    Quickly determines if content stream can contain inline image (without tokenizing it).
+
+    Args:
+        content (bytes): Raw (decompressed) content stream.
+
+    Returns:
+        bool: False -> content stream surely does not contain inline image.
+    """
+    return INLINE_IMAGE_BEGIN_PATTERN.search(content) != None
+
+
+def multiplyMatrices(matrixA : tuple, matrixB : tuple) -> tuple:
+    """
+    Multiplies two affine transformation matrices given as (a, b, c, d, e, f), that is [[a, b, 0], [c, d, 0], [e, f, 1]].
+
+    Args:
+        matrixA (tuple): Left matrix (for example matrix of "cm" operator).
+        matrixB (tuple): Right matrix (for example current transformation matrix).
+
+    Returns:
+        tuple: Product matrixA * matrixB.
+    """
+    a1, b1, c1, d1, e1, f1 = matrixA
+    a2, b2, c2, d2, e2, f2 = matrixB
+    return (a1*a2 + b1*c2, a1*b2 + b1*d2,
+            c1*a2 + d1*c2, c1*b2 + d1*d2,
+            e1*a2 + f1*c2 + e2, e1*b2 + f1*d2 + f2)
+
+
+def transformPoint(matrix : tuple, x : float, y : float) -> tuple:
+    """
+    Transforms point by affine transformation matrix given as (a, b, c, d, e, f), that is [x' y' 1] = [x y 1] * matrix.
+
+    Args:
+        matrix (tuple): Transformation matrix.
+        x (float): X coordinate of the point.
+        y (float): Y coordinate of the point.
+
+    Returns:
+        tuple: Transformed point (x', y').
+    """
+    a, b, c, d, e, f = matrix
+    return (a*x + c*y + e, b*x + d*y + f)
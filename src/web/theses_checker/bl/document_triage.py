@@ -0,0 +1,181 @@
+#----------------------------------------------------------------------------
+# File          : document_triage.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import time
+import fitz
+from . import content_stream
+
+## Type of page covered (almost) whole by images without visible text, for example scanned page (possibly with invisible text layer of OCR)
+SCANNED = "scanned"
+## Type of page created digitally (text and drawings of the page are its content, possibly on background image covering the page)
+BORN_DIGITAL = "born-digital"
+## Type of document containing both scanned and born-digital pages
+MIXED = "mixed"
+## Minimum part of page area covered by images, from which the page is taken as scanned
+SCANNED_COVERAGE = 0.8
+## Minimum count of characters (without whitespace) of text layer of page covered by images, from which the page is taken as having text layer,
+## fewer characters are for example page numbers added to the scan; the page with so many visible characters is born-digital, with invisible characters (OCR) it is scanned
+MIN_TEXT_LAYER_CHARS = 32
+
+
+def getImageCoverage(page : fitz.Page) -> float:
+    """
+    Gets part of page area covered by images. Images are placed (without decoding) only if the page uses any image,
+    overlapping images are counted more times.
+
+    Args:
+        page (fitz.Page): Examined page.
+
+    Returns:
+        float: Covered part of page area (0.0 to 1.0).
+    """
+    pageArea = abs(page.rect)
+    if pageArea == 0 or (not page.get_images() and not content_stream.mayContainInlineImage(page.read_contents())):
+        return 0.0
+    covered = sum(abs(fitz.Rect(info['bbox']) & page.rect) for info in page.get_image_info())
+    return min(1.0, covered / pageArea)
+
+
+def countTextLayerChars(page : fitz.Page) -> tuple[int, int]:
+    """
+    Counts characters (without whitespace) of text layer of page, text is traced without layout information.
+    Characters are visible, unless they are not rendered (render mode 3, used by OCR for text over scanned image) or fully transparent.
+
+    Args:
+        page (fitz.Page): Examined page.
+
+    Returns:
+        tuple[int, int]: Count of all characters and count of visible characters.
+    """
+    chars = 0
+    visibleChars = 0
+    for span in page.get_texttrace():
+        count = sum(not chr(char[0]).isspace() for char in span['chars'])
+        chars += count
+        if span['type'] != 3 and span['opacity'] > 0:
+            visibleChars += count
+    return (chars, visibleChars)
+
+
+
+class PageTriage:
+    """
+    Classification of one page by cheap features: image coverage of the page, and for pages covered by images
+    also count of fonts used by the page and count of characters of its text layer. Page covered by images is scanned
+    only if it has no visible text, otherwise the images are background of born-digital page.
+    """
+
+    def __init__(self, page : fitz.Page):
+        """
+        Constructor. Examines the page.
+
+        Args:
+            page (fitz.Page): Examined page, None if the page could not be examined (for example its examination exceeded time budget),
+                such page is taken as born-digital.
+        """
+        ## Whether the page was examined
+        self.examined : bool = page != None
+        ## Part of page area covered by images (see getImageCoverage)
+        self.imageCoverage : float = getImageCoverage(page) if self.examined else 0.0
+        ## Count of fonts used by the page, None if not examined (page not covered by images)
+        self.fonts : int = None
+        ## Count of characters of text layer of the page, None if not examined (page not covered by images)
+        self.chars : int = None
+        ## Count of visible characters of text layer of the page, None if not examined (page not covered by images)
+        self.visibleChars : int = None
+        if self.imageCoverage >= SCANNED_COVERAGE:
+            self.fonts = len(page.get_fonts())
+            self.chars, self.visibleChars = countTextLayerChars(page) if self.fonts > 0 else (0, 0)
+        ## Type of the page (SCANNED or BORN_DIGITAL)
+        self.type : str = SCANNED if self.visibleChars != None and self.visibleChars < MIN_TEXT_LAYER_CHARS else BORN_DIGITAL
+        ## Whether text of the page can be checked, born-digital page always has text layer, scanned page only if it has enough invisible characters (OCR)
+        self.textLayer : bool = self.type == BORN_DIGITAL or self.chars >= MIN_TEXT_LAYER_CHARS
+
+
+
+class DocumentTriage:
+    """
+    Fast pre-flight pass over the whole document classifying pages as scanned or born-digital (see PageTriage)
+    and the document as scanned, born-digital or mixed. Nothing is extracted for layout, so the pass is much cheaper than checks of pages.
+    """
+
+    def __init__(self, document : fitz.Document, examinePage = None):
+        """
+        Constructor. Examines all pages of the document.
+
+        Args:
+            document (fitz.Document): Examined document.
+            examinePage (optional): Function getting PageTriage of one page by its index, for example examined in supervised worker process.
+                Defaults to None (pages are examined in this process).
+        """
+        start = time.perf_counter()
+        ## Classification of every page (index is page number)
+        self.pages : list[PageTriage] = [PageTriage(page) for page in document] if examinePage == None \
+            else [examinePage(pageNumber) for pageNumber in range(len(document))]
+        ## Time of the pass in seconds
+        self.time : float = time.perf_counter() - start
+
+
+    def getDocumentType(self) -> str:
+        """
+        Gets type of the document by types of its pages.
+
+        Returns:
+            str: SCANNED (all pages are scanned), BORN_DIGITAL (no page is scanned) or MIXED.
+        """
+        types = set(page.type for page in self.pages)
+        if len(types) > 1:
+            return MIXED
+        return types.pop() if types else BORN_DIGITAL
+
+
+    def getScannedPages(self) -> dict:
+        """
+        Gets scanned pages of the document.
+
+        Returns:
+            dict[int, bool]: Maps index of scanned page to whether the page has text layer.
+        """
+        return {pageNumber : page.textLayer for pageNumber, page in enumerate(self.pages) if page.type == SCANNED}
+
+
+    def getRanges(self) -> list:
+        """
+        Gets ranges of consecutive pages of the same type and with the same presence of text layer.
+
+        Returns:
+            list[dict]: Ranges with keys "first", "last" (page numbers starting at 1), "type" and "textLayer".
+        """
+        ranges = []
+        for pageNumber, page in enumerate(self.pages):
+            if ranges and ranges[-1]["type"] == page.type and ranges[-1]["textLayer"] == page.textLayer:
+                ranges[-1]["last"] = pageNumber + 1
+            else:
+                ranges.append({"first" : pageNumber + 1, "last" : pageNumber + 1, "type" : page.type, "textLayer" : page.textLayer})
+        return ranges
+
+
+    def toDict(self) -> dict:
+        """
+        Converts result of the triage to dictionary.
+
+        Returns:
+            dict: Type of the document, counts of pages, ranges of pages (see getRanges) and time of the pass.
+                Pages, which could not be examined, are counted in "unexaminedPages" (and taken as born-digital).
+        """
+        return {
+            "documentType" : self.getDocumentType(),
+            "pages" : len(self.pages),
+            "scannedPages" : sum(page.type == SCANNED for page in self.pages),
+            "pagesWithoutTextLayer" : sum(not page.textLayer for page in self.pages),
+            "unexaminedPages" : sum(not page.examined for page in self.pages),
+            "ranges" : self.getRanges(),
+            "time" : round(self.time, 6)
+        }
@@ -0,0 +1,86 @@
+#----------------------------------------------------------------------------
+# File          : memory_usage.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import os
+import sys
+import ctypes
+
+
+class ProcessMemoryCounters(ctypes.Structure):
+    """
+    PROCESS_MEMORY_COUNTERS structure of Windows API (used by GetProcessMemoryInfo).
+    """
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+def getWindowsMemoryCounters():
+    """
+    Gets memory counters of current process on Windows.
+
+    Returns:
+        ProcessMemoryCounters|None: Memory counters, None if they cannot be read.
+    """
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(ProcessMemoryCounters)
+    try:
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return counters
+
+
+def getCurrentRss() -> int:
+    """
+    Gets current resident set size (physical memory used) of current process.
+
+    Returns:
+        int|None: Resident set size in bytes, None if it cannot be read on this system.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as file:
+                return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == "win32":
+        counters = getWindowsMemoryCounters()
+        return counters.WorkingSetSize if counters != None else None
+    return None
+
+
+def getPeakRss() -> int:
+    """
+    Gets peak resident set size of current process since its start.
+
+    Returns:
+        int|None: Peak resident set size in bytes, None if it cannot be read on this system.
+    """
+    if sys.platform == "win32":
+        counters = getWindowsMemoryCounters()
+        return counters.PeakWorkingSetSize if counters != None else None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024 # bytes on macOS, kilobytes elsewhere
@@ -0,0 +1,297 @@
+#----------------------------------------------------------------------------
+# File          : overflow_scan.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import numpy
+
+
+def pixmapToArray(pixmap) -> numpy.ndarray:
+    """
+    Creates a view of pixmap samples as a NumPy array without copying the data.
+    The pixmap must stay alive while the returned array is used.
+
+    Args:
+        pixmap (fitz.Pixmap): Pixmap which samples are viewed.
+
+    Returns:
+        numpy.ndarray: Array of shape (height, width, n) with dtype uint8.
+    """
+    samples = numpy.frombuffer(pixmap.samples_mv, dtype=numpy.uint8)
+    rows = samples.reshape(pixmap.height, pixmap.stride)
+    return rows[:, :pixmap.width * pixmap.n].reshape(pixmap.height, pixmap.width, pixmap.n)
+
+
+def getNonWhiteMask(pixels : numpy.ndarray, white : tuple, tolerance : int = 0) -> numpy.ndarray:
+    """
+    Marks all pixels, that differ from white color.
+
+    Args:
+        pixels (numpy.ndarray): Array of shape (height, width, n).
+        white (tuple): White color, one value for each color component.
+        tolerance (int, optional): Pixels with every component at most tolerance under white are taken as white (near-white). Defaults to 0.
+
+    Returns:
+        numpy.ndarray: Boolean array of shape (height, width). True -> pixel is not white.
+    """
+    if tolerance == 0:
+        return (pixels[:, :, :len(white)] != numpy.asarray(white, dtype=pixels.dtype)).any(axis=2)
+    return (pixels[:, :, :len(white)] < numpy.asarray(white, dtype=numpy.int16) - tolerance).any(axis=2)
+
+
+def getFlaggedRuns(flagged : numpy.ndarray) -> list[tuple[int, int]]:
+    """
+    Finds runs of consecutive flagged rows.
+
+    Args:
+        flagged (numpy.ndarray): Boolean array with one value for each row.
+
+    Returns:
+        list[tuple[int, int]]: List of runs as (first, last) row indexes, both inclusive.
+    """
+    edges = numpy.diff(numpy.concatenate(([0], flagged.view(numpy.int8), [0])))
+    starts = numpy.flatnonzero(edges == 1)
+    ends = numpy.flatnonzero(edges == -1) - 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def getRightOverflowRects(pixmap, rBorder : int, padding : float, white : tuple, tolerance : int = 0) -> list:
+    """
+    Scans pixmap for non-white pixels right of rBorder. Rows with overflow that follow each other are merged into one rectangle.
+    Pixmap can cover only a part of the page (for example rendered with clip), its position is taken from pixmap.x and pixmap.y.
+
+    Args:
+        pixmap (fitz.Pixmap): Scanned pixmap.
+        rBorder (int): X coordinate of right border. Only pixels with x > rBorder are scanned.
+        padding (float): Padding added around found overflow.
+        white (tuple): White color, one value for each color component.
+        tolerance (int, optional): Tolerance of near-white pixels, see getNonWhiteMask. Defaults to 0.
+
+    Returns:
+        list: List of rectangles [x0, y0, x1, y1] (in page coordinates) where overflow was detected.
+    """
+    start = max(rBorder + 1 - pixmap.x, 0)
+    if start >= pixmap.width:
+        return []
+
+    mask = getNonWhiteMask(pixmapToArray(pixmap)[:, start:], white, tolerance)
+    flagged = mask.any(axis=1)
+    if not flagged.any():
+        return []
+
+    # x of the rightmost non-white pixel in each row
+    extents = (pixmap.x + pixmap.width - 1) - numpy.argmax(mask[:, ::-1], axis=1)
+
+    overflow_rects = []
+    for first, last in getFlaggedRuns(flagged):
+        x = int(extents[first:last+1].max())
+        overflow_rects.append([rBorder+1, pixmap.y+first-padding, x+padding, pixmap.y+last+padding])
+    return overflow_rects
+
+
+def getLeftOverflowRects(pixmap, lBorder : int, padding : float, white : tuple, tolerance : int = 0) -> list:
+    """
+    Scans pixmap for non-white pixels left of lBorder. Rows with overflow that follow each other are merged into one rectangle.
+    Pixmap can cover only a part of the page (for example rendered with clip), its position is taken from pixmap.x and pixmap.y.
+
+    Args:
+        pixmap (fitz.Pixmap): Scanned pixmap.
+        lBorder (int): X coordinate of left border. Only pixels with x < lBorder are scanned.
+        padding (float): Padding added around found overflow.
+        white (tuple): White color, one value for each color component.
+        tolerance (int, optional): Tolerance of near-white pixels, see getNonWhiteMask. Defaults to 0.
+
+    Returns:
+        list: List of rectangles [x0, y0, x1, y1] (in page coordinates) where overflow was detected.
+    """
+    end = min(lBorder - pixmap.x, pixmap.width)
+    if end <= 0:
+        return []
+
+    mask = getNonWhiteMask(pixmapToArray(pixmap)[:, :end], white, tolerance)
+    flagged = mask.any(axis=1)
+    if not flagged.any():
+        return []
+
+    # x of the leftmost non-white pixel in each row
+    extents = pixmap.x + numpy.argmax(mask, axis=1)
+
+    overflow_rects = []
+    for first, last in getFlaggedRuns(flagged):
+        x = int(extents[first:last+1].min())
+        overflow_rects.append([x-padding, pixmap.y+first-padding, lBorder, pixmap.y+last+padding])
+    return overflow_rects
+
+
+def getCandidateBands(pixmap, zoom : float, white : tuple, gap : float = 0) -> list[tuple[float, float]]:
+    """
+    Finds vertical ranges of a (low resolution) pixmap, that contain any non-white pixel.
+    Each range is extended by one pixel on both sides, so that content blurred by low resolution is not cut off.
+    Ranges closer to each other than gap are merged, because every rendering of a range has its own overhead.
+
+    Args:
+        pixmap (fitz.Pixmap): Scanned pixmap rendered with zoom.
+        zoom (float): Zoom used for rendering of the pixmap (resolution / 72).
+        white (tuple): White color, one value for each color component.
+        gap (float, optional): Smallest distance (in page coordinates) between two ranges, that are not merged. Defaults to 0.
+
+    Returns:
+        list[tuple[float, float]]: List of ranges (y0, y1) in page coordinates.
+    """
+    flagged = getNonWhiteMask(pixmapToArray(pixmap), white).any(axis=1)
+    bands = []
+    for first, last in getFlaggedRuns(flagged):
+        y0 = (pixmap.y + first - 1) / zoom
+        y1 = (pixmap.y + last + 2) / zoom
+        if bands and y0 - bands[-1][1] < gap:
+            bands[-1] = (bands[-1][0], y1)
+        else:
+            bands.append((y0, y1))
+    return bands
+
+
+def getRightOverflowRectsPixelwise(pixmap, rBorder : int, padding : float, white : tuple) -> list:
+    """
+    Scans pixmap pixel by pixel for non-white pixels right of rBorder. Gives the same result as getRightOverflowRects, but is much slower.
+    Pixmap must cover the whole page.
+
+    Args:
+        pixmap (fitz.Pixmap): Scanned pixmap.
+        rBorder (int): X coordinate of right border. Only pixels with x > rBorder are scanned.
+        padding (float): Padding added around found overflow.
+        white (tuple): White color, one value for each color component.
+
+    Returns:
+        list: List of rectangles [x0, y0, x1, y1] where overflow was detected.
+    """
+    overflow_rects = [None]
+    y = 0
+    while y < pixmap.height:
+        x = pixmap.width - 1
+        while x > rBorder:
+            if pixmap.pixel(x,y) != white:
+
+                if overflow_rects[-1] == None:
+                    # previous line was only WHITE
+                    overflow_rects.pop()
+                    overflow_rects.append([rBorder+1,y-padding,x+padding,y+padding])
+                else:
+                    # previous line had overflow -> merge rectanles
+                    overflow_rects[-1][2] = max(overflow_rects[-1][2],x+padding)
+                    overflow_rects[-1][3] = y+padding
+                break
+            x = x - 1
+
+        if x == rBorder and overflow_rects[-1] != None:
+            # if whole line was WHITE and previous line wasn't
+            overflow_rects.append(None)
+        y = y + 1
+
+    if overflow_rects[-1] == None:
+        overflow_rects.pop()
+
+    return overflow_rects
+
+
+def getLeftOverflowRectsPixelwise(pixmap, lBorder : int, padding : float, white : tuple) -> list:
+    """
+    Scans pixmap pixel by pixel for non-white pixels left of lBorder. Gives the same result as getLeftOverflowRects, but is much slower.
+    Pixmap must cover the whole page.
+
+    Args:
+        pixmap (fitz.Pixmap): Scanned pixmap.
+        lBorder (int): X coordinate of left border. Only pixels with x < lBorder are scanned.
+        padding (float): Padding added around found overflow.
+        white (tuple): White color, one value for each color component.
+
+    Returns:
+        list: List of rectangles [x0, y0, x1, y1] where overflow was detected.
+    """
+    overflow_rects = [None]
+    y = 0
+    while y < pixmap.height:
+        x = 0
+        while x < lBorder:
+            if pixmap.pixel(x,y) != white:
+
+                if overflow_rects[-1] == None:
+                    # previous line was only WHITE
+                    overflow_rects.pop()
+                    overflow_rects.append([x-padding,y-padding,lBorder,y+padding])
+                else:
+                    # previous line had overflow -> merge rectanles
+                    overflow_rects[-1][0] = min(overflow_rects[-1][0],x-padding)
+                    overflow_rects[-1][3] = y+padding
+                break
+            x = x + 1
+
+        if x == lBorder and overflow_rects[-1] != None:
+            # if whole line was WHITE and previous line wasn't
+            overflow_rects.append(None)
+        y = y + 1
+
+    if overflow_rects[-1] == None:
+        overflow_rects.pop()
+
+    return overflow_rects
+
+
+def getMergedBoxRuns(boxes : list) -> list[list[float]]:
+    """
+    Merges boxes, which vertically overlap each other, into runs.
+
+    Args:
+        boxes (list): List of boxes (x0, y0, x1, y1).
+
+    Returns:
+        list[list[float]]: List of runs [x0, y0, x1, y1] sorted from top to bottom. x0 is the minimum and x1 is the maximum of merged boxes.
+    """
+    runs = []
+    for box in sorted(boxes, key=lambda box: box[1]):
+        if runs and box[1] < runs[-1][3]:
+            # box overlaps previous run -> merge
+            runs[-1][0] = min(runs[-1][0], box[0])
+            runs[-1][2] = max(runs[-1][2], box[2])
+            runs[-1][3] = max(runs[-1][3], box[3])
+        else:
+            runs.append([box[0], box[1], box[2], box[3]])
+    return runs
+
+
+def getRightOverflowRectsFromBoxes(boxes : list, rBorder : int, padding : float) -> list:
+    """
+    Finds overflow right of rBorder from bounding boxes of page content instead of rendered pixels.
+    Boxes reaching over the border that vertically overlap each other are merged into one rectangle.
+
+    Args:
+        boxes (list): Bounding boxes (x0, y0, x1, y1) of page content in page coordinates.
+        rBorder (int): X coordinate of right border. Content reaching over rBorder+1 is overflow.
+        padding (float): Padding added around found overflow.
+
+    Returns:
+        list: List of rectangles [x0, y0, x1, y1] where overflow was detected.
+    """
+    overflowing = [box for box in boxes if box[2] > rBorder + 1]
+    return [[rBorder+1, run[1]-padding, run[2]+padding, run[3]+padding] for run in getMergedBoxRuns(overflowing)]
+
+
+def getLeftOverflowRectsFromBoxes(boxes : list, lBorder : int, padding : float) -> list:
+    """
+    Finds overflow left of lBorder from bounding boxes of page content instead of rendered pixels.
+    Boxes reaching over the border that vertically overlap each other are merged into one rectangle.
+
+    Args:
+        boxes (list): Bounding boxes (x0, y0, x1, y1) of page content in page coordinates.
+        lBorder (int): X coordinate of left border. Content reaching under lBorder is overflow.
+        padding (float): Padding added around found overflow.
+
+    Returns:
+        list: List of rectangles [x0, y0, x1, y1] where overflow was detected.
+    """
+    overflowing = [box for box in boxes if box[0] < lBorder]
+    return [[run[0]-padding, run[1]-padding, lBorder, run[3]+padding] for run in getMergedBoxRuns(overflowing)]
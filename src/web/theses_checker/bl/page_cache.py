@@ -0,0 +1,105 @@
+#----------------------------------------------------------------------------
+# File          : page_cache.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+from collections import OrderedDict
+
+
+class PageCache:
+    """
+    Cache of extraction artifacts of pages (for example page contexts) with memory budget.
+    Entries are keyed by page number and extraction flags, so artifacts extracted with different flags are never mixed.
+    When the estimated size of all entries exceeds the budget, the least recently used entries are evicted.
+    """
+
+    def __init__(self, budget : int):
+        """
+        Constructor.
+
+        Args:
+            budget (int): Maximum estimated size of all cached entries in bytes. 0 -> nothing is cached.
+        """
+        ## Maximum estimated size of all cached entries in bytes
+        self.budget : int = budget
+        ## Cached entries from the least to the most recently used, key -> (value, estimated size)
+        self.entries : OrderedDict = OrderedDict()
+        ## Estimated size of all cached entries in bytes
+        self.size : int = 0
+        ## Count of lookups that found cached entry
+        self.hits : int = 0
+        ## Count of lookups that did not find cached entry
+        self.misses : int = 0
+        ## Count of entries evicted because of budget
+        self.evictions : int = 0
+
+
+    def get(self, pageNumber : int, flags : tuple):
+        """
+        Gets cached entry of page and marks it as the most recently used.
+
+        Args:
+            pageNumber (int): Index of page.
+            flags (tuple): Extraction flags of the entry.
+
+        Returns:
+            Cached entry or None if page is not cached with these flags.
+        """
+        entry = self.entries.get((pageNumber, flags))
+        if entry == None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end((pageNumber, flags))
+        return entry[0]
+
+
+    def put(self, pageNumber : int, flags : tuple, value, size : int):
+        """
+        Caches entry of page as the most recently used. Already cached entry of the same page and flags is replaced (its size is updated).
+        The least recently used entries are evicted until estimated size of all entries fits the budget (the new entry can be evicted too).
+
+        Args:
+            pageNumber (int): Index of page.
+            flags (tuple): Extraction flags of the entry.
+            value: Cached entry.
+            size (int): Estimated size of the entry in bytes.
+        """
+        key = (pageNumber, flags)
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[1]
+        self.entries[key] = (value, size)
+        self.size += size
+        while self.size > self.budget and self.entries:
+            self.size -= self.entries.popitem(last=False)[1][1]
+            self.evictions += 1
+
+
+    def clear(self):
+        """
+        Removes all entries (counters are kept).
+        """
+        self.entries.clear()
+        self.size = 0
+
+
+    def getInfo(self) -> dict:
+        """
+        Gets counters of the cache.
+
+        Returns:
+            dict: Counts of hits, misses and evictions, count of cached entries, their estimated size and budget in bytes.
+        """
+        return {
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "evictions" : self.evictions,
+            "entries" : len(self.entries),
+            "size" : self.size,
+            "budget" : self.budget
+        }
@@ -0,0 +1,153 @@
+#----------------------------------------------------------------------------
+# File          : page_watchdog.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import time
+import multiprocessing
+
+
+## Reason of skipped task, whose worker process did not finish it in time budget
+TIMEOUT = "timeout"
+## Reason of skipped task, whose worker process ended without result (for example crash of MuPDF)
+CRASH = "crash"
+
+
+def runWatchedWorker(connection, initializer, initargs : tuple, function):
+    """
+    Main loop of watched worker process. Initializes the process, reports that it is ready
+    and then runs function for every received tuple of arguments until None is received.
+
+    Args:
+        connection: Connection (multiprocessing.Pipe) to PageWatchdog.
+        initializer: Function initializing the worker process.
+        initargs (tuple): Arguments of initializer.
+        function: Function running one task.
+    """
+    initializer(*initargs)
+    connection.send(None)
+    while True:
+        try:
+            args = connection.recv()
+        except EOFError:
+            break
+        if args == None:
+            break
+        try:
+            connection.send((True, function(*args)))
+        except Exception as exception:
+            connection.send((False, exception))
+
+
+
+class PageWatchdog:
+    """
+    Supervised worker process running one task (for example check of one page) at a time with a time budget.
+    Worker process, which does not finish its task in the budget or which ends without result, is killed and replaced by a new one,
+    so one pathological page cannot stall checking of the whole document.
+    """
+
+    def __init__(self, initializer, initargs : tuple, function, timeout : float):
+        """
+        Constructor. Starts worker process and waits until it is initialized (initialization is not counted into time budget).
+
+        Args:
+            initializer: Function initializing the worker process (must be picklable, for example function of a module).
+            initargs (tuple): Arguments of initializer.
+            function: Function running one task in the worker process (must be picklable), its result is returned by getResult.
+            timeout (float): Time budget of one task in seconds.
+        """
+        ## Time budget of one task in seconds
+        self.timeout : float = timeout
+        ## Count of worker processes killed and replaced
+        self.restarts : int = 0
+        self.__initializer = initializer
+        self.__initargs = initargs
+        self.__function = function
+        self.__process : multiprocessing.Process = None
+        self.__connection = None
+        self.__deadline : float = None
+        self.__pending : bool = False
+        self.__start()
+
+
+    def __start(self):
+        """
+        Starts new worker process and waits until it is initialized.
+        """
+        connection, workerConnection = multiprocessing.Pipe()
+        self.__process = multiprocessing.Process(target=runWatchedWorker, args=(workerConnection, self.__initializer, self.__initargs, self.__function), daemon=True)
+        self.__process.start()
+        workerConnection.close()
+        self.__connection = connection
+        self.__connection.recv()
+
+
+    def __restart(self):
+        """
+        Kills worker process and starts new one.
+        """
+        self.__process.kill()
+        self.__process.join()
+        self.__connection.close()
+        self.restarts += 1
+        self.__start()
+
+
+    def submit(self, *args):
+        """
+        Submits task to worker process. Time budget of the task starts now.
+
+        Args:
+            args: Arguments of the function running one task.
+        """
+        self.__deadline = time.monotonic() + self.timeout
+        self.__pending = True
+        self.__connection.send(args)
+
+
+    def getResult(self) -> tuple:
+        """
+        Waits for result of submitted task, at most until its time budget runs out.
+        If the task is not finished in time or worker process ends without result, worker process is replaced by a new one.
+        Exception raised by the task is raised again.
+
+        Returns:
+            tuple: (result of the task, None) if the task is finished; (None, TIMEOUT or CRASH) if the task is skipped.
+        """
+        self.__pending = False
+        try:
+            if not self.__connection.poll(max(0.0, self.__deadline - time.monotonic())):
+                self.__restart()
+                return (None, TIMEOUT)
+            finished, result = self.__connection.recv()
+        except (EOFError, OSError):
+            self.__restart()
+            return (None, CRASH)
+        if not finished:
+            raise result
+        return (result, None)
+
+
+    def close(self):
+        """
+        Stops worker process. Worker process running a task is killed.
+        """
+        if self.__process == None:
+            return
+        if not self.__pending:
+            try:
+                self.__connection.send(None)
+                self.__process.join(1)
+            except OSError:
+                pass
+        if self.__process.is_alive():
+            self.__process.kill()
+            self.__process.join()
+        self.__connection.close()
+        self.__process = None
@@ -0,0 +1,162 @@
+#----------------------------------------------------------------------------
+# File          : rect_index.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import math
+
+## Relative tolerance of coordinates (same as ToleranceFloat)
+RTOL = 1e-05
+## Absolute tolerance of coordinates (same as ToleranceFloat)
+ATOL = 1e-08
+
+
+def isClose(a : float, b : float) -> bool:
+    """
+    Compares two coordinates with tolerance in plain floats. Gives the same result as numpy.isclose(a, b, rtol=RTOL, atol=ATOL) used by ToleranceFloat.
+
+    Args:
+        a (float): Compared coordinate.
+        b (float): Reference coordinate (tolerance is relative to it).
+
+    Returns:
+        bool: Whether the coordinates are equal within tolerance.
+    """
+    if not math.isfinite(b):
+        return a == b
+    return abs(a - b) <= ATOL + RTOL * abs(b)
+
+
+def rectRelativePosition(rectA, rectB) -> int:
+    """
+    Determines relative position of two rectangles, top-to-bottom (biggest priority) then left-to-right.
+    Coordinates are compared with tolerance, see isClose.
+
+    Args:
+        rectA: One of two rectangles, which position is determined.
+        rectB: One of two rectangles, which position is determined.
+
+    Returns:
+        int: Relative position of two rectangles.
+            -1 -> rectA before rectB,
+            0 -> rectA inside rectB,
+            1 -> rectA after rectB
+    """
+    if ((rectA[0] > rectB[0] or isClose(rectA[0], rectB[0])) and (rectA[1] > rectB[1] or isClose(rectA[1], rectB[1]))
+            and (rectA[2] < rectB[2] or isClose(rectA[2], rectB[2])) and (rectA[3] < rectB[3] or isClose(rectA[3], rectB[3]))):
+        return 0
+    elif rectA[1] < rectB[1]:
+        return -1
+    elif isClose(rectA[1], rectB[1]) and rectA[0] < rectB[0]:
+        return -1
+    else:
+        return 1
+
+
+def getPadding(coordinate : float) -> float:
+    """
+    Gets the biggest distance, by which a coordinate can be exceeded and still be equal within tolerance.
+
+    Args:
+        coordinate (float): Reference coordinate.
+
+    Returns:
+        float: Padding of the coordinate.
+    """
+    return ATOL + RTOL * abs(coordinate)
+
+
+
+class RectIndex:
+    """
+    Spatial index of rectangles (for example bounding boxes of embedded PDFs on one page) for fast containment tests.
+    Rectangles are registered in cells of a uniform grid over their union. A tested rectangle can lie only inside rectangles
+    registered in the cell of its center, so only these few rectangles are compared.
+    """
+
+    def __init__(self, rects : list):
+        """
+        Constructor.
+
+        Args:
+            rects (list): Indexed rectangles (x0, y0, x1, y1).
+        """
+        ## Indexed rectangles as tuples of floats
+        self.rects : list[tuple] = [tuple(float(v) for v in rect[:4]) for rect in rects]
+        ## Count of grid cells in each direction
+        self.gridSize : int = max(1, math.ceil(math.sqrt(len(self.rects))))
+        ## Cells of the grid (row by row), every cell is list of indexes of rectangles that cover it
+        self.cells : list[list[int]] = [[] for _ in range(self.gridSize * self.gridSize)]
+        ## Indexes of rectangles that are not in the grid (inverted or infinite), they are compared with every tested rectangle
+        self.unindexed : list[int] = []
+        ## Union of padded rectangles in the grid (x0, y0, x1, y1), None if the grid is empty
+        self.bounds : tuple = None
+
+        padded = {}
+        for i, rect in enumerate(self.rects):
+            if any(math.isnan(v) for v in rect):
+                continue # never contains anything
+            if all(math.isfinite(v) for v in rect) and rect[0] <= rect[2] and rect[1] <= rect[3]:
+                padded[i] = (rect[0] - getPadding(rect[0]), rect[1] - getPadding(rect[1]), rect[2] + getPadding(rect[2]), rect[3] + getPadding(rect[3]))
+            else:
+                self.unindexed.append(i)
+
+        if padded:
+            self.bounds = (min(r[0] for r in padded.values()), min(r[1] for r in padded.values()),
+                           max(r[2] for r in padded.values()), max(r[3] for r in padded.values()))
+            for i, rect in padded.items():
+                column0, row0 = self.__getCell(rect[0], rect[1])
+                column1, row1 = self.__getCell(rect[2], rect[3])
+                for row in range(row0, row1 + 1):
+                    for column in range(column0, column1 + 1):
+                        self.cells[row * self.gridSize + column].append(i)
+
+
+    def __getCell(self, x : float, y : float) -> tuple[int, int]:
+        """
+        Gets cell of the grid containing a point. Points outside of bounds belong to the nearest cell.
+
+        Args:
+            x (float): X coordinate of the point.
+            y (float): Y coordinate of the point.
+
+        Returns:
+            tuple[int, int]: Column and row of the cell.
+        """
+        width = self.bounds[2] - self.bounds[0]
+        height = self.bounds[3] - self.bounds[1]
+        column = int((x - self.bounds[0]) / width * self.gridSize) if width > 0 else 0
+        row = int((y - self.bounds[1]) / height * self.gridSize) if height > 0 else 0
+        return (min(max(column, 0), self.gridSize - 1), min(max(row, 0), self.gridSize - 1))
+
+
+    def containsRect(self, rect) -> bool:
+        """
+        Determines if rectangle lies inside any of indexed rectangles (with tolerance, see rectRelativePosition).
+
+        Args:
+            rect: Tested rectangle (x0, y0, x1, y1).
+
+        Returns:
+            bool: Whether the rectangle lies inside any of indexed rectangles.
+        """
+        candidates = self.unindexed
+        if rect[0] > rect[2] or rect[1] > rect[3]:
+            # inverted rectangle can satisfy the comparisons without its center lying inside
+            candidates = range(len(self.rects))
+        elif self.bounds != None:
+            x = (rect[0] + rect[2]) / 2
+            y = (rect[1] + rect[3]) / 2
+            if self.bounds[0] <= x <= self.bounds[2] and self.bounds[1] <= y <= self.bounds[3]:
+                column, row = self.__getCell(x, y)
+                candidates = self.cells[row * self.gridSize + column] + self.unindexed
+
+        for i in candidates:
+            if rectRelativePosition(rect, self.rects[i]) == 0:
+                return True
+        return False
@@ -0,0 +1,138 @@
+#----------------------------------------------------------------------------
+# File          : text_scan.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import re
+
+
+class CharIndex:
+    """
+    Text of a page in one string, where every character offset is mapped to the bounding box and line of the character.
+    Text is built once per page from "dict" text blocks, so all text checks search the same string.
+    Bounding boxes are added from "rawdict" of the same TextPage only when some match has to be highlighted, because "rawdict" is much slower than "dict".
+    """
+
+    ## Separator of lines inside one block (lines of a paragraph are continuous text)
+    LINE_SEPARATOR = " "
+    ## Separator of blocks
+    BLOCK_SEPARATOR = "\n"
+
+    def __init__(self, blocks : list):
+        """
+        Constructor. Separators between lines and blocks have no bounding box.
+
+        Args:
+            blocks (list): Text blocks from "dict".
+        """
+        ## All text of the blocks
+        self.text : str = ""
+        ## Number of line of every character of text, None for separators
+        self.lines : list = []
+        ## Bounding box (x0, y0, x1, y1) of every character of text, None for separators, whole list is None until addBoxes is called
+        self.boxes : list = None
+
+        parts = []
+        lineNumber = 0
+        for block in blocks:
+            for line in block['lines']:
+                for span in line['spans']:
+                    parts.append(span['text'])
+                    self.lines.extend([lineNumber] * len(span['text']))
+                lineNumber += 1
+                parts.append(self.LINE_SEPARATOR)
+                self.lines.append(None)
+            if parts:
+                parts[-1] = self.BLOCK_SEPARATOR
+        self.text = "".join(parts)
+
+
+    def addBoxes(self, rawBlocks : list):
+        """
+        Adds bounding boxes of characters.
+
+        Args:
+            rawBlocks (list): Text blocks from "rawdict" of the same TextPage as blocks given to constructor (same order and characters).
+        """
+        self.boxes = []
+        for block in rawBlocks:
+            for line in block['lines']:
+                for span in line['spans']:
+                    self.boxes.extend(char['bbox'] for char in span['chars'])
+                self.boxes.append(None)
+
+
+    def getRects(self, start : int, end : int) -> list:
+        """
+        Gets rectangles covering characters text[start:end]. Characters of one line are merged into one rectangle.
+        Bounding boxes must be added first by addBoxes.
+
+        Args:
+            start (int): Offset of the first character.
+            end (int): Offset after the last character.
+
+        Returns:
+            list: List of rectangles [x0, y0, x1, y1], one for each line.
+        """
+        rects = []
+        lastLine = None
+        for box, line in zip(self.boxes[start:end], self.lines[start:end]):
+            if box == None:
+                continue
+            if line == lastLine:
+                rect = rects[-1]
+                rect[0] = min(rect[0], box[0])
+                rect[1] = min(rect[1], box[1])
+                rect[2] = max(rect[2], box[2])
+                rect[3] = max(rect[3], box[3])
+            else:
+                rects.append(list(box))
+                lastLine = line
+        return rects
+
+
+
+def compileRules(rules : dict) -> re.Pattern:
+    """
+    Combines regular expressions of all rules into one, so that text is scanned only once for all of them.
+    Every rule is a named group inside a lookahead, so the combined expression matches an empty string and consumes no characters:
+    matches of different rules can overlap and all rules matching at the same position are found. The leading lookahead of all rules
+    lets the scan stop only at positions where some rule matches. Rules must not contain their own named groups.
+
+    Args:
+        rules (dict): Regular expressions of rules, keys are names of the rules (valid group names).
+
+    Returns:
+        re.Pattern: Compiled regular expression.
+    """
+    anyRule = "|".join("(?:{})".format(pattern) for pattern in rules.values())
+    return re.compile("(?={})".format(anyRule) + "".join("(?:(?=(?P<{}>{})))?".format(name, pattern) for name, pattern in rules.items()))
+
+
+def scanRules(pattern : re.Pattern, text : str) -> dict:
+    """
+    Scans text with combined regular expression of rules in one pass. Match of one rule cannot hide overlapping match of another rule
+    (for example "??(" is both bad reference and missing space before bracket). Matches of one rule do not overlap,
+    the next match of a rule is searched from the end of its previous match.
+
+    Args:
+        pattern (re.Pattern): Regular expression created by compileRules.
+        text (str): Scanned text.
+
+    Returns:
+        dict: For every rule (by name) list of matches as (start, end) offsets.
+    """
+    findings = {name : [] for name in pattern.groupindex}
+    ends = dict.fromkeys(pattern.groupindex, 0)
+    for match in pattern.finditer(text):
+        for name in pattern.groupindex:
+            start, end = match.span(name)
+            if start != -1 and start >= ends[name]:
+                findings[name].append((start, end))
+                ends[name] = end
+    return findings
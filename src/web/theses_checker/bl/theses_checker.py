@@ -4,20 +4,39 @@
 # Login         : xmacko13
 # Email         : michaela.mackovaa@gmail.com
 # Created Date  : 14.01.2023
-# Last Updated  : 09.04.2025
+# Last Updated  : 18.10.2026
 # License       : AGPL-3.0 license
 # ---------------------------------------------------------------------------
 
 from ast import List
 import string
+import os
+import shutil
 import random
+import time
+import math
+import threading
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 from statistics import median
+from collections import Counter
 from tkinter import SE
 import fitz
 import re
 from enum import Enum
 import numpy
 from .chapter_info import *
+from . import overflow_scan
+from . import text_scan
+from . import rect_index
+from . import content_stream
+from . import page_cache
+from . import annotation_batch
+from . import check_registry
+from . import memory_usage
+from . import page_watchdog
+from . import document_triage
+from .check_registry import PageArtifact
 
 
 
@@ -29,6 +48,28 @@ class Language(Enum):
 
 
 
+class OverflowEngine(Enum):
+    """
+    Enumeration of methods used to find out of border content (overflow).
+    """
+    PIXEL = 0   # walks the pixmap pixel by pixel (original method)
+    NUMPY = 1   # scans whole margins of the pixmap at once as NumPy arrays
+    MARGIN_CLIP = 2   # renders only both margins of the page and scans them as NumPy arrays
+    GEOMETRY = 3   # uses bounding boxes of text, images and drawings, falls back to MARGIN_CLIP for pages with content without reliable bounding boxes
+    ADAPTIVE = 4   # finds candidate rows in grayscale margins rendered in low resolution, renders only those rows in full resolution
+
+
+
+class OutputMode(Enum):
+    """
+    Enumeration of ways the annotated document is saved.
+    """
+    FULL = 0   # rewrites the whole document without any optimization (original method)
+    INCREMENTAL = 1   # appends only changed objects (annotations) to a copy of the original file, output must be a path
+    COMPRESSED = 2   # rewrites the whole document with garbage collection (unused and duplicate objects removed) and compressed streams
+
+
+
 class TypographyMistakes:
 
     class MistakeType(Enum):
@@ -95,6 +136,7 @@ class TypographyMistakes:
         self.__spaceBracketMistakesPages : list[int] = []
         self.__emptySectionMistakesPages : list[int] = []
         self.__badReferenceMistakesPages : list[int] = []
+        self.__skippedPages : list[dict] = []
         self.__severeMistakesCount : int = 0
         self.__warningMistakesCount : int = 0
         self.__totalMistakesCount : int = 0
@@ -114,6 +156,7 @@ class TypographyMistakes:
             "spaceBracketMistakesPages" : self.__spaceBracketMistakesPages,
             "emptySectionMistakesPages" : self.__emptySectionMistakesPages,
             "badReferenceMistakesPages" : self.__badReferenceMistakesPages,
+            "skippedPages" : self.__skippedPages,
             "severeMistakesCount" : self.__severeMistakesCount,
             "warningMistakesCount" : self.__warningMistakesCount,
             "totalMistakesCount" : self.__totalMistakesCount
@@ -148,71 +191,445 @@ class TypographyMistakes:
             self.__warningMistakesCount += 1
         self.__totalMistakesCount += 1
 
+    def addSkippedPage(self, page : int, reason : string):
+        """
+        Adds page, which was not checked, to the list of skipped pages.
+
+        Args:
+            page (int): Skipped page.
+            reason (string): Reason why the page was skipped (for example page_watchdog.TIMEOUT).
+        """
+        self.__skippedPages.append({
+            "page" : page,
+            "status" : "skipped (" + reason + ")"
+        })
+
+
+
+
+class PageContext:
+    """
+    State of one checked page. Everything extracted from the page is cached here, so that every check of the page can reuse it.
+    Checker keeps only the state of the whole document, so that several pages (or documents) can be checked at once.
+    """
+
+    ## Estimated memory (in bytes) used by one character of the page in TextPage, dictionary and text index
+    CHAR_SIZE = 512
+
+    def __init__(self, page : fitz.Page, recording : bool = False):
+        """
+        Constructor.
+
+        Args:
+            page (fitz.Page): Checked page.
+            recording (bool, optional): Determines if annotations and mistakes will be recorded instead of being written. Defaults to False.
+        """
+        ## Checked page
+        self.page : fitz.Page = page
+        ## TextPage of the page
+        self.textPage : fitz.TextPage = None
+        ## Pixmap of the page
+        self.pixmap : fitz.Pixmap = None
+        ## Dictionary of the page
+        self.dict : dict = None
+        ## Text blocks from dictionary of the page in order of extraction (not sorted, not replaced by embedded PDFs)
+        self.textBlocks : list = None
+        ## Text of the page with every character mapped to its bounding box
+        self.charIndex : text_scan.CharIndex = None
+        ## Matches of all text rules on the page, for every rule (by name) list of (start, end) offsets in charIndex
+        self.textFindings : dict = None
+        ## Features of every block of dictionary of the page (same order as dictionary blocks)
+        self.blockFeatures : list[BlockFeatures] = None
+        ## Bounding boxes of all blocks of dictionary of the page as array of shape (blocks, 4)
+        self.blockBoxes : numpy.ndarray = None
+        ## List of embedded PDFs invoked by the page as dictionary image blocks 
+        self.embeddedPdfs : list = None
+        ## Spatial index of bounding boxes of embedded PDFs
+        self.embeddedPdfIndex : rect_index.RectIndex = None
+        ## All text from the page in one continuous string
+        self.textContent : str = None
+        ## Bounding boxes of all visible content (text, images, drawings) on the page
+        self.contentBoxes : list = None
+        ## Number of bytes of pixmaps rendered for overflow check of the page
+        self.renderedBytes : int = 0
+        ## Information about overflow check of the page (time and memory), gathered only by OverflowEngine.ADAPTIVE
+        self.overflowScanInfo : dict = None
+        ## List of annotations and mistakes of the page recorded instead of being written (used by worker processes), None -> written directly
+        self.records : list = [] if recording else None
+        ## Annotations of the page written after all checks of the page (see Checker.__writeAnnotations), None if recording
+        self.annotations : annotation_batch.AnnotationBatch = None if recording else annotation_batch.AnnotationBatch()
+        ## Mistakes found on the page with their rectangles (see Checker.iterFindings), empty if recording
+        self.findings : list[dict] = []
+
+
+    def getSize(self) -> int:
+        """
+        Estimates memory used by artifacts extracted from the page so far (text and pixmap).
+
+        Returns:
+            int: Estimated size in bytes.
+        """
+        size = 0
+        if self.textBlocks != None:
+            size += self.CHAR_SIZE * sum(len(span['text']) for block in self.textBlocks for line in block['lines'] for span in line['spans'])
+        if self.pixmap != None:
+            size += self.pixmap.size
+        return size
+
+
+
+class BlockFeatures:
+    """
+    Features of one block of page dictionary used by heading, section and border logic. Computed once per block in one pass over its lines.
+    """
+
+    def __init__(self, block : dict):
+        """
+        Constructor.
+
+        Args:
+            block (dict): Block from page dictionary.
+        """
+        ## Block from page dictionary
+        self.block : dict = block
+        ## Whether the block contains text (otherwise it is an image)
+        self.isText : bool = block['type'] == 0
+        ## Count of logical lines (lines with the same origin y, for example separated by tab, are one logical line)
+        self.linesCount : int = 0
+        ## Ids of all fonts used in the block
+        self.fontIds : frozenset = frozenset()
+        ## First physical line of every logical line (only lines with spans)
+        self.logicalLines : list[dict] = []
+        ## Text of the block, logical lines joined by space (or without hyphen), parts of logical line joined by tab, paragraphs separated by new line
+        self.text : str = ""
+        ## X coordinates of line beginnings, that can lie on the left page border
+        self.borderLefts : list[float] = []
+        ## X coordinates of line ends, that can lie on the right page border
+        self.borderRights : list[float] = []
+        ## Whether the block contains a title of (sub)section, None -> not decided yet (depends on regular font of document)
+        self.isTitle : bool = None
+
+        if self.isText:
+            self.__readLines(block['lines'])
+        else:
+            # --- image ---
+            self.borderLefts.append(block['bbox'][0])
+            self.borderRights.append(block['bbox'][2])
+
+
+    def __readLines(self, lines : list):
+        """
+        Gathers all features of text block from its lines.
+
+        Args:
+            lines (list): Lines of the block.
+        """
+        self.linesCount = len(lines)
+        fontIds = set()
+        parts = []
+        origin_y = -1.0
+        origin_x = -1.0
+        for line in lines:
+            spans = line['spans']
+            if not spans:
+                continue
+            line_origin = spans[0]['origin']
+            if line_origin[1] == origin_y:
+                # not a new line, just tab
+                self.linesCount -= 1
+                self.__replaceLastChar(parts, "\t")
+                if self.borderRights:
+                    self.borderRights.pop()
+            else:
+                self.logicalLines.append(line)
+                self.borderLefts.append(line['bbox'][0])
+                if line_origin[0] > origin_x and origin_x != -1.0:
+                    # new paragraph
+                    self.__replaceLastChar(parts, "\n")
+                    if self.borderRights:
+                        self.borderRights.pop() # the last line in previous paragraph
+                    self.borderLefts.pop() # this line -> indent
+                origin_x = line_origin[0]
+            origin_y = line_origin[1]
+            self.borderRights.append(line['bbox'][2])
+
+            for span in spans:
+                fontIds.add(span['fontId'])
+                parts.append(span['text'])
+            if self.__replaceLastChar(parts, "", "-") == None:
+                parts.append(" ")
+
+        self.__replaceLastChar(parts, "")
+        self.text = "".join(parts)
+        self.fontIds = frozenset(fontIds)
+        if len(lines) > 1 and self.borderRights:
+            self.borderRights.pop() # the last line in paragraph
+        else:
+            # only multiline text determines border
+            self.borderLefts = []
+            self.borderRights = []
+
+
+    @staticmethod
+    def __replaceLastChar(parts : list, replacement : str, onlyChar : str = None):
+        """
+        Replaces the last character of text joined from parts, without joining the parts.
+
+        Args:
+            parts (list): Parts of text.
+            replacement (str): Replacement of the last character.
+            onlyChar (str, optional): If specified, the last character is replaced only if it is onlyChar. Defaults to None.
+
+        Returns:
+            str|None: Replaced character. None if text is empty or the last character is not onlyChar.
+        """
+        i = len(parts) - 1
+        while i >= 0 and not parts[i]:
+            i -= 1
+        if i < 0 or (onlyChar != None and parts[i][-1] != onlyChar):
+            return None
+        lastChar = parts[i][-1]
+        parts[i] = parts[i][:-1] + replacement
+        return lastChar
+
+
+
+class XObjectInfo:
+    """
+    Metadata of one form XObject of the document. It is read once and shared by all pages that use the XObject (templates like logos and headers).
+    """
+
+    def __init__(self, document : fitz.Document, xref : int, bbox):
+        """
+        Constructor. Reads metadata of the XObject from the document.
+
+        Args:
+            document (fitz.Document): Document containing the XObject.
+            xref (int): Cross-reference number of the XObject.
+            bbox: Bounding box of the XObject in its own coordinate system (BBox key).
+        """
+        ## Cross-reference number of the XObject
+        self.xref : int = xref
+        ## Bounding box of the XObject in its own coordinate system
+        self.bbox : fitz.Rect = fitz.Rect(bbox)
+        ## Matrix of the XObject as affine matrix (a, b, c, d, e, f), None if it is not specified
+        self.matrix : tuple = None
+        ## Size of the XObject stream in bytes (Length key), None if it is unknown
+        self.size : int = None
+        ## Whether resources of the XObject contain shadings or patterns (see Checker.__pageNeedsRaster)
+        self.hasPatterns : bool = False
+        ## Indexes of pages that use the XObject
+        self.pages : set[int] = set()
+
+        matrix = document.xref_get_key(xref, "Matrix")[1]
+        if matrix != 'null':
+            #matrix = '[a b c d e f]'
+            self.matrix = tuple(float(value) for value in matrix[1:-1].split())
+
+        length = document.xref_get_key(xref, 'Length')
+        if length[0] == 'xref':
+            length_xref = length[1][:-4] # always ends with ' 0 R'
+            self.size = int(document.xref_object(int(length_xref)))
+        elif length[0] == 'int':
+            self.size = int(length[1])
+        elif length[0] == 'string':
+            try:
+                self.size = int(length[1])
+            except:
+                self.size = None
+
+        for key in ("Resources/Shading", "Resources/Pattern"):
+            if document.xref_get_key(xref, key)[0] != "null":
+                self.hasPatterns = True
 
 
 
 class Checker:
-    ## Maximum count of pages scanned to find general information of the document
+    ## Maximum count of pages sampled to find general information of the document
     RND_PAGE_CNT = 10
+    ## Count of pages sampled first to find general information of the document, more pages are sampled only if the information is not stable
+    SAMPLE_INITIAL_CNT = 4
+    ## Count of pages added to the sample when general information of the document changed after the last added pages
+    SAMPLE_BATCH_CNT = 2
+    ## Maximum change of border medians (in page coordinates) after adding pages to the sample, for which the border is taken as stable
+    SAMPLE_BORDER_TOLERANCE = 1.0
+    ## Seed of the page sampler used when no seed is given to the constructor
+    SAMPLE_SEED = 0
+    ## Default memory budget (in bytes) of cache of extracted pages
+    PAGE_CACHE_BUDGET = 64 * 1024 * 1024
+    ## Count of pages after which annotations are flushed to annotated file in streaming mode (see annotate, memoryLimit)
+    STREAM_CHUNK_PAGES = 50
+    ## Flags of text extraction (text only, images are read by __getPageImageBlocks), without TEXT_DEHYPHENATE: it does not join lines of "dict" and "blocks"
+    ## extraction, text content of pages is dehyphenated by __getDehyphenatedBlockText
+    TEXT_FLAGS = fitz.TEXTFLAGS_BLOCKS
     ## Red color for highlighting. RGB format.  
     HIGH_RED = (255, 128, 128)
     ## Orange color for highlighting. RGB format.  
     HIGH_ORANGE = (253, 182, 116)
     ## Padding for highlight used in overflow check.
     HIGHLIGHT_PADDING = 1.5
+    ## Count of page shards per worker process in parallel annotating (more shards -> better load balancing, more overhead)
+    SHARDS_PER_WORKER = 4
+    ## Text of note on page skipped by page watchdog (see annotate, pageTimeout)
+    SKIPPED_PAGE_TEXT = "Stranka nebyla zkontrolovana ({}). / Page was not checked ({})."
+    ## Candidate rows of OverflowEngine.ADAPTIVE closer to each other than this (in page coordinates) are rendered together.
+    ADAPTIVE_MERGE_GAP = 72
+    ## Regular expressions of text checks (keys are names of mistake types), all of them are searched in one pass over the page text
+    TEXT_RULES = {
+        TypographyMistakes.MistakeType.HYPHEN.name : " - ",
+        TypographyMistakes.MistakeType.BAD_REFERENCE.name : "\\?\\?",
+        TypographyMistakes.MistakeType.SPACE_BRACKET.name : "\\S(?:\\(|\\[|{)"   # for example: "l(", ".[", "5{"
+    }
+    ## Combined regular expression of TEXT_RULES
+    TEXT_RULES_PATTERN = text_scan.compileRules(TEXT_RULES)
+    ## Page artifacts consumed by border check (besides border of the document) with every overflow engine
+    OVERFLOW_ENGINE_ARTIFACTS = {
+        OverflowEngine.PIXEL : [PageArtifact.PIXMAP],
+        OverflowEngine.NUMPY : [PageArtifact.PIXMAP],
+        OverflowEngine.MARGIN_CLIP : [],   # renders margins only
+        OverflowEngine.GEOMETRY : [PageArtifact.DICTIONARY],   # falls back to rendering of margins
+        OverflowEngine.ADAPTIVE : []   # renders margins only
+    }
+    ## Artifacts consumed by gathering of chapters information on every page
+    CHAPTERS_ARTIFACTS = [PageArtifact.REGULAR_FONT, PageArtifact.TEXT_CONTENT]
+    ## Artifacts consumed by gathering of chapters information only on some pages (beginnings of chapters without table of content), extracted when needed
+    CHAPTERS_LAZY_ARTIFACTS = [PageArtifact.BLOCK_FEATURES]
     ## Red color in RGB format.  
     RED = (204, 0, 0)
     ## White color in RGB format.  
     WHITE = (255, 255, 255)
 
-    def __init__(self, pdfPath : string, pdfLang : Language = None):
+    def __init__(self, pdfPath : string, pdfLang : Language = None, seed : int = None):
         """
         Constructor. Creates a document that can be checked for mistakes.
 
         Args:
             pdfPath (string): Path to the PDF, that will be checked.
             pdfLang (Language, optional): Language of PDF content. Defaults to None. (Not used)
+            seed (int, optional): Seed of random generator used to choose sampled pages. Defaults to None (SAMPLE_SEED is used, so the choice is the same in every run).
         """
         ## Boolean indicating whether during check, anything was marked as mistake
         self.mistakes_found = False
         ## Boolean indicating whether during finding page border was successful 
         self.borderNotFound = False
+        ## Path to the scanned PDF, worker processes of parallel annotating open their own document from it
+        self.__pdfPath = pdfPath
         ## Scanned PDF Document
         self.__document = fitz.Document(pdfPath)
+        ## Document where annotations are written, the checked document or its copy opened by __openIncrementalOutput with separate=True (tiered annotating)
+        self.__outputDocument : fitz.Document = self.__document
         ## Table of content of document
         self.__toc = self.__document.get_toc(simple=True)
-        ## Currently scanned page
-        self.__currPage = fitz.Page
-        ## TextPage of current page
-        self.__currTextPage = fitz.TextPage
-        ## Pixmap of current page
-        self.__currPixmap = fitz.Pixmap
-        ## Dictionary of current page
-        self.__currDict = None
-        ## List of embedded PDFs invoked by current page as dictionary image blocks 
-        self.__currPageEmbeddedPdfs = None
-        ## All text from current page in one continuous string
-        self.__currPageTextContent = None
+        ## Index of table of content, maps page number (from 1) to list of its TOC items in order of table of content
+        self.__tocPageIndex : dict[int, list] = self.__getTocPageIndex(self.__toc)
+        ## Segmentation of pages into chapters by table of content (only if document has it), one tuple (isBibliographyPage, isNewChapter, chapterName) for every page
+        self.__tocSegmentation : list[tuple[bool, bool, str]] = [self.__getTocPageChapter(pageNumber) for pageNumber in range(len(self.__document))] if self.__toc else None
         ## Tuple containing x0 and x1 coordinates of page border
         self.__border = (-1.0, -1.0)
-        ## Boolean indicating whether current page contains table of content (TOC)
-        self.__isContentPage = False
+        ## State left by the previous page for every stateful check (see PageCheck), for example whether the previous page contains table of content
+        self.__checkStates : dict[str, bool] = {}
+        ## Registry of page checks of current annotating (see __createCheckRegistry)
+        self.__checks : check_registry.CheckRegistry = None
+        ## Names of artifacts required by enabled checks of the last annotating in dependency order (see PageArtifact)
+        self.requiredArtifacts : list[str] = []
         ## Boolean indicating whether current page is page containing list of bibliography or after bibliography page
         self.__bibliographyPagePassed = False
         ## Language of document (Not used)
         self.__language = pdfLang
-        ## Default font used in document
-        self.__regularFont = None
-        ## Boolean indicating whether previous block contains a heading
-        self.__isPreviousTitle = False
+        ## Seed of random generator used to choose sampled pages
+        self.__seed = seed if seed != None else self.SAMPLE_SEED
+        ## Cache of extracted pages shared by sampling and the main pass (see __getPageContext)
+        self.__pageCache = page_cache.PageCache(self.PAGE_CACHE_BUDGET)
+        ## Counters of cache of extracted pages after annotating (see PageCache.getInfo)
+        self.pageCacheInfo : dict = None
+        ## Indexes of pages sampled to find general information of the document (in order of sampling, rejected pages are not included)
+        self.sampledPages : list[int] = []
+        ## Id of default font used in document (see __getFontId)
+        self.__regularFontId = None
+        ## Font interning table of the document, maps font key (name, size rounded to 5 decimal places, flags) to font id
+        self.__fontIds : dict[tuple, int] = {}
+        ## Font keys of the document, index is font id
+        self.__fontKeys : list[tuple] = []
+        ## Lock of adding fonts to the font interning table, pages of one Checker can be examined in several threads at once
+        self.__fontLock = threading.Lock()
+        ## Form XObjects of the document by xref, filled on first use together with __pageXobjects (see __getDocumentXobjects)
+        self.__xobjectInfos : dict[int, XObjectInfo] = None
+        ## Form XObjects used by every page (index is page number), every XObject is a tuple (name, xref, invoker), invoker 0 -> page directly invokes it
+        self.__pageXobjects : list[list[tuple]] = None
         ## Boolean indicating whether embedded PDFs inside document will be taken as images
         self.__embeddedPdfAsImage = True
+        ## Method used to find out of border content
+        self.__overflowEngine = OverflowEngine.MARGIN_CLIP
+        ## Resolution (dpi) of the first pass of OverflowEngine.ADAPTIVE
+        self.__adaptiveDpi = 24
+        ## Gray value from which pixels are taken as white by OverflowEngine.ADAPTIVE
+        self.__nearWhiteThreshold = 250
         ## Current chapter information
         self.__currChapterInfo : ChapterInfo = None
         ## Tuple containing information about chapters in document, first element is everything before first chapter, second element is list of chapters, third element is everything after last chapter (appendix, bibliography, etc.)
         self.chaptersInfo : tuple[ChapterInfo, list[ChapterInfo], ChapterInfo] = (ChapterInfo(sequence=0, title="Before First Chapter"), [], ChapterInfo(sequence=-1, title="After Last Chapter"))
         ## All found typography mistakes in document
         self.typographyMistakes : TypographyMistakes = TypographyMistakes()
+        ## Information about overflow check of every page (time and memory), gathered only by OverflowEngine.ADAPTIVE
+        self.overflowScanInfo : list[dict] = []
+        ## Information about writing of annotations of every annotated page (count of findings, count of created annotations and time)
+        self.annotationInfo : list[dict] = []
+        ## Information about saving of annotated document (used output mode, size in bytes, time of saving and time of copying of original file by OutputMode.INCREMENTAL)
+        self.outputInfo : dict = None
+        ## Information about memory of the last annotating (memory limit, peak resident set size, count of checked pages, whether checking was stopped by memory limit, ...)
+        self.memoryInfo : dict = None
+        ## Information about finished tiers of the last tiered annotating (tier, names of its checks, time since start, count of mistakes found so far, whether it was saved)
+        self.tierInfo : list[dict] = []
+        ## Resident set size sampled after the last checked page (see __updateMemoryInfo)
+        self.__lastRss : int = None
+        ## Result of triage of the last annotating (see document_triage.DocumentTriage.toDict), count of pages on which each check was skipped by triage
+        ## ("skippedChecks") and estimated time saved by skipped checks ("timeSaved", see __getTriageTimeSaved)
+        self.triageInfo : dict = None
+        ## Scanned pages found by triage of current annotating, maps index of page to whether the page has text layer (see document_triage)
+        self.__scannedPages : dict[int, bool] = {}
+        ## Total time in seconds and count of runs of every check (by name) on born-digital pages of current annotating, used to estimate time saved by triage
+        self.__checkTimes : dict[str, list] = {}
+
+
+
+    @staticmethod
+    def __getTocPageIndex(toc : list):
+        """
+        Creates index of table of content by page numbers.
+
+        Args:
+            toc (list): Table of content, one item is [lvl, title, page].
+
+        Returns:
+            dict[int, list]: Maps page number (from 1) to list of its TOC items in order of table of content.
+        """
+        index = {}
+        for toc_item in toc:
+            index.setdefault(toc_item[2], []).append(toc_item)
+        return index
+
+
+
+    def __getTocPageChapter(self, pageNumber : int):
+        """
+        Determines from table of content if page begins bibliography or a new chapter.
+
+        Args:
+            pageNumber (int): Index of the page (from 0).
+
+        Returns:
+            tuple[bool, bool, str]: (isBibliographyPage, isNewChapter, chapterName)
+        """
+        tocItems = self.__tocPageIndex.get(pageNumber+1, [])
+        # first item of the page (any level) determines bibliography
+        text = tocItems[0][1].lower().strip() if tocItems else ""
+        isBibliographyPage = ( text == "literatura" or text == "literatúra" or text == "bibliography")
+
+        # first item of level 1 begins new chapter
+        for toc_item in tocItems:
+            if toc_item[0] == 1:
+                return (isBibliographyPage, True, toc_item[1])
+        return (isBibliographyPage, False, "")
 
 
 
@@ -230,260 +647,335 @@ class Checker:
 
 
 
-    def __randomPagesIndex(self):
+    def __getSampleCandidates(self):
         """
-        Returns maximum of RND_PAGE_CNT count of indexes of random pages.
+        Gets indexes of pages that can be sampled to find general information of the document, in random order given by seed.
+        Front matter and back matter are avoided, only pages from the first chapter to bibliography are taken (if document has table of content).
+        Scanned pages (see document_triage) are taken only if there is no born-digital candidate and only if they have text layer.
 
         Returns:
-            list: Indexes of random pages.
+            list[int]: Indexes of candidate pages.
         """
         docLen = len(self.__document)
         if docLen <= 5:
-            return range(0, docLen)
-        maxListLen = min(self.RND_PAGE_CNT, docLen-4)
-        return random.sample(range(2, docLen-2), maxListLen)
+            candidates = list(range(0, docLen))
+        else:
+            candidates = list(range(2, docLen-2))
+            if self.__tocSegmentation != None:
+                chapterPages = [pageNumber for pageNumber, segment in enumerate(self.__tocSegmentation) if segment[1]]
+                if chapterPages:
+                    start = chapterPages[0]
+                    end = next((pageNumber for pageNumber, segment in enumerate(self.__tocSegmentation) if segment[0] and pageNumber > start), docLen)
+                    if end - start >= self.SAMPLE_INITIAL_CNT:
+                        candidates = list(range(start, end))
 
+        random.Random(self.__seed).shuffle(candidates)
+        if self.__scannedPages:
+            candidates = [pageNumber for pageNumber in candidates if pageNumber not in self.__scannedPages] \
+                or [pageNumber for pageNumber in candidates if self.__scannedPages[pageNumber]]
+        return candidates
 
 
-    def __highlight(self, rects:list, color:tuple, text:string = None, title:string = None):
+
+    def __highlight(self, pageContext : PageContext, rects:list, color:tuple, text:string = None, title:string = None):
         """
-        Adds highlight annotation. If text is specified adds a pop-up window.
+        Adds highlight annotation to annotations of the page (written by __writeAnnotations). If text is specified adds a pop-up window.
 
         Args:
+            pageContext (PageContext): Context of checked page.
             rects (list): List of rectangles to be highlighted.
             color (tuple): RGB representation of highlight color.
             text (string, optional): Text that will be shown in the pop-up annotation. Defaults to None.
             title (string, optional): Title of the pop-up annotation. Defaults to None.
         """
         if len(rects) > 0:
-            
-            annot = self.__currPage.add_highlight_annot(rects)
-            annot.set_colors(stroke=self.__rgbToPdf(color))
-
-            if text != None:
-                info = annot.info
-                if title != None:
-                    info["title"] = title
-                info["content"] = text
-                annot.set_info(info)
-
-            annot.update()
+            if pageContext.records != None:
+                pageContext.records.append(("highlight", rects, color, text, title))
+                return
+            pageContext.annotations.addHighlight(rects, self.__rgbToPdf(color), text, title)
 
 
 
-    def __overflowLine(self, x:float, overflow_rects:list):
+    def __overflowLine(self, pageContext : PageContext, x:float, overflow_rects:list):
         """
-        Draws a vertical line(s) at x. Start and end y is specified by overflow_rect's y0 and y1.
-        Line will be longer by 20 on each side.
+        Draws a vertical line(s) at x (added to annotations of the page). Start and end y is specified by overflow_rect's y0 and y1.
+        Line will be longer by 20 on each side (see annotation_batch.LINE_EXTENSION).
 
         Args:
+            pageContext (PageContext): Context of checked page.
             x (float): X coordinate, where line is located.
             overflow_rects (list): List of rectangles, that specify y coordinates of line(s).
         """
-        for rect in overflow_rects:
-            annot = self.__currPage.add_line_annot(fitz.Point(x,rect[1]-20), fitz.Point(x,rect[3]+20))
-            annot.set_border(width=1)
-            annot.set_colors(stroke=self.__rgbToPdf(self.RED))
-            annot.update()
+        if pageContext.records != None:
+            if overflow_rects:
+                pageContext.records.append(("line", x, overflow_rects))
+            return
+        pageContext.annotations.addLines(x, overflow_rects, self.__rgbToPdf(self.RED))
+
+
+
+    def __writeAnnotations(self, page : fitz.Page, annotations : annotation_batch.AnnotationBatch):
+        """
+        Writes all annotations of a page in one batch (after all checks of the page) and adds information about writing to annotationInfo.
+
+        Args:
+            page (fitz.Page): Annotated page.
+            annotations (annotation_batch.AnnotationBatch): Annotations of the page.
+        """
+        findings = annotations.findings
+        if findings == 0:
+            return
+        start = time.perf_counter()
+        count = annotations.write(page)
+        self.annotationInfo.append({
+            "page" : page.number+1,
+            "findings" : findings,
+            "annotations" : count,
+            "time" : round(time.perf_counter() - start, 6)
+        })
+
+
+
+    def __getPageFindings(self, pageContext : PageContext, chapter : dict) -> dict:
+        """
+        Creates findings of checked page yielded by iterFindings.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            chapter (dict): Change of chapter information made by the page (see __updateCurrChapter), None if chapters information is not gathered.
+
+        Returns:
+            dict: Findings of the page, see iterFindings.
+        """
+        return {
+            "page" : pageContext.page.number+1,
+            "findings" : pageContext.findings,
+            "chapter" : chapter,
+            "annotations" : pageContext.annotations
+        }
+
+
+
+    def __addMistake(self, pageContext : PageContext, mistakeType : TypographyMistakes.MistakeType, rect):
+        """
+        Adds mistake found on current page to typographyMistakes and to findings of the page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            mistakeType (TypographyMistakes.MistakeType): Type of the mistake.
+            rect: Rectangle (x0, y0, x1, y1) of the mistake.
+        """
+        if pageContext.records != None:
+            pageContext.records.append(("mistake", mistakeType, tuple(fitz.Rect(rect))))
+            return
+        self.typographyMistakes.addMistake(mistakeType, pageContext.page.number+1)
+        pageContext.findings.append({
+            "type" : mistakeType.name,
+            "severity" : "severe" if mistakeType in TypographyMistakes.SEVERE_MISTAKES else "warning",
+            "page" : pageContext.page.number+1,
+            "rects" : [tuple(fitz.Rect(rect))]
+        })
+
+
+
+    def __getDocumentXobjects(self):
+        """
+        Fills __xobjectInfos and __pageXobjects in one pass over resources of all pages (if they are not filled yet).
+        Metadata of every XObject is read only once, no matter how many pages use it.
+        """
+        if self.__xobjectInfos != None:
+            return
+
+        xobjectInfos = {}
+        pageXobjects = []
+        for pageNumber in range(len(self.__document)):
+            xobjects = []
+            for xobject in self.__document.get_page_xobjects(pageNumber):
+                # xobject = (xref, name, invoker, bbox)
+                info = xobjectInfos.get(xobject[0])
+                if info == None:
+                    info = XObjectInfo(self.__document, xobject[0], xobject[3])
+                    xobjectInfos[xobject[0]] = info
+                info.pages.add(pageNumber)
+                xobjects.append((xobject[1], xobject[0], xobject[2]))
+            pageXobjects.append(xobjects)
+        self.__pageXobjects = pageXobjects
+        self.__xobjectInfos = xobjectInfos
 
 
 
-    def __getPageXobjects(self):
+    def __getPageXobjects(self, pageContext : PageContext):
         """
         Gets non-image XObjects invoked by current page.
 
+        Args:
+            pageContext (PageContext): Context of checked page.
+
         Returns:
-            list: XObjects invoked by current page. Every XObject is a tuple (xref, name, invoker, bbox).
+            dict[str, XObjectInfo]: XObjects invoked by current page by their names in page resources.
         """
-        tmp_xobjects = self.__currPage.get_xobjects()
-        xobjects = []
-        for xobject in tmp_xobjects:
-            # xobject = (xref, name, invoker, bbox)
-            if xobject[2] == 0:
+        self.__getDocumentXobjects()
+        xobjects = {}
+        for name, xref, invoker in self.__pageXobjects[pageContext.page.number]:
+            if invoker == 0:
                 # page directly invokes this xobject
-                xobjects.append(xobject)
+                xobjects[name] = self.__xobjectInfos[xref]
 
         return xobjects
 
 
 
-    def __getPageEmbeddedPdfs(self):
+    def __getPageEmbeddedPdfs(self, pageContext : PageContext):
         """
-        Updates class variable currPageEmbeddedPdfs.
+        Updates embeddedPdfs of page context. Content stream of the page is walked operator by operator (see content_stream.iterOperators)
+        and current transformation matrix is tracked, so that position of every embedded PDF invoked by the page is found.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
         """
-        if self.__currPageEmbeddedPdfs != None:
+        if pageContext.embeddedPdfs != None:
             # instance already exists
             return
         
-        self.__currPageEmbeddedPdfs = []
-        xobjects = self.__getPageXobjects()
+        pageContext.embeddedPdfs = []
+        xobjects = self.__getPageXobjects(pageContext)
         embeddedPdfBlocks = []
         if xobjects:
-            try:
-                pageContent = str(self.__currPage.read_contents(),'utf-8')
-            except:
-                return
-            cmds = pageContent.splitlines()
-
+            # flips upside down - (0,0) in view is top-left, but in internal pdf is bottom-left
+            pageTransMatrix = tuple(pageContext.page.transformation_matrix)
             CTMStack = []
-            CTM = [
-                [1.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0],
-                [0.0, 0.0, 1.0]
-            ]
-
-            for cmd in cmds:
-                if cmd[-1:] == 'q':
+            CTM = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0) # affine matrix (a, b, c, d, e, f)
+
+            for operator, operands in content_stream.iterOperators(pageContext.page.read_contents(), {'q', 'Q', 'cm', 'Do'}):
+                if operator == 'q':
                     CTMStack.append(CTM)
-                elif cmd[-1:] == 'Q':
-                    CTM = CTMStack.pop()
-                elif cmd[-2:] == 'cm':
-                    matrix = cmd.split(' ')
-                    cm = [
-                        [float(matrix[0]), float(matrix[1]), 0.0],
-                        [float(matrix[2]), float(matrix[3]), 0.0],
-                        [float(matrix[4]), float(matrix[5]), 1.0]
-                    ]
-                    CTM = numpy.matmul(cm,CTM)
-                elif cmd[-2:] == 'Do':
-                    for xobject in xobjects:
-                        # xobject = (xref, name, invoker, bbox)
-                        if cmd == "/" + xobject[1] + " Do":
-                            CTMStack.append(CTM)
-
-                            Matrix = self.__document.xref_get_key(xobject[0], "Matrix")[1]
-                            if Matrix != 'null':
-                                #Matrix = '[a b c d e f]'
-                                Matrix = Matrix[1:-1]
-                                Matrix = Matrix.split(" ")
-                                Matrix = [
-                                    [float(Matrix[0]), float(Matrix[1]), 0.0],
-                                    [float(Matrix[2]), float(Matrix[3]), 0.0],
-                                    [float(Matrix[4]), float(Matrix[5]), 1.0]
-                                ]
-                                CTM = numpy.matmul(Matrix,CTM)
-
-                            pageTransMatrix = [
-                                [self.__currPage.transformation_matrix.a, self.__currPage.transformation_matrix.b, 0.0],
-                                [self.__currPage.transformation_matrix.c, self.__currPage.transformation_matrix.d, 0.0],
-                                [self.__currPage.transformation_matrix.e, self.__currPage.transformation_matrix.f, 1.0]
-                            ] # flips upside down - (0,0) in view is top-left, but in internal pdf is bottom-left
-                            viewMatrix = numpy.matmul(CTM,pageTransMatrix)
-                            # [ x' y' 1 ] = [ x  y  1 ] * viewMatrix
-                            blMatrix = numpy.matmul([xobject[3][0], xobject[3][1], 1.0],viewMatrix)
-                            trMatrix = numpy.matmul([xobject[3][2], xobject[3][3], 1.0],viewMatrix)
-
-                            length = self.__document.xref_get_key(xobject[0],'Length')
-                            if length[0] == 'xref':
-                                length_xref = length[1][:-4] # always ends with ' 0 R'
-                                size = self.__document.xref_object(int(length_xref))
-                                size = int(size)
-                            elif length[0] == 'int':
-                                size = int(length[1])
-                            elif length[0] == 'string':
-                                try:
-                                    size = int(length[1])
-                                except:
-                                    size = None
-                            else:
-                                size = None
-                                
-                            # if pdf image has the same bbox as already found pdf image -> skip (it's the same image)
-                            bbox = fitz.Rect(blMatrix[0], trMatrix[1], trMatrix[0], blMatrix[1])
-                            if not self.__isInsideEmbeddedPdf(bbox, embeddedPdfBlocks):
-                                embeddedPdfBlocks.append(
-                                    {
-                                        'type'          : 1,
-                                        'bbox'          : bbox,
-                                        'ext'           : 'pdf',
-                                        'width'         : xobject[3].width,
-                                        'height'        : xobject[3].height,
-                                        'colorspace'    : None,
-                                        'xres'          : None,
-                                        'yres'          : None,
-                                        'bpc'           : None,
-                                        'transform'     : fitz.Matrix(CTM[0][0], CTM[0][1], CTM[1][0], CTM[1][1], CTM[2][0], CTM[2][1]),
-                                        'size'          : size,
-                                        'image'         : self.__document.xref_stream_raw(xobject[0])
-                                    }
-                                )
-
-                            CTM = CTMStack.pop()
-                            break 
-        self.__currPageEmbeddedPdfs = sorted(embeddedPdfBlocks, key=lambda x: (x['bbox'][1], x['bbox'][0]))
-
-
-
-    def __getTextPage(self):
-        """
-        Gets current TextPage from current page.
+                elif operator == 'Q':
+                    if CTMStack:
+                        CTM = CTMStack.pop()
+                elif operator == 'cm':
+                    if len(operands) == 6 and all(isinstance(operand, float) for operand in operands):
+                        CTM = content_stream.multiplyMatrices(operands, CTM)
+                elif operator == 'Do':
+                    xobject = xobjects.get(operands[-1]) if operands else None
+                    if xobject == None:
+                        continue
+
+                    formCTM = CTM
+                    if xobject.matrix != None:
+                        formCTM = content_stream.multiplyMatrices(xobject.matrix, CTM)
+
+                    viewMatrix = content_stream.multiplyMatrices(formCTM, pageTransMatrix)
+                    # [ x' y' 1 ] = [ x  y  1 ] * viewMatrix
+                    xobjectBbox = xobject.bbox
+                    blPoint = content_stream.transformPoint(viewMatrix, xobjectBbox.x0, xobjectBbox.y0)
+                    trPoint = content_stream.transformPoint(viewMatrix, xobjectBbox.x1, xobjectBbox.y1)
+
+                    # if pdf image has the same bbox as already found pdf image -> skip (it's the same image)
+                    bbox = fitz.Rect(blPoint[0], trPoint[1], trPoint[0], blPoint[1])
+                    if not self.__isInsideEmbeddedPdf(pageContext, bbox, embeddedPdfBlocks):
+                        embeddedPdfBlocks.append(
+                            {
+                                'type'          : 1,
+                                'bbox'          : bbox,
+                                'ext'           : 'pdf',
+                                'width'         : xobjectBbox.width,
+                                'height'        : xobjectBbox.height,
+                                'colorspace'    : None,
+                                'xres'          : None,
+                                'yres'          : None,
+                                'bpc'           : None,
+                                'transform'     : fitz.Matrix(formCTM),
+                                'size'          : xobject.size,
+                                'xref'          : xobject.xref # stream of the embedded PDF can be read by xref_stream_raw
+                            }
+                        )
+        pageContext.embeddedPdfs = sorted(embeddedPdfBlocks, key=lambda x: (x['bbox'][1], x['bbox'][0]))
+
+
+
+    def __getPageContext(self, pageNumber : int):
+        """
+        Gets context of page from cache of extracted pages, or new context if page is not cached.
+        Contexts are cached with extraction flags (text flags, embedded PDFs as images), because they change extracted dictionary.
+        Findings and annotations of cached context (left by previous pass over the page, see annotate, tiered) are dropped.
+
+        Args:
+            pageNumber (int): Index of page.
+
+        Returns:
+            PageContext: Context of the page.
         """
-        if self.__currTextPage == None:
-            self.__currTextPage = self.__currPage.get_textpage(flags=(fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_PRESERVE_IMAGES)) # include images
+        pageContext = self.__pageCache.get(pageNumber, (self.TEXT_FLAGS, self.__embeddedPdfAsImage))
+        if pageContext == None:
+            return PageContext(self.__document[pageNumber])
+        pageContext.findings = []
+        pageContext.annotations = annotation_batch.AnnotationBatch()
+        return pageContext
 
 
 
-    def __rectRelativePosition(self, rectA, rectB):
+    def __cachePageContext(self, pageContext : PageContext):
         """
-        Determines relative position of two rectangles, top-to-bottom (biggest priority) then left-to-right.
+        Stores context of page in cache of extracted pages (after its artifacts were extracted, so that its size is known).
 
         Args:
-            rectA: One of two rectangles, which position is determined.
-            rectB: One of two rectangles, which position is determined.
+            pageContext (PageContext): Context of page.
+        """
+        self.__pageCache.put(pageContext.page.number, (self.TEXT_FLAGS, self.__embeddedPdfAsImage), pageContext, pageContext.getSize())
 
-        Returns:
-            int: Relative position of two rectangles.
-                -1 -> rectA before rectB,
-                0 -> rectA inside rectB,
-                1 -> rectA after rectB
-        """
-        from .tolerance_float import ToleranceFloat
-        rectA = [ToleranceFloat(rectA[0]), ToleranceFloat(rectA[1]), ToleranceFloat(rectA[2]), ToleranceFloat(rectA[3])]
-        rectB = [ToleranceFloat(rectB[0]), ToleranceFloat(rectB[1]), ToleranceFloat(rectB[2]), ToleranceFloat(rectB[3])]
-
-        if rectA[0]>=rectB[0] and rectA[1]>=rectB[1] and rectA[2]<=rectB[2] and rectA[3]<=rectB[3]:
-            return 0
-        elif rectA[1]<rectB[1]:
-            return -1
-        elif rectA[1]==rectB[1] and rectA[0]<rectB[0]:
-            return -1
-        else:
-            return 1
 
 
+    def __getTextPage(self, pageContext : PageContext):
+        """
+        Gets current TextPage from current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        if pageContext.textPage == None:
+            pageContext.textPage = pageContext.page.get_textpage(flags=self.TEXT_FLAGS)
+
 
-    def __isInsideEmbeddedPdf(self, rect, embeddedPdfs = None):
+
+    def __isInsideEmbeddedPdf(self, pageContext : PageContext, rect, embeddedPdfs = None):
         """
         Determines if specified rectangle is inside any of embedded PDFs on current page.
 
         Args:
+            pageContext (PageContext): Context of checked page.
             rect: Rectangle which position is determined.
-            embeddedPdfs: List of embedded PDFs on current page. If not specified, it will use currPageEmbeddedPdfs.
+            embeddedPdfs: List of embedded PDFs on current page. If not specified, it will use spatial index of embeddedPdfs of page context.
 
         Returns:
             bool: Position of specified rectangle.
         """
-        if embeddedPdfs == None:
-            self.__getPageEmbeddedPdfs()
-            embeddedPdfs = self.__currPageEmbeddedPdfs
-        for embeddedPdfBlock in embeddedPdfs:
-            if self.__rectRelativePosition(rect, embeddedPdfBlock['bbox']) == 0:
-                return True
-        return False
+        if embeddedPdfs != None:
+            for embeddedPdfBlock in embeddedPdfs:
+                if rect_index.rectRelativePosition(rect, embeddedPdfBlock['bbox']) == 0:
+                    return True
+            return False
 
+        if pageContext.embeddedPdfIndex == None:
+            self.__getPageEmbeddedPdfs(pageContext)
+            pageContext.embeddedPdfIndex = rect_index.RectIndex([embeddedPdfBlock['bbox'] for embeddedPdfBlock in pageContext.embeddedPdfs])
+        return pageContext.embeddedPdfIndex.containsRect(rect)
 
 
-    def __replaceBlocksByEmbeddedPdfs(self):
+
+    def __replaceBlocksByEmbeddedPdfs(self, pageContext : PageContext):
         """
         Replaces current dictionary blocks, that belong to embedded PDFs, with image blocks.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
         """
-        self.__getPageEmbeddedPdfs()
-        embeddedPdfBlocks = self.__currPageEmbeddedPdfs.copy()
+        self.__getPageEmbeddedPdfs(pageContext)
+        embeddedPdfBlocks = pageContext.embeddedPdfs.copy()
         if embeddedPdfBlocks:
-            blocks = self.__currDict['blocks']
+            blocks = pageContext.dict['blocks']
             idx = 0
             while idx < len(blocks) and embeddedPdfBlocks:
-                position = self.__rectRelativePosition(blocks[idx]['bbox'], embeddedPdfBlocks[0]['bbox'])
+                position = rect_index.rectRelativePosition(blocks[idx]['bbox'], embeddedPdfBlocks[0]['bbox'])
                 if position == 0:
                         blocks.pop(idx)
                         idx = idx - 1
@@ -493,71 +985,94 @@ class Checker:
 
             for pdfBlock in embeddedPdfBlocks:
                 blocks.append(pdfBlock)
-            self.__currDict['blocks'] = blocks
+            pageContext.dict['blocks'] = blocks
 
 
 
-    def __getPageDictionary(self):
+    def __getPageImageBlocks(self, pageContext : PageContext):
         """
-        Gets current dictionary of current page.
+        Gets image blocks of current page with metadata only (bbox, transform, size, ...), binary data of images are not extracted.
+        Only images lying inside the page are taken, the same as image blocks of "dict" extraction.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+
+        Returns:
+            list: Image blocks in the same format as "dict" extraction, without 'image' key.
         """
-        if self.__currDict == None:
-            self.__getTextPage()
-            self.__currDict = self.__currPage.get_text("dict", textpage=self.__currTextPage, sort=True)
-            if self.__embeddedPdfAsImage:
-                self.__replaceBlocksByEmbeddedPdfs()
+        self.__getDocumentXobjects()
+        if (not pageContext.page.get_images(full=True) and not self.__pageXobjects[pageContext.page.number]
+                and not content_stream.mayContainInlineImage(pageContext.page.read_contents())):
+            # no image XObjects and no inline images (XObjects can contain them too) -> image extraction is skipped
+            return []
 
+        pageRect = pageContext.page.rect
+        blocks = []
+        for imageInfo in pageContext.page.get_image_info():
+            bbox = imageInfo['bbox']
+            if (bbox[0] < bbox[2] and bbox[1] < bbox[3] and pageRect.x0 <= bbox[0] and pageRect.y0 <= bbox[1]
+                    and pageRect.x1 >= bbox[2] and pageRect.y1 >= bbox[3]):
+                blocks.append(dict(imageInfo, type=1))
+        return blocks
 
 
-    def __getPageBorder(self):
-        """
-        Examines current page and determines its left and right border.
 
-        Returns:
-            tuple: Left and right border of examined page in the form of tuple containing two float numbers: (xLeft, xRight).
+    def __getPageDictionary(self, pageContext : PageContext):
         """
-        potentialLeft = []
-        potentialRight = []
-        
-        self.__getPageDictionary()
-        blocks = self.__currDict['blocks']
+        Gets current dictionary of current page. Dictionary is the only text extraction of the page, everything else is derived from it.
+        Every span of the dictionary gets font id (key 'fontId'). Image blocks contain metadata only (see __getPageImageBlocks).
 
-        for block in blocks:
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        if pageContext.dict == None:
+            self.__getTextPage(pageContext)
+            pageContext.dict = pageContext.page.get_text("dict", textpage=pageContext.textPage)
+            pageContext.textBlocks = pageContext.dict['blocks'] # TextPage contains text only
+            for block in pageContext.textBlocks:
+                for line in block['lines']:
+                    for span in line['spans']:
+                        span['fontId'] = self.__getFontId((span['font'], round(span['size'],5), span['flags']))
+            blocks = pageContext.textBlocks + self.__getPageImageBlocks(pageContext)
+            pageContext.dict['blocks'] = sorted(blocks, key=lambda block: (block['bbox'][3], block['bbox'][0])) # same as get_text("dict", sort=True)
+            if self.__embeddedPdfAsImage:
+                self.__replaceBlocksByEmbeddedPdfs(pageContext)
 
-            if block['type'] == 0: 
-                # --- text ---
-                lines = block['lines']
 
-                if len(lines) > 1:  # multiline text
-                    origin_y = -1.0
-                    origin_x = -1.0
 
-                    for line in lines:
-                        if line['spans']:
-                            line_origin = line['spans'][0]['origin']
+    def __getPageBlockFeatures(self, pageContext : PageContext):
+        """
+        Gets features of all blocks of current dictionary (block feature table) and array of their bounding boxes.
 
-                            if line_origin[1] == origin_y:
-                                # not a new line, just tab -> pop previous right border
-                                potentialRight.pop()
-                            else:
-                                potentialLeft.append(line['bbox'][0])
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        if pageContext.blockFeatures == None:
+            self.__getPageDictionary(pageContext)
+            blocks = pageContext.dict['blocks']
+            pageContext.blockFeatures = [BlockFeatures(block) for block in blocks]
+            pageContext.blockBoxes = numpy.array([block['bbox'] for block in blocks], dtype=float).reshape(len(blocks), 4)
 
-                                if line_origin[0] > origin_x and origin_x != -1.0:
-                                    # new paragraph
-                                    potentialRight.pop() #pop the last line in previous paragraph
-                                    potentialLeft.pop() #pop this line -> indent
 
-                                origin_x = line_origin[0]
 
-                            origin_y = line_origin[1]
-                            potentialRight.append(line['bbox'][2])
+    def __getPageBorder(self, pageContext : PageContext):
+        """
+        Examines current page and determines its left and right border.
 
-                    potentialRight.pop() #pop the last line in paragraph
+        Args:
+            pageContext (PageContext): Context of checked page.
 
-            else: #type = 1
-                # --- image ---
-                potentialLeft.append(block['bbox'][0])
-                potentialRight.append(block['bbox'][2])
+        Returns:
+            tuple: Left and right border of examined page in the form of tuple containing two float numbers: (xLeft, xRight).
+        """
+        potentialLeft = []
+        potentialRight = []
+        
+        self.__getPageBlockFeatures(pageContext)
+        for features in pageContext.blockFeatures:
+            # multiline text -> beginnings and ends of lines (without indented and last lines of paragraphs), image -> its sides
+            potentialLeft.extend(features.borderLefts)
+            potentialRight.extend(features.borderRights)
 
         xLeft = -1.0
         if potentialLeft:
@@ -571,38 +1086,43 @@ class Checker:
 
     
 
-    def __getFontIndex(self, fonts : list, font : dict):
+    def __getFontId(self, fontKey : tuple):
         """
-        Finds index of specified font inside a list of fonts.
+        Gets id of font from font interning table of the document. Unknown font is added to the table under lock,
+        key is added to __fontKeys before its id is published in __fontIds, so known fonts are read without lock.
 
         Args:
-            fonts (list): List of fonts where search occurs.
-            font (dict): Searched font.
+            fontKey (tuple): Font as (name, size rounded to 5 decimal places, flags).
 
         Returns:
-            int|None: Index of specified font. If not found returns None.
-        """
-        for i in range(len(fonts)):
-            currFont = fonts[i]
-            if not isinstance(currFont,dict):
-                currFont = fonts[i][0]
-            if ((currFont['name'] == font['name']) and (currFont['size'] == font['size']) and (currFont['flags'] == font['flags'])):
-                return i
-        return None
+            int: Id of the font.
+        """
+        fontId = self.__fontIds.get(fontKey)
+        if fontId == None:
+            with self.__fontLock:
+                fontId = self.__fontIds.get(fontKey) # added by another thread meanwhile
+                if fontId == None:
+                    fontId = len(self.__fontKeys)
+                    self.__fontKeys.append(fontKey)
+                    self.__fontIds[fontKey] = fontId
+        return fontId
 
     
 
-    def __getPageUsedFonts(self):
+    def __getPageUsedFonts(self, pageContext : PageContext):
         """
-        Returns a list of all fonts used on current page.
+        Counts characters of all fonts used on current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
 
         Returns:
-            list: List of all used font. One element = ({'name', 'size', 'flags'}, total_character_count).
+            Counter: Total character count of every used font (by font id), in order of first usage.
         """
-        fonts = []
+        fonts = Counter()
 
-        self.__getPageDictionary()
-        blocks = self.__currDict['blocks']
+        self.__getPageDictionary(pageContext)
+        blocks = pageContext.dict['blocks']
 
         for block in blocks:
             if block['type'] == 0: 
@@ -611,85 +1131,117 @@ class Checker:
                 for line in lines:
                     spans = line['spans']
                     for span in spans:
-                        font = dict(name=span['font'], size=round(span['size'],5), flags=span['flags'])
-                        index = self.__getFontIndex(fonts,font)
-                        if index != None:
-                            fonts[index] = (font, fonts[index][1] + len(span['text']))
-                        else:
-                            fonts.append((font,len(span['text'])))
+                        fonts[span['fontId']] += len(span['text'])
         return fonts
 
     
 
-    def __getMostUsedFontIndex(self, fonts : list):
+    def __getMostUsedFontId(self, fonts : Counter):
         """
-        Finds index of the most used font in list of fonts.
+        Finds the most used font. If more fonts are used the most, the first one is chosen.
 
         Args:
-            fonts (list): List of fonts. One element should be (font, total_character_count).
+            fonts (Counter): Total character count of every font (by font id).
 
         Returns:
-            int: Index of most used font.
+            int: Id of most used font.
         """
-        index_mostUsedFont = 0
-        for index in range(1,len(fonts)):
-            if fonts[index][1] > fonts[index_mostUsedFont][1]:
-                index_mostUsedFont = index
-        return index_mostUsedFont
+        return max(fonts, key=fonts.get)
 
     
 
-    def __getPageRegularFont(self):
+    def __getPageRegularFont(self, pageContext : PageContext):
         """
         Gets general font used on current page.
 
+        Args:
+            pageContext (PageContext): Context of checked page.
+
         Returns:
-            tuple: Regular font of current page with the layout: ({'name', 'size', 'flags'}, total_character_count)
+            tuple: Regular font of current page with the layout: (font_id, total_character_count)
         """
-        fonts = self.__getPageUsedFonts() 
+        fonts = self.__getPageUsedFonts(pageContext) 
         if not fonts:
             return None
-        return fonts[self.__getMostUsedFontIndex(fonts)]
+        fontId = self.__getMostUsedFontId(fonts)
+        return (fontId, fonts[fontId])
 
     
 
-    def __getDocInfo(self, findBorder : bool, findRegularFont : bool):
+    def __isSamplePage(self, pageContext : PageContext):
         """
-        Scans random pages of document and determines general information of the document needed for some checks.
+        Determines if current page is representative for general information of the document.
+        Pages with table of content and pages without multiline text (title page, figure pages) are not.
 
         Args:
-            findBorder (bool): Determines if border of page will be searched for.
-            findRegularFont (bool): Determines if regular font of document will be searched for.
-        """
-        right_borders = []
-        left_borders = []
-        regularFonts = []
-        rnd_page_i = self.__randomPagesIndex()
+            pageContext (PageContext): Context of checked page.
 
-        self.__resetCurrVars()
-
-        for i in rnd_page_i:
-            self.__currPage = self.__document[i]
+        Returns:
+            bool: True -> page can be used in the sample.
+        """
+        self.__getPageBlockFeatures(pageContext)
+        blocks = pageContext.dict['blocks']
+        if not blocks or self.__getIsContentPage(blocks[0], False):
+            return False
+        return any(features.isText and features.borderLefts for features in pageContext.blockFeatures)
 
-            if findBorder:
-                leftX, rightX = self.__getPageBorder()
-                right_borders.append(rightX)
-                left_borders.append(leftX)
 
-            if findRegularFont:
-                font = self.__getPageRegularFont()
-                if font:
-                    index = self.__getFontIndex(regularFonts, font[0])
-                    if index != None:
-                        regularFonts[index] = (font[0], regularFonts[index][1] + font[1])
-                    else:
-                        regularFonts.append(font)
 
-            self.__resetCurrVars()
+    def __getDocInfo(self, findBorder : bool, findRegularFont : bool, watchdog : page_watchdog.PageWatchdog = None):
+        """
+        Samples pages of document and determines general information of the document needed for some checks.
+        Pages are sampled in batches until medians of borders and regular font of the document stop changing (see SAMPLE_INITIAL_CNT, SAMPLE_BATCH_CNT),
+        at most RND_PAGE_CNT pages are used. All examined pages are kept in cache of extracted pages for the main pass.
+        If watchdog is given, pages are examined in its supervised worker process instead (see __getWatchedPageSample) and page exceeding its time budget is not sampled.
 
+        Args:
+            findBorder (bool): Determines if border of page will be searched for.
+            findRegularFont (bool): Determines if regular font of document will be searched for.
+            watchdog (page_watchdog.PageWatchdog, optional): Supervised worker process examining pages. Defaults to None (pages are examined in this process).
+        """
+        samples = []
+        rejectedPages = [] # used in the sample only if no other page can be used
+        sampleSize = self.SAMPLE_INITIAL_CNT
+        previousInfo = None
+
+        for i in self.__getSampleCandidates():
+            if watchdog == None:
+                pageContext = self.__getPageContext(i)
+                isSamplePage = self.__isSamplePage(pageContext)
+                self.__cachePageContext(pageContext)
+                sample = None # found only if the page is used
+            else:
+                pageContext = None
+                isSamplePage, sample = self.__getWatchedPageSample(watchdog, i, findBorder, findRegularFont)
+                if isSamplePage == None:
+                    continue
+            if not isSamplePage:
+                rejectedPages.append((i, pageContext, sample))
+                if len(rejectedPages) >= self.RND_PAGE_CNT:
+                    break
+                continue
+
+            self.sampledPages.append(i)
+            samples.append(sample if sample != None else self.__getPageSample(pageContext, findBorder, findRegularFont))
+            if len(samples) < sampleSize:
+                continue
+            info = self.__getSampleInfo(samples)
+            if previousInfo != None and info[2] == previousInfo[2] and abs(info[0] - previousInfo[0]) <= self.SAMPLE_BORDER_TOLERANCE \
+                    and abs(info[1] - previousInfo[1]) <= self.SAMPLE_BORDER_TOLERANCE:
+                # stable -> no more pages are needed
+                break
+            if len(samples) >= self.RND_PAGE_CNT:
+                break
+            previousInfo = info
+            sampleSize = min(sampleSize + self.SAMPLE_BATCH_CNT, self.RND_PAGE_CNT)
+
+        if not samples:
+            for pageNumber, pageContext, sample in rejectedPages[:self.RND_PAGE_CNT]:
+                self.sampledPages.append(pageNumber)
+                samples.append(sample if sample != None else self.__getPageSample(pageContext, findBorder, findRegularFont))
+
+        borderLeft, borderRight, regularFontId = self.__getSampleInfo(samples)
         if findBorder:
-            borderLeft = median(left_borders)
-            borderRight = median(right_borders)
             if (borderLeft < borderRight) and (borderLeft != -1.0) and (borderRight != -1.0):
                 self.__border = (borderLeft, borderRight)
             else:
@@ -704,221 +1256,498 @@ class Checker:
                     self.__border = (pageBound[0], pageBound[2])
 
         if findRegularFont:
-            self.__regularFont = regularFonts[self.__getMostUsedFontIndex(regularFonts)][0] if regularFonts else None
+            self.__regularFontId = regularFontId
 
 
 
-    def __getPixmap(self):
+    def __getPageSample(self, pageContext : PageContext, findBorder : bool, findRegularFont : bool):
         """
-        Gets current Pixmap from current page.
+        Gets general information of one sampled page.
+
+        Args:
+            pageContext (PageContext): Context of sampled page.
+            findBorder (bool): Determines if border of page will be searched for.
+            findRegularFont (bool): Determines if regular font of page will be searched for.
+
+        Returns:
+            tuple: (xLeft, xRight, regularFont), borders are None if not searched for, regularFont is (font_id, total_character_count) or None.
         """
-        if self.__currPixmap == None:
-            self.__currPixmap = self.__currPage.get_pixmap()
+        xLeft, xRight = self.__getPageBorder(pageContext) if findBorder else (None, None)
+        regularFont = self.__getPageRegularFont(pageContext) if findRegularFont else None
+        return (xLeft, xRight, regularFont)
 
 
 
-    def __getPageRightOverflow(self):
+    def __getSampleInfo(self, samples : list):
         """
-        Scans a page and returns where overflow happened on the right side of current page.
+        Combines general information of sampled pages: medians of borders and the most used regular font.
+
+        Args:
+            samples (list): Information of sampled pages, see __getPageSample.
 
         Returns:
-            list: List of rectangles where overflow was detected.
+            tuple: (borderLeft, borderRight, regularFontId), borders are -1.0 and font id is None if not found.
         """
-        self.__getPixmap()
-        overflow_rects = [None]
-        r_border = round(self.__border[1])
-        y = 0
-        while y < self.__currPixmap.height:
-            x = self.__currPixmap.width - 1
-            while x > r_border:
-                if self.__currPixmap.pixel(x,y) != self.WHITE:
-
-                    if overflow_rects[-1] == None:
-                        # previous line was only WHITE
-                        overflow_rects.pop()
-                        overflow_rects.append([r_border+1,y-self.HIGHLIGHT_PADDING,x+self.HIGHLIGHT_PADDING,y+self.HIGHLIGHT_PADDING])
-                    else: 
-                        # previous line had overflow -> merge rectanles
-                        overflow_rects[-1][2] = max(overflow_rects[-1][2],x+self.HIGHLIGHT_PADDING)
-                        overflow_rects[-1][3] = y+self.HIGHLIGHT_PADDING
-                    break
-                x = x - 1
-            
-            if x == r_border and overflow_rects[-1] != None:
-                # if whole line was WHITE and previous line wasn't
-                overflow_rects.append(None)
-            y = y + 1
-
-        if overflow_rects[-1] == None:
-            overflow_rects.pop()
-        
-        return overflow_rects
+        lefts = [sample[0] for sample in samples if sample[0] != None]
+        rights = [sample[1] for sample in samples if sample[1] != None]
+        regularFonts = Counter()
+        for sample in samples:
+            if sample[2]:
+                regularFonts[sample[2][0]] += sample[2][1]
+        return (median(lefts) if lefts else -1.0, median(rights) if rights else -1.0,
+                self.__getMostUsedFontId(regularFonts) if regularFonts else None)
 
 
 
-    def __getPageLeftOverflow(self):
+    def getPageSample(self, pageNumber : int, settings : dict):
         """
-        Scans a page and returns where overflow happened on the left side of current page.
+        Examines one page for general information of the document in supervised worker process (see __getWatchedPageSample).
+        Regular font is identified by its key, because ids of fonts are different in every process.
+
+        Args:
+            pageNumber (int): Index of examined page.
+            settings (dict): Settings of sampling ("embeddedPdfAsImage", "findBorder", "findRegularFont").
 
         Returns:
-            list: List of rectangles where overflow was detected.
+            tuple: (whether the page can be used in the sample (see __isSamplePage), information of the page (see __getPageSample) with font key instead of font id).
         """
-        self.__getPixmap()
-        overflow_rects = [None]
-        l_border = round(self.__border[0]) - 1
-        y = 0
-        while y < self.__currPixmap.height:
-            x = 0
-            while x < l_border:
-                if self.__currPixmap.pixel(x,y) != self.WHITE:
-
-                    if overflow_rects[-1] == None:
-                        # previous line was only WHITE
-                        overflow_rects.pop()
-                        overflow_rects.append([x-self.HIGHLIGHT_PADDING,y-self.HIGHLIGHT_PADDING,l_border,y+self.HIGHLIGHT_PADDING])
-                    else: 
-                        # previous line had overflow -> merge rectanles
-                        overflow_rects[-1][0] = min(overflow_rects[-1][0],x-self.HIGHLIGHT_PADDING)
-                        overflow_rects[-1][3] = y+self.HIGHLIGHT_PADDING
-                    break
-                x = x + 1
-            
-            if x == l_border and overflow_rects[-1] != None:
-                # if whole line was WHITE and previous line wasn't
-                overflow_rects.append(None)
-            y = y + 1
-
-        if overflow_rects[-1] == None:
-            overflow_rects.pop()
-        
-        return overflow_rects
+        self.__embeddedPdfAsImage = settings['embeddedPdfAsImage']
+        pageContext = PageContext(self.__document[pageNumber])
+        isSamplePage = self.__isSamplePage(pageContext)
+        xLeft, xRight, regularFont = self.__getPageSample(pageContext, settings['findBorder'], settings['findRegularFont'])
+        if regularFont != None:
+            regularFont = (self.__fontKeys[regularFont[0]], regularFont[1])
+        return (isSamplePage, (xLeft, xRight, regularFont))
 
 
 
-    def __overflowPageCheck(self):
+    def __getWatchedPageSample(self, watchdog : page_watchdog.PageWatchdog, pageNumber : int, findBorder : bool, findRegularFont : bool):
         """
-        Check for overflow on left and right side of current page. Highlights all spaces where overflow occurred.
+        Examines one page for general information of the document in supervised worker process with time budget.
+
+        Args:
+            watchdog (page_watchdog.PageWatchdog): Supervised worker process.
+            pageNumber (int): Index of examined page.
+            findBorder (bool): Determines if border of page will be searched for.
+            findRegularFont (bool): Determines if regular font of page will be searched for.
+
+        Returns:
+            tuple: (whether the page can be used in the sample, information of the page (see __getPageSample)), (None, None) if the page exceeded time budget or crashed.
         """
-        overflow_rects = self.__getPageRightOverflow()
-        self.__highlight(overflow_rects,self.HIGH_RED)
-        self.__overflowLine(self.__border[1], overflow_rects)
-        if(overflow_rects):
-            self.mistakes_found = True
-            for rect in overflow_rects:
-                self.typographyMistakes.addMistake(TypographyMistakes.MistakeType.BORDER, self.__currPage.number+1)
-        overflow_rects = self.__getPageLeftOverflow()
-        self.__highlight(overflow_rects,self.HIGH_RED)
-        self.__overflowLine(self.__border[0], overflow_rects)
-        if(overflow_rects):
-            self.mistakes_found = True
-            for rect in overflow_rects:
-                self.typographyMistakes.addMistake(TypographyMistakes.MistakeType.BORDER, self.__currPage.number+1)
+        watchdog.submit(samplePage, pageNumber, {"embeddedPdfAsImage" : self.__embeddedPdfAsImage, "findBorder" : findBorder, "findRegularFont" : findRegularFont})
+        result, skipReason = watchdog.getResult()
+        if skipReason != None:
+            return (None, None)
+        isSamplePage, (xLeft, xRight, regularFont) = result
+        if regularFont != None:
+            regularFont = (self.__getFontId(regularFont[0]), regularFont[1])
+        return (isSamplePage, (xLeft, xRight, regularFont))
 
 
 
-    def __searchForAndHighlight(self, searchFor : string, popupText : string, popupTitle:string = "Chyba / Error", highlightColor:tuple = HIGH_RED):
+    def getPageTriage(self, pageNumber : int):
         """
-        Searches for searchFor expression on current page and highlights all occurrences.
+        Classifies one page by triage in supervised worker process (see __getWatchedPageTriage).
 
         Args:
-            searchFor (string): Expression that will be searched for.
-            popupText (string): Text that will be shown in the pop-up annotation attached to highlight annotation.
-            popupTitle (string, optional): Title of the pop-up annotation attached to highlight annotation. Defaults to "Chyba / Error".
-            highlightColor (tuple, optional): RGB representation of highlight color. Defaults to HIGH_RED.
+            pageNumber (int): Index of examined page.
+
+        Returns:
+            document_triage.PageTriage: Classification of the page.
         """
-        self.__getTextPage()
-        rects = self.__currPage.search_for(searchFor, textpage=self.__currTextPage)
-        for rect in rects:
-            if rect.is_valid and rect[0] < rect[2] and rect[1] < rect[3]:
-                if self.__embeddedPdfAsImage:
-                    if self.__isInsideEmbeddedPdf(rect):
-                        continue
-                self.mistakes_found = True
-                self.__highlight(rect, highlightColor, popupText, popupTitle)
+        return document_triage.PageTriage(self.__document[pageNumber])
+
 
 
-    def __searchForMistakeAndHighlight(self, searchFor : string, mistakeType : TypographyMistakes.MistakeType):
+    def __getWatchedPageTriage(self, watchdog : page_watchdog.PageWatchdog, pageNumber : int):
         """
-        Searches for searchFor expression on current page and highlights all occurrences.
-        If mistakeType is severe, it will be highlighted in red, otherwise in orange.
-        Popup text will be set according to mistakeType.
-        Popup title will be set according to severity of mistakeType.
-        All mistakes will be added to typographyMistakes.
+        Classifies one page by triage in supervised worker process with time budget.
 
         Args:
-            searchFor (string): Expression that will be searched for.
-            mistakeType (TypographyMistakes.MistakeType): Type of the mistake that will be searched for.
-        """
-        popupText = mistakeType.popupText()
-        popupTitle = mistakeType.popupTitle()
-        highlightColor = mistakeType.highlightColor()
+            watchdog (page_watchdog.PageWatchdog): Supervised worker process.
+            pageNumber (int): Index of examined page.
 
-        self.__getTextPage()
-        rects = self.__currPage.search_for(searchFor, textpage=self.__currTextPage)
-        for rect in rects:
-            if rect.is_valid and rect[0] < rect[2] and rect[1] < rect[3]:
-                if self.__embeddedPdfAsImage:
-                    if self.__isInsideEmbeddedPdf(rect):
-                        continue
-                self.mistakes_found = True
-                self.typographyMistakes.addMistake(mistakeType, self.__currPage.number+1)
-                self.__highlight(rect, highlightColor, popupText, popupTitle)
+        Returns:
+            document_triage.PageTriage: Classification of the page, not examined page (taken as born-digital) if the page exceeded time budget or crashed.
+        """
+        watchdog.submit(triagePage, pageNumber)
+        pageTriage, skipReason = watchdog.getResult()
+        return pageTriage if skipReason == None else document_triage.PageTriage(None)
 
 
 
-    def __hyphenPageCheck(self):
+    def __getPixmap(self, pageContext : PageContext):
         """
-        Check for wrong usage of hyphen on current page. Highlights all bad usages.
+        Gets current Pixmap from current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
         """
-        self.__searchForMistakeAndHighlight(" - ", TypographyMistakes.MistakeType.HYPHEN)
+        if pageContext.pixmap == None:
+            pageContext.pixmap = pageContext.page.get_pixmap()
 
 
 
-    def __doubleQuestionMarkPageCheck(self):
-        """
-        Check for missing references on current page, which are indicated by '??'. Highlights all missing references.
+    def __getMarginPixmap(self, pageContext : PageContext, x0 : int, x1 : int):
         """
-        self.__searchForMistakeAndHighlight("??", TypographyMistakes.MistakeType.BAD_REFERENCE)
+        Renders only a vertical band of current page, used instead of whole Pixmap when only margin is scanned.
 
+        Args:
+            pageContext (PageContext): Context of checked page.
+            x0 (int): Left coordinate of the band.
+            x1 (int): Right coordinate of the band.
 
+        Returns:
+            fitz.Pixmap|None: Pixmap of the band positioned in page coordinates. None if the band is empty.
+        """
+        pageRect = pageContext.page.rect.irect
+        clip = fitz.IRect(max(x0, pageRect.x0), pageRect.y0, min(x1, pageRect.x1), pageRect.y1)
+        if clip.is_empty:
+            return None
+        return pageContext.page.get_pixmap(clip=clip)
+
+
+
+    def __isWhiteColor(self, color : tuple):
+        """
+        Determines if color (as used by PyMuPDF drawings) is white.
+
+        Args:
+            color (tuple): Color in gray (1 value), RGB (3 values) or CMYK (4 values) format with values from 0 to 1.
+
+        Returns:
+            bool: True -> color is white.
+        """
+        if len(color) == 4:
+            return all(value == 0.0 for value in color)
+        return all(value == 1.0 for value in color)
+
+
+
+    def __pageNeedsRaster(self, pageContext : PageContext):
+        """
+        Determines if current page contains content without reliable bounding boxes (shadings, Type3 fonts), which can be checked for overflow only in rendered page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+
+        Returns:
+            bool: True -> overflow of current page has to be found in rendered page.
+        """
+        for font in pageContext.page.get_fonts(full=True):
+            # font = (xref, ext, type, basefont, name, encoding, referencer)
+            if font[2] == "Type3":
+                return True
+
+        for key in ("Resources/Shading", "Resources/Pattern"):
+            if self.__document.xref_get_key(pageContext.page.xref, key)[0] != "null":
+                return True
+
+        self.__getDocumentXobjects()
+        return any(self.__xobjectInfos[xref].hasPatterns for _, xref, _ in self.__pageXobjects[pageContext.page.number])
+
+
+
+    def __getPageContentBoxes(self, pageContext : PageContext):
+        """
+        Updates contentBoxes of page context with bounding boxes of text spans, images and drawings on current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        if pageContext.contentBoxes != None:
+            return
+
+        self.__getPageDictionary(pageContext)
+        pageRect = pageContext.page.rect
+        boxes = []
+        for block in pageContext.dict['blocks']:
+            if block['type'] == 0:
+                # --- text ---
+                for line in block['lines']:
+                    for span in line['spans']:
+                        if span['text'].strip():
+                            boxes.append(fitz.Rect(span['bbox']))
+            else:
+                # --- image ---
+                boxes.append(fitz.Rect(block['bbox']))
+
+        for drawing in pageContext.page.get_drawings():
+            colors = [color for color in (drawing.get('color'), drawing.get('fill')) if color]
+            if not colors or all(self.__isWhiteColor(color) for color in colors):
+                continue # invisible on white paper
+            rect = fitz.Rect(drawing['rect'])
+            if drawing.get('color') and drawing.get('width'):
+                rect = rect + (-drawing['width']/2, -drawing['width']/2, drawing['width']/2, drawing['width']/2)
+            boxes.append(rect)
+
+        pageContext.contentBoxes = []
+        for box in boxes:
+            box = box & pageRect
+            if not box.is_empty:
+                pageContext.contentBoxes.append(box)
+
+
+
+    def __getAdaptiveOverflowRects(self, pageContext : PageContext, x0 : int, x1 : int, scanFunction, border : int):
+        """
+        Finds overflow in a vertical band of current page in two passes. First the band is rendered in grayscale with low resolution
+        to find rows containing anything. Only those rows are then rendered in full resolution and scanned by scanFunction.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            x0 (int): Left coordinate of the band.
+            x1 (int): Right coordinate of the band.
+            scanFunction: overflow_scan.getRightOverflowRects or overflow_scan.getLeftOverflowRects.
+            border (int): Border passed to scanFunction.
+
+        Returns:
+            list: List of rectangles where overflow was detected.
+        """
+        pageRect = pageContext.page.rect.irect
+        band = fitz.IRect(max(x0, pageRect.x0), pageRect.y0, min(x1, pageRect.x1), pageRect.y1)
+        if band.is_empty:
+            return []
+
+        zoom = self.__adaptiveDpi / 72.0
+        lowPixmap = pageContext.page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False, clip=band)
+        pageContext.renderedBytes += len(lowPixmap.samples_mv)
+        candidates = overflow_scan.getCandidateBands(lowPixmap, zoom, (255,), self.ADAPTIVE_MERGE_GAP)
+        del lowPixmap
+
+        overflow_rects = []
+        for y0, y1 in candidates:
+            clip = fitz.IRect(band.x0, int(y0), band.x1, int(y1) + 1) & band
+            if clip.is_empty:
+                continue
+            pixmap = pageContext.page.get_pixmap(colorspace=fitz.csGRAY, alpha=False, clip=clip)
+            pageContext.renderedBytes += len(pixmap.samples_mv)
+            overflow_rects.extend(scanFunction(pixmap, border, self.HIGHLIGHT_PADDING, (255,), 255 - self.__nearWhiteThreshold))
+        return overflow_rects
+
+
+
+    def __getPageRightOverflow(self, pageContext : PageContext):
+        """
+        Scans a page and returns where overflow happened on the right side of current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+
+        Returns:
+            list: List of rectangles where overflow was detected.
+        """
+        r_border = round(self.__border[1])
+        if self.__overflowEngine == OverflowEngine.GEOMETRY and not self.__pageNeedsRaster(pageContext):
+            self.__getPageContentBoxes(pageContext)
+            return overflow_scan.getRightOverflowRectsFromBoxes(pageContext.contentBoxes, r_border, self.HIGHLIGHT_PADDING)
+
+        if self.__overflowEngine == OverflowEngine.ADAPTIVE:
+            return self.__getAdaptiveOverflowRects(pageContext, r_border+1, pageContext.page.rect.irect.x1, overflow_scan.getRightOverflowRects, r_border)
+
+        if self.__overflowEngine in (OverflowEngine.MARGIN_CLIP, OverflowEngine.GEOMETRY):
+            pixmap = self.__getMarginPixmap(pageContext, r_border+1, pageContext.page.rect.irect.x1)
+            if pixmap == None:
+                return []
+            return overflow_scan.getRightOverflowRects(pixmap, r_border, self.HIGHLIGHT_PADDING, self.WHITE)
+
+        self.__getPixmap(pageContext)
+        if self.__overflowEngine == OverflowEngine.PIXEL:
+            return overflow_scan.getRightOverflowRectsPixelwise(pageContext.pixmap, r_border, self.HIGHLIGHT_PADDING, self.WHITE)
+        return overflow_scan.getRightOverflowRects(pageContext.pixmap, r_border, self.HIGHLIGHT_PADDING, self.WHITE)
+
+
+
+    def __getPageLeftOverflow(self, pageContext : PageContext):
+        """
+        Scans a page and returns where overflow happened on the left side of current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+
+        Returns:
+            list: List of rectangles where overflow was detected.
+        """
+        l_border = round(self.__border[0]) - 1
+        if self.__overflowEngine == OverflowEngine.GEOMETRY and not self.__pageNeedsRaster(pageContext):
+            self.__getPageContentBoxes(pageContext)
+            return overflow_scan.getLeftOverflowRectsFromBoxes(pageContext.contentBoxes, l_border, self.HIGHLIGHT_PADDING)
+
+        if self.__overflowEngine == OverflowEngine.ADAPTIVE:
+            return self.__getAdaptiveOverflowRects(pageContext, pageContext.page.rect.irect.x0, l_border, overflow_scan.getLeftOverflowRects, l_border)
+
+        if self.__overflowEngine in (OverflowEngine.MARGIN_CLIP, OverflowEngine.GEOMETRY):
+            pixmap = self.__getMarginPixmap(pageContext, pageContext.page.rect.irect.x0, l_border)
+            if pixmap == None:
+                return []
+            return overflow_scan.getLeftOverflowRects(pixmap, l_border, self.HIGHLIGHT_PADDING, self.WHITE)
+
+        self.__getPixmap(pageContext)
+        if self.__overflowEngine == OverflowEngine.PIXEL:
+            return overflow_scan.getLeftOverflowRectsPixelwise(pageContext.pixmap, l_border, self.HIGHLIGHT_PADDING, self.WHITE)
+        return overflow_scan.getLeftOverflowRects(pageContext.pixmap, l_border, self.HIGHLIGHT_PADDING, self.WHITE)
+
+
+
+    def __overflowPageCheck(self, pageContext : PageContext):
+        """
+        Check for overflow on left and right side of current page. Highlights all spaces where overflow occurred.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        start = time.perf_counter()
+        overflow_rects = self.__getPageRightOverflow(pageContext)
+        self.__highlight(pageContext, overflow_rects,self.HIGH_RED)
+        self.__overflowLine(pageContext, self.__border[1], overflow_rects)
+        if(overflow_rects):
+            self.mistakes_found = True
+            for rect in overflow_rects:
+                self.__addMistake(pageContext, TypographyMistakes.MistakeType.BORDER, rect)
+        overflow_rects = self.__getPageLeftOverflow(pageContext)
+        self.__highlight(pageContext, overflow_rects,self.HIGH_RED)
+        self.__overflowLine(pageContext, self.__border[0], overflow_rects)
+        if(overflow_rects):
+            self.mistakes_found = True
+            for rect in overflow_rects:
+                self.__addMistake(pageContext, TypographyMistakes.MistakeType.BORDER, rect)
+
+        if self.__overflowEngine == OverflowEngine.ADAPTIVE:
+            pageRect = pageContext.page.rect.irect
+            fullPageBytes = pageRect.width * pageRect.height * len(self.WHITE) # RGB pixmap of whole page used by OverflowEngine.NUMPY
+            pageContext.overflowScanInfo = {
+                "page" : pageContext.page.number+1,
+                "time" : round(time.perf_counter() - start, 6),
+                "renderedBytes" : pageContext.renderedBytes,
+                "fullPageBytes" : fullPageBytes,
+                "savedBytes" : fullPageBytes - pageContext.renderedBytes
+            }
+
+
+
+    def __getPageCharIndex(self, pageContext : PageContext):
+        """
+        Gets character index of current page, built from text blocks of the dictionary (without bounding boxes of characters).
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        if pageContext.charIndex == None:
+            self.__getPageDictionary(pageContext)
+            pageContext.charIndex = text_scan.CharIndex(pageContext.textBlocks)
+
+
+
+    def __getPageTextFindings(self, pageContext : PageContext):
+        """
+        Scans text of current page for all TEXT_RULES at once and saves matches in textFindings of page context.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        if pageContext.textFindings == None:
+            self.__getPageCharIndex(pageContext)
+            pageContext.textFindings = text_scan.scanRules(self.TEXT_RULES_PATTERN, pageContext.charIndex.text)
+
+
+
+    def __highlightMatch(self, pageContext : PageContext, start : int, end : int, highlightColor : tuple, popupText : string, popupTitle : string, mistakeType : TypographyMistakes.MistakeType = None):
+        """
+        Highlights text of current page between offsets of character index. Parts inside embedded PDFs are ignored.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            start (int): Offset of the first character of highlighted text.
+            end (int): Offset after the last character of highlighted text.
+            highlightColor (tuple): RGB representation of highlight color.
+            popupText (string): Text that will be shown in the pop-up annotation attached to highlight annotation.
+            popupTitle (string): Title of the pop-up annotation attached to highlight annotation.
+            mistakeType (TypographyMistakes.MistakeType, optional): Type of the mistake added for every highlighted rectangle. Defaults to None (no mistake is added).
+        """
+        if pageContext.charIndex.boxes == None:
+            rawBlocks = pageContext.page.get_text("rawdict", textpage=pageContext.textPage)['blocks']
+            pageContext.charIndex.addBoxes([block for block in rawBlocks if block['type'] == 0])
+        for rect in pageContext.charIndex.getRects(start, end):
+            rect = fitz.Rect(rect)
+            if rect.is_valid and rect[0] < rect[2] and rect[1] < rect[3]:
+                if self.__embeddedPdfAsImage:
+                    if self.__isInsideEmbeddedPdf(pageContext, rect):
+                        continue
+                self.mistakes_found = True
+                if mistakeType != None:
+                    self.__addMistake(pageContext, mistakeType, rect)
+                self.__highlight(pageContext, rect, highlightColor, popupText, popupTitle)
 
-    def __drawArrow(self,x_pointing:float,x:float,y:float):
+
+
+    def __textRuleMistakeHighlight(self, pageContext : PageContext, mistakeType : TypographyMistakes.MistakeType):
+        """
+        Highlights all matches of text rule of mistakeType (see TEXT_RULES) on current page.
+        If mistakeType is severe, it will be highlighted in red, otherwise in orange.
+        Popup text will be set according to mistakeType.
+        Popup title will be set according to severity of mistakeType.
+        All mistakes will be added to typographyMistakes.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            mistakeType (TypographyMistakes.MistakeType): Type of the mistake that will be highlighted.
+        """
+        self.__getPageTextFindings(pageContext)
+        for start, end in pageContext.textFindings[mistakeType.name]:
+            self.__highlightMatch(pageContext, start, end, mistakeType.highlightColor(), mistakeType.popupText(), mistakeType.popupTitle(), mistakeType)
+
+
+
+    def __hyphenPageCheck(self, pageContext : PageContext):
+        """
+        Check for wrong usage of hyphen on current page. Highlights all bad usages.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        self.__textRuleMistakeHighlight(pageContext, TypographyMistakes.MistakeType.HYPHEN)
+
+
+
+    def __doubleQuestionMarkPageCheck(self, pageContext : PageContext):
         """
-        Draws horizontal arrow annotation.
+        Check for missing references on current page, which are indicated by '??'. Highlights all missing references.
 
         Args:
+            pageContext (PageContext): Context of checked page.
+        """
+        self.__textRuleMistakeHighlight(pageContext, TypographyMistakes.MistakeType.BAD_REFERENCE)
+
+
+
+    def __drawArrow(self, pageContext : PageContext, x_pointing:float,x:float,y:float):
+        """
+        Draws horizontal arrow annotation (added to annotations of the page).
+
+        Args:
+            pageContext (PageContext): Context of checked page.
             x_pointing (float): Start coordinate of arrow. Point of the arrow will be at this coordinate.
             x (float): End coordinate of arrow.
             y (float): Vertical position of arrow.
         """
-        S = 2
-        annot = self.__currPage.add_line_annot(fitz.Point(x_pointing,y), fitz.Point(x,y))
-        annot.set_border(width=1)
-        annot.set_colors(stroke=self.__rgbToPdf(self.RED))
-        annot.update()
-
-        if (x_pointing > x ):
-            S *= -1
-        annot = self.__currPage.add_line_annot(fitz.Point(x_pointing,y), fitz.Point(x_pointing+S*2.5,y-S))
-        annot.set_border(width=1)
-        annot.set_colors(stroke=self.__rgbToPdf(self.RED))
-        annot.update()
-
-        annot = self.__currPage.add_line_annot(fitz.Point(x_pointing,y), fitz.Point(x_pointing+S*2.5,y+S))
-        annot.set_border(width=1)
-        annot.set_colors(stroke=self.__rgbToPdf(self.RED))
-        annot.update()
+        if pageContext.records != None:
+            pageContext.records.append(("arrow", x_pointing, x, y))
+            return
+        pageContext.annotations.addArrow(x_pointing, x, y, self.__rgbToPdf(self.RED))
 
 
 
-    def __imageWidthPageCheck(self):
+    def __imageWidthPageCheck(self, pageContext : PageContext):
         """
         Check width of all images on current page. Marks all images with width 85% to 99% of line width.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
         """
         lineWidth = self.__border[1] - self.__border[0]
         rects = []
-        self.__getPageDictionary()
-        blocks = self.__currDict['blocks']
+        self.__getPageDictionary(pageContext)
+        blocks = pageContext.dict['blocks']
 
         for block in blocks:
             if block['type'] == 1:
@@ -931,24 +1760,28 @@ class Checker:
                 if percentage > 85.0 and percentage < 99.0:
                     rects.append(imageBox)
                     y = (imageBox[3]-imageBox[1])/2.0 + imageBox[1]
-                    self.__drawArrow(self.__border[0],imageBox[0],y)
-                    self.__drawArrow(self.__border[1],imageBox[2],y)
+                    self.__drawArrow(pageContext, self.__border[0],imageBox[0],y)
+                    self.__drawArrow(pageContext, self.__border[1],imageBox[2],y)
         
         if rects:
             self.mistakes_found = True
             for rect in rects:
-                self.typographyMistakes.addMistake(TypographyMistakes.MistakeType.IMAGE_WIDTH, self.__currPage.number+1)
-        self.__overflowLine(self.__border[0],rects)
-        self.__overflowLine(self.__border[1],rects)
+                self.__addMistake(pageContext, TypographyMistakes.MistakeType.IMAGE_WIDTH, rect)
+        self.__overflowLine(pageContext, self.__border[0],rects)
+        self.__overflowLine(pageContext, self.__border[1],rects)
 
 
 
-    def __getIsContentPage(self, pageFirstBlock : dict):
+    def __getIsContentPage(self, pageFirstBlock : dict, isContentPage : bool):
         """
-        Updates isContentPage class variable.
+        Determines if current page contains table of content (TOC).
 
         Args:
             pageFirstBlock (dict): First block from dictionary of current page.
+            isContentPage (bool): Whether previous page contains table of content. Kept if first block does not decide it.
+
+        Returns:
+            bool: Whether current page contains table of content.
         """
         if (pageFirstBlock['type'] == 0): 
             # --- text ---
@@ -959,124 +1792,155 @@ class Checker:
                 if line_spans:
                     text = line_spans[0]['text'].lower().strip()
                     if ( text == "obsah" or text == "contents" or text == "table of contents"):
-                        self.__isContentPage = True
+                        isContentPage = True
                     else:
-                        self.__isContentPage = False
+                        isContentPage = False
+        return isContentPage
 
 
 
-    def __getBibliographyPagePassed(self, pageFirstBlock : dict):
+    def __isBibliographyPage(self, pageContext : PageContext, pageFirstBlock : dict):
         """
-        Updates isBibliographyPage class variable.
+        Determines if current page begins bibliography. Used only for documents without table of content (see __tocSegmentation).
 
         Args:
+            pageContext (PageContext): Context of checked page.
             pageFirstBlock (dict): First block from dictionary of current page.
+
+        Returns:
+            bool: True -> current page begins bibliography.
         """
-        if self.__bibliographyPagePassed:
-            return # if already set to true, Bibliography page passed
-        
         text = ""
-        if self.__toc:
-            pageNum = self.__currPage.number+1
-            for toc_item in self.__toc:
-                # toc_item = [lvl, title, page]
-                if toc_item[2] == pageNum:
-                    text = toc_item[1].lower().strip()
-                    break
-        else:
-            if (pageFirstBlock['type'] == 0): 
-                # --- text ---
-                lines = pageFirstBlock['lines']
-                if (len(lines) == 1):
-                    line_spans = lines[0]['spans']
-                    if line_spans:
-                        text = line_spans[0]['text'].lower().strip()
+        if (pageFirstBlock['type'] == 0): 
+            # --- text ---
+            lines = pageFirstBlock['lines']
+            if (len(lines) == 1):
+                line_spans = lines[0]['spans']
+                if line_spans:
+                    text = line_spans[0]['text'].lower().strip()
                         
-        if ( text == "literatura" or text == "literatúra" or text == "bibliography"):
-            self.__bibliographyPagePassed = True
-        # TODO: rename self.__bibliographyPagePassed -> self.__isBibliographyPageAndAfter :)
-        # else:
-        #     self.__bibliographyPagePassed = False
+        return ( text == "literatura" or text == "literatúra" or text == "bibliography")
 
 
 
-    def __pageBeginsNewChapter(self):
+    def __pageBeginsNewChapter(self, pageContext : PageContext):
         """
-        Determines if current page begins a new chapter. If so, returns True and name of the chapter.
+        Determines if current page begins a new chapter. If so, returns True and name of the chapter. Used only for documents without table of content (see __tocSegmentation).
+
+        Args:
+            pageContext (PageContext): Context of checked page.
         """
         isNewChapter = False
         chapterName = ""
 
-        if self.__toc:
-            pageNum = self.__currPage.number+1
-            for toc in self.__toc:
-                # toc = [lvl, title, page]
-                if toc[2] == pageNum and toc[0] == 1:
-                    isNewChapter = True
-                    chapterName = toc[1]
-                    break
-        else:
-            self.__getPageDictionary()
-            block_count = len(self.__currDict['blocks'])
-
-            if block_count > 0:
-                # if page has any blocks
-                pageFirstBlock = self.__currDict['blocks'][0]
-                if self.__isTitleBlock(0):
-                    if (pageFirstBlock['type'] == 0): 
-                        # --- block with text ---
-                        lines = pageFirstBlock['lines']
-                        if (len(lines) == 1):
-                            line_spans = lines[0]['spans']
-                            line_spans_count = len(line_spans)
-                            if line_spans:
-                                text = line_spans[0]['text'].strip()
-                                text_lower = text.lower()
-
-                                # option 1:
-                                if (re.match("^(kapitola|chapter) \d+$", text_lower)):
-                                    isNewChapter = True
-                                    chapterName = text
-                                    if block_count > 1:
-                                        if self.__isTitleBlock(1):
-                                            chapterName = self.__getBlockText(1)
+        self.__getPageDictionary(pageContext)
+        block_count = len(pageContext.dict['blocks'])
+
+        if block_count > 0:
+            # if page has any blocks
+            pageFirstBlock = pageContext.dict['blocks'][0]
+            if self.__isTitleBlock(pageContext, 0):
+                if (pageFirstBlock['type'] == 0): 
+                    # --- block with text ---
+                    lines = pageFirstBlock['lines']
+                    if (len(lines) == 1):
+                        line_spans = lines[0]['spans']
+                        line_spans_count = len(line_spans)
+                        if line_spans:
+                            text = line_spans[0]['text'].strip()
+                            text_lower = text.lower()
+
+                            # option 1:
+                            if (re.match("^(kapitola|chapter) \d+$", text_lower)):
+                                isNewChapter = True
+                                chapterName = text
+                                if block_count > 1:
+                                    if self.__isTitleBlock(pageContext, 1):
+                                        chapterName = pageContext.blockFeatures[1].text
                                         
-                                # option 2:
-                                elif (re.match("^(kapitola|chapter)$", text_lower)):
-                                    isNewChapter = True
-                                    if line_spans_count > 1:
-                                        text_cont = line_spans[1]['text'].lower().strip()
-                                        if (re.match("^\d+$", text_cont)):
-                                            chapterName = text + " " + text_cont
-                                            if block_count > 1:
-                                                if self.__isTitleBlock(1):
-                                                    chapterName = self.__getBlockText(1)
+                            # option 2:
+                            elif (re.match("^(kapitola|chapter)$", text_lower)):
+                                isNewChapter = True
+                                if line_spans_count > 1:
+                                    text_cont = line_spans[1]['text'].lower().strip()
+                                    if (re.match("^\d+$", text_cont)):
+                                        chapterName = text + " " + text_cont
+                                        if block_count > 1:
+                                            if self.__isTitleBlock(pageContext, 1):
+                                                chapterName = pageContext.blockFeatures[1].text
                                                 
-                                # option 3:
-                                elif (re.match("^\d+ .*$", text_lower)):
-                                    isNewChapter = True
-                                    chapterName = text
-
-                                # option 4:
-                                elif (re.match("^\d+$", text_lower)):
-                                    if line_spans_count > 1:
-                                        text_cont = line_spans[1]['text'].strip()
-                                        if (text_cont != ""):
-                                            isNewChapter = True
-                                            chapterName = text + " " + text_cont
+                            # option 3:
+                            elif (re.match("^\d+ .*$", text_lower)):
+                                isNewChapter = True
+                                chapterName = text
+
+                            # option 4:
+                            elif (re.match("^\d+$", text_lower)):
+                                if line_spans_count > 1:
+                                    text_cont = line_spans[1]['text'].strip()
+                                    if (text_cont != ""):
+                                        isNewChapter = True
+                                        chapterName = text + " " + text_cont
         return (isNewChapter, chapterName)
     
 
 
-    def __updateCurrChapter(self):
+    def __getPageChapterFeatures(self, pageContext : PageContext, findNewChapter : bool = True):
+        """
+        Gathers information of current page needed to update chapters information. Does not depend on previous pages.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            findNewChapter (bool, optional): Determines if beginning of new chapter will be searched for. Defaults to True.
+
+        Returns:
+            dict: Information of current page with keys 'isBibliographyPage', 'isNewChapter', 'chapterName', 'pictures' and 'text'.
+        """
+        self.__getPageDictionary(pageContext)
+        blocks = pageContext.dict['blocks']
+        if self.__tocSegmentation != None:
+            # chapters are given by table of content, dictionary is not needed
+            isBibliographyPage, isNewChapter, chapterName = self.__tocSegmentation[pageContext.page.number]
+            if not findNewChapter or isBibliographyPage:
+                isNewChapter, chapterName = (False, "")
+        else:
+            isBibliographyPage = self.__isBibliographyPage(pageContext, blocks[0]) if blocks else False
+
+            isNewChapter, chapterName = (False, "")
+            if findNewChapter and not isBibliographyPage:
+                isNewChapter, chapterName = self.__pageBeginsNewChapter(pageContext)
+
+        self.__getPageTextContent(pageContext)
+        return {
+            "isBibliographyPage" : isBibliographyPage,
+            "isNewChapter" : isNewChapter,
+            "chapterName" : chapterName,
+            "pictures" : [block['bbox'][0:4] for block in blocks if block['type'] == 1], # --- images ---
+            "text" : pageContext.textContent
+        }
+
+
+
+    def __updateCurrChapter(self, pageContext : PageContext, pageFeatures : dict = None):
         """
         Updates current chapter information with current page information.
         If new chapter begins, creates new chapter and adds it to chaptersInfo.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            pageFeatures (dict, optional): Information of current page from __getPageChapterFeatures. If not specified, it will be gathered.
+
+        Returns:
+            dict: Change of chapter information made by the page (chapter sequence and title, whether the chapter begins on the page, added pictures and characters).
         """
-        self.__getPageDictionary()
-        if self.__currDict['blocks']:
-            self.__getBibliographyPagePassed(self.__currDict['blocks'][0])
+        if pageFeatures == None:
+            pageFeatures = self.__getPageChapterFeatures(pageContext, findNewChapter=not self.__bibliographyPagePassed)
 
+        if pageFeatures['isBibliographyPage']:
+            # TODO: rename self.__bibliographyPagePassed -> self.__isBibliographyPageAndAfter :)
+            self.__bibliographyPagePassed = True
+
+        isNewChapter = False
         if self.__bibliographyPagePassed:
             # bibliography and after
             chapter = self.chaptersInfo[2]
@@ -1087,313 +1951,744 @@ class Checker:
             else:
                 chapter = self.__currChapterInfo
 
-            isNewChapter, chapterName = self.__pageBeginsNewChapter()
-            if isNewChapter:
+            if pageFeatures['isNewChapter']:
                 self.__currChapterInfo = ChapterInfo(
                     sequence= (self.__currChapterInfo.sequence+1) if (self.__currChapterInfo != None) else 1,
-                    title= chapterName,
-                    pages= Pages(self.__currPage.number+1, self.__currPage.number+1),
+                    title= pageFeatures['chapterName'],
+                    pages= Pages(pageContext.page.number+1, pageContext.page.number+1),
                     )
                 self.chaptersInfo[1].append(self.__currChapterInfo)
                 chapter = self.__currChapterInfo
+                isNewChapter = True
 
 
-        chapter.addPage(self.__currPage.number+1)
-        self.__getPageDictionary()
-        blocks = self.__currDict['blocks']
-        for block in blocks:
-            if block['type'] == 1:
-                # --- image ---
-                chapter.addPicture(
-                    bbox=block['bbox'][0:4],
-                    page=self.__currPage.number+1
-                )
+        chapter.addPage(pageContext.page.number+1)
+        for bbox in pageFeatures['pictures']:
+            chapter.addPicture(
+                bbox=bbox,
+                page=pageContext.page.number+1
+            )
 
-        self.__getPageTextContent()
-        chapter.addText(self.__currPageTextContent)
-        
+        chapter.addText(pageFeatures['text'])
+        return {
+            "sequence" : chapter.sequence,
+            "title" : chapter.title,
+            "isNewChapter" : isNewChapter,
+            "pictures" : len(pageFeatures['pictures']),
+            "characters" : len(pageFeatures['text'])
+        }
 
 
-    def __TOCSectionsCheck(self):
+    def __TOCSectionsCheck(self, pageContext : PageContext, isContentPage : bool):
         """
         Checks if current page contains table of content (TOC). Check for headings of level 3 or higher in TOC.
         Highlights all headings of level 3 or higher in TOC.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            isContentPage (bool): Whether previous page contains table of content.
+
+        Returns:
+            bool: Whether current page contains table of content.
         """
-        self.__getPageDictionary()
-        blocks = self.__currDict['blocks']
+        self.__getPageDictionary(pageContext)
+        blocks = pageContext.dict['blocks']
         if blocks:
-            self.__getIsContentPage(blocks[0])
-            if (self.__isContentPage):
-                for block in blocks:
-                    if block['type'] == 0: 
-                        # --- text ---
-                        lines = block['lines']
-                        origin_y = -1.0
-                        for line in lines:
-                            if not line['spans']:
-                                continue
-                            
-                            line_origin = line['spans'][0]['origin']
-                            if line_origin[1] != origin_y:
-                                # new line, not tab -> section number
-                                x = re.search("^(?:\d+|[A-Z])\.(?:\d+\.)+\d+", line['spans'][0]['text']) # example: 3.12.5; C.2.3
-                                if x:
-                                    self.mistakes_found = True
-                                    mistakeType = TypographyMistakes.MistakeType.TOC
-                                    self.typographyMistakes.addMistake(mistakeType, self.__currPage.number+1)
-                                    self.__highlight([line['bbox']], mistakeType.highlightColor(), mistakeType.popupText(), mistakeType.popupTitle())
-                            origin_y = line_origin[1]
+            isContentPage = self.__getIsContentPage(blocks[0], isContentPage)
+            if (isContentPage):
+                self.__getPageBlockFeatures(pageContext)
+                for features in pageContext.blockFeatures:
+                    for line in features.logicalLines:
+                        # new line, not tab -> section number
+                        x = re.search("^(?:\d+|[A-Z])\.(?:\d+\.)+\d+", line['spans'][0]['text']) # example: 3.12.5; C.2.3
+                        if x:
+                            self.mistakes_found = True
+                            mistakeType = TypographyMistakes.MistakeType.TOC
+                            self.__addMistake(pageContext, mistakeType, line['bbox'])
+                            self.__highlight(pageContext, [line['bbox']], mistakeType.highlightColor(), mistakeType.popupText(), mistakeType.popupTitle())
+        return isContentPage
 
 
 
-    def __deleteDuplicate(self, array : list):
+    def __getDehyphenatedBlockText(self, block : dict):
         """
-        Deletes all duplicates inside an array.
+        Extracts text of a text block from dictionary. Lines are separated by new line, whitespace characters are replaced by space
+        and hyphen at the end of line followed by another line of the block is removed together with the new line (dehyphenation).
+        Hyphen at the end of the last line of the block is kept.
 
         Args:
-            array (list): List where duplicates are deleted.
+            block (dict): Text block from dictionary.
 
         Returns:
-            list: List with only unique instances.
+            str: Dehyphenated text of the block.
         """
-        return list(dict.fromkeys(array))
+        text = ""
+        lastLine = len(block['lines']) - 1
+        for lineNumber, line in enumerate(block['lines']):
+            text += "".join(span['text'] for span in line['spans'])
+            if text[-1:] == "-" and lineNumber < lastLine:
+                text = text[:-1]
+            else:
+                text += "\n"
+        return re.sub("[^\S\n]", " ", text.rstrip("\n"))
 
 
 
-    def __getPageTextContent(self):
+    def __getPageTextContent(self, pageContext : PageContext):
         """
-        Scans current page for all text and saves its dehyphenated form in class variable currPageTextContent
+        Saves dehyphenated form of all text on current page in textContent of page context. Text is derived from dictionary of current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
         """
-        if self.__currPageTextContent == None:
-            self.__currPageTextContent = ""
-            textBlocks = self.__currPage.get_text("blocks", flags=fitz.TEXT_PRESERVE_LIGATURES|fitz.TEXT_DEHYPHENATE|fitz.TEXT_MEDIABOX_CLIP)
+        if pageContext.textContent == None:
+            pageContext.textContent = ""
+            self.__getPageDictionary(pageContext)
+            textBlocks = pageContext.textBlocks
             
             if not textBlocks:
                 return
             
             for block in textBlocks[:-1]:
-                text = ""
-                # block = (x0, y0, x1, y1, "lines in the block", block_no, block_type)
-                if block[6] == 0:   # contains text
-                    if self.__embeddedPdfAsImage:
-                        if self.__isInsideEmbeddedPdf([block[0], block[1], block[2], block[3]]):
-                            continue # ignore text inside PDF images
-                    text = block[4]
-                    if text[-1] == "\n":
-                        text = text[:-1]
-                    
-                    self.__currPageTextContent += text.replace("\n"," ") + "\n"
+                if self.__embeddedPdfAsImage:
+                    if self.__isInsideEmbeddedPdf(pageContext, block['bbox']):
+                        continue # ignore text inside PDF images
+                text = self.__getDehyphenatedBlockText(block)
+                pageContext.textContent += text.replace("\n"," ") + "\n"
 
             # last block (possibly page number)
             block = textBlocks[-1]
-            if block[6] == 0: # contains text
-                text = ""
-                isImage = False
-                if self.__embeddedPdfAsImage:
-                    if self.__isInsideEmbeddedPdf([block[0], block[1], block[2], block[3]]):
-                            isImage = True
-                if not isImage:
-                    text = block[4]
-                    if not re.match("^\d*$",text.strip()): # if page number, do not include
-                        if text[-1] == "\n":
-                            text = text[:-1]
-                        self.__currPageTextContent += text.replace("\n"," ") + "\n"
+            isImage = False
+            if self.__embeddedPdfAsImage:
+                if self.__isInsideEmbeddedPdf(pageContext, block['bbox']):
+                        isImage = True
+            if not isImage:
+                text = self.__getDehyphenatedBlockText(block)
+                if not re.match("^\d*$",text.strip()): # if page number, do not include
+                    pageContext.textContent += text.replace("\n"," ") + "\n"
 
 
 
-    def __regexSearchAndHighlight(self, regexSearch : string, popupText:string, popupTitle:string = "Chyba / Error", highlightColor:tuple = HIGH_RED):
+    def __spaceBracketCheck(self, pageContext : PageContext):
         """
-        Searches for regexSearch as a regular expression on current page and highlights all occurrences.
+        Check for missing space before any left bracket on current page. Highlights all missing spaces.
 
         Args:
-            regexSearch (string): Regular expression that will be searched for.
-            popupText (string): Text that will be shown in the pop-up annotation attached to highlight annotation.
-            popupTitle (string, optional): Title of the pop-up annotation attached to highlight annotation. Defaults to "Chyba / Error".
-            highlightColor (tuple, optional): RGB representation of highlight color. Defaults to HIGH_RED.
+            pageContext (PageContext): Context of checked page.
         """
-        self.__getPageTextContent()
-        matchList = re.findall(regexSearch, self.__currPageTextContent)
+        self.__textRuleMistakeHighlight(pageContext, TypographyMistakes.MistakeType.SPACE_BRACKET)
+        
 
-        if matchList:
-            matchList = self.__deleteDuplicate(matchList)
-            for match in matchList:
-                self.__searchForAndHighlight(match, popupText, popupTitle, highlightColor)
+
+    def __isTitleBlock(self, pageContext : PageContext, blockNumber : int):
+        """
+        Examines if a block from current dictionary contains a title of (sub)section. Decision is saved in block feature table.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            blockNumber (int): Index of current dictionary block which is examined.
+
+        Returns:
+            bool: Whether the examined block contains a title of (sub)section.
+        """
+        self.__getPageBlockFeatures(pageContext)
+        features = pageContext.blockFeatures[blockNumber]
+        if features.isTitle == None:
+            features.isTitle = False
+            if features.isText and self.__regularFontId not in features.fontIds:
+                if len(features.fontIds) <= 2:
+                    regularFontSize = self.__fontKeys[self.__regularFontId][1]
+                    features.isTitle = all(self.__fontKeys[fontId][1] >= regularFontSize for fontId in features.fontIds)
+        return features.isTitle
 
 
 
-    def __regexSearchForMistakeAndHighlight(self, regexSearch : string, mistakeType : TypographyMistakes.MistakeType):
+    def __emptySectionCheck(self, pageContext : PageContext, isPreviousTitle : bool):
         """
-        Searches for regexSearch as a regular expression on current page and highlights all occurrences.
+        Check for absence of text between (sub)section titles on current page. Highlights all empty (sub)sections.
 
         Args:
-            regexSearch (string): Regular expression that will be searched for.
-            mistakeType (TypographyMistakes.MistakeType): Type of the mistake that will be searched for.
+            pageContext (PageContext): Context of checked page.
+            isPreviousTitle (bool): Whether the last block of previous page contains a heading.
+
+        Returns:
+            bool: Whether the last block of current page contains a heading.
+        """
+        isPreviousNewChapterTitle=False
+        self.__getPageBlockFeatures(pageContext)
+        blockBoxes = pageContext.blockBoxes
+        for blockNumber in range(len(pageContext.blockFeatures)):
+            if self.__isTitleBlock(pageContext, blockNumber):
+                blockText = pageContext.blockFeatures[blockNumber].text
+                x = re.search("\t\d+$", blockText) # example: Úvod   2
+                if isPreviousTitle and not isPreviousNewChapterTitle and not x:
+                    y1=float(blockBoxes[blockNumber-1][3])
+                    y2=float(blockBoxes[blockNumber][1])
+                    if y1 < y2:
+                        rect = fitz.Rect(self.__border[0],y1,self.__border[1],y2)
+                        if rect.is_valid and rect[0] < rect[2] and rect[1] < rect[3]:
+                            self.mistakes_found = True
+                            mistakeType = TypographyMistakes.MistakeType.EMPTY_SECTION
+                            self.__addMistake(pageContext, mistakeType, rect)
+                            self.__highlight(pageContext, [rect],mistakeType.highlightColor(), mistakeType.popupText(), mistakeType.popupTitle())
+
+                x = re.search("^(?:(?:Kapitola|Chapter) \d+|(?:Příloha|Appendix|Príloha) [A-Z])$", blockText) # example: Kapitola 4; Chapter 4; Appendix D; Príloha D; Příloha D
+                if  x:
+                    isPreviousNewChapterTitle = True
+                else:
+                    isPreviousNewChapterTitle = False
+                isPreviousTitle = True
+            else:
+                isPreviousNewChapterTitle = False
+                isPreviousTitle = False
+        return isPreviousTitle
+
+
+
+    def __createCheckRegistry(self):
         """
-        self.__getPageTextContent()
-        matchList = re.findall(regexSearch, self.__currPageTextContent)
+        Creates registry of all page checks together with artifacts they consume. Checks are run in order of their registration.
+        Artifacts of border check depend on current overflow engine (see OVERFLOW_ENGINE_ARTIFACTS).
+        Border check and image width check are in check_registry.RASTER_TIER (run last in tiered annotating), other checks in check_registry.TEXT_TIER.
+        Border check and image width check check graphics of pages, other checks need text layer (see check_registry.PageCheck.needsTextLayer).
 
-        if matchList:
-            matchList = self.__deleteDuplicate(matchList)
-            for match in matchList:
-                self.__searchForMistakeAndHighlight(match, mistakeType)
+        Returns:
+            check_registry.CheckRegistry: Registry of page checks.
+        """
+        registry = check_registry.CheckRegistry()
+        registry.register(check_registry.PageCheck("borderCheck", self.__overflowPageCheck,
+                                                   [PageArtifact.BORDER] + self.OVERFLOW_ENGINE_ARTIFACTS[self.__overflowEngine], needsBorder=True,
+                                                   tier=check_registry.RASTER_TIER, needsTextLayer=False))
+        registry.register(check_registry.PageCheck("hyphenCheck", self.__hyphenPageCheck, [PageArtifact.TEXT_FINDINGS]))
+        registry.register(check_registry.PageCheck("badReferenceCheck", self.__doubleQuestionMarkPageCheck, [PageArtifact.TEXT_FINDINGS]))
+        registry.register(check_registry.PageCheck("imageWidthCheck", self.__imageWidthPageCheck, [PageArtifact.BORDER, PageArtifact.DICTIONARY], needsBorder=True,
+                                                   tier=check_registry.RASTER_TIER, needsTextLayer=False))
+        registry.register(check_registry.PageCheck("TOCCheck", self.__TOCSectionsCheck, [PageArtifact.DICTIONARY], [PageArtifact.BLOCK_FEATURES], stateful=True))
+        registry.register(check_registry.PageCheck("spaceBracketCheck", self.__spaceBracketCheck, [PageArtifact.TEXT_FINDINGS]))
+        registry.register(check_registry.PageCheck("emptySectionCheck", self.__emptySectionCheck,
+                                                   [PageArtifact.BORDER, PageArtifact.REGULAR_FONT, PageArtifact.BLOCK_FEATURES], stateful=True, firstPage=False))
+        return registry
 
 
 
-    def __spaceBracketCheck(self):
+    def __getEnabledChecks(self, names : list):
         """
-        Check for missing space before any left bracket on current page. Highlights all missing spaces.
+        Gets enabled page checks from registry of current annotating. Checks that need border are left out if border of the document was not found.
+
+        Args:
+            names (list): Names of enabled checks.
+
+        Returns:
+            list[check_registry.PageCheck]: Enabled checks in order in which they are run.
         """
-        # "\S(?:\(|\[|{)" -> for example: "l(", ".[", "5{"
-        self.__regexSearchForMistakeAndHighlight("\S(?:\(|\[|{)", TypographyMistakes.MistakeType.SPACE_BRACKET)
-        
+        return [check for check in self.__checks.getEnabled(names) if not (check.needsBorder and self.borderNotFound)]
 
 
-    def __isTitleBlock(self, blockNumber : int):
+
+    def __getTriagedChecks(self, pageNumber : int, checks : list):
         """
-        Examines if a block from current dictionary contains a title of (sub)section.
+        Gets checks run on page according to triage of the document. On scanned page, checks of graphics of the page are skipped
+        and checks reading text are run only if the page has text layer (see check_registry.PageCheck.needsTextLayer).
 
         Args:
-            blockNumber (int): Index of current dictionary block which is examined.
+            pageNumber (int): Index of the page.
+            checks (list): Enabled checks (check_registry.PageCheck) in order in which they are run.
 
         Returns:
-            bool: Whether the examined block contains a title of (sub)section.
+            list[check_registry.PageCheck]: Checks run on the page in order in which they are run.
         """
-        block = self.__currDict['blocks'][blockNumber]
-        block_info = dict(linesCount=0, fonts=[])
-        if block['type'] == 0:
-            # --- text ---
-            lines = block['lines']
-            block_info['linesCount'] = len(lines)
-            origin_y = -1.0
-            for line in lines:
-                spans = line['spans']
-                if spans:
-                    line_origin = spans[0]['origin']
-                    if line_origin[1] == origin_y:
-                        # not a new line
-                        block_info['linesCount'] -= 1
-                    origin_y = line_origin[1]
-                    
-                    for span in spans:
-                        font = dict(name=span['font'], size=round(span['size'],5), flags=span['flags'])
-                        index = self.__getFontIndex(block_info['fonts'],font)
-                        if index == None:
-                            block_info['fonts'].append(font)
-            
-            if self.__getFontIndex(block_info['fonts'],self.__regularFont) == None:
-                if len(block_info['fonts']) > 2:
-                    return False
-                for font in block_info['fonts']:
-                    if font['size'] < self.__regularFont['size']:
-                        return False
-                return True
-        return False
+        if pageNumber not in self.__scannedPages:
+            return checks
+        textLayer = self.__scannedPages[pageNumber]
+        return [check for check in checks if check.needsTextLayer and textLayer]
+
+
+
+    def __countTriagedChecks(self, pageNumber : int, checks : list):
+        """
+        Counts checks skipped by triage on checked page in triageInfo.
+
+        Args:
+            pageNumber (int): Index of checked page.
+            checks (list): Checks (check_registry.PageCheck) run on every page.
+        """
+        if pageNumber not in self.__scannedPages:
+            return
+        triagedChecks = self.__getTriagedChecks(pageNumber, checks)
+        skippedChecks = self.triageInfo["skippedChecks"]
+        for check in checks:
+            if check not in triagedChecks and (pageNumber != 0 or check.firstPage):
+                skippedChecks[check.name] = skippedChecks.get(check.name, 0) + 1
 
 
 
-    def __getBlockText(self, blockNumber : int):
+    def __addCheckTime(self, pageNumber : int, checkName : str, checkTime : float):
         """
-        Extracts all text from one block in current dictionary.
+        Adds time of a check run on checked page to times of checks, only times on born-digital pages are kept (see __getTriageTimeSaved).
 
         Args:
-            blockNumber (int): Index of block where text will be extracted.
+            pageNumber (int): Index of checked page.
+            checkName (str): Name of the check.
+            checkTime (float): Time of the check in seconds, including extraction of artifacts first needed by the check.
+        """
+        if pageNumber in self.__scannedPages:
+            return
+        checkTimes = self.__checkTimes.setdefault(checkName, [0.0, 0])
+        checkTimes[0] += checkTime
+        checkTimes[1] += 1
+
+
+
+    def __getTriageTimeSaved(self):
+        """
+        Estimates time saved by checks skipped by triage. Skipped checks are not run, time of every skipped check is estimated
+        by its average time on born-digital pages of the annotating multiplied by count of pages on which it was skipped.
+        Check, which was not run on any born-digital page, is not counted.
 
         Returns:
-            str: Text from the block of current dictionary.
+            float: Estimated time in seconds.
         """
-        self.__getPageDictionary()
-        block = self.__currDict['blocks'][blockNumber]
-        text = ""
-        if block['type'] == 0:
-            origin_y = -1.0
-            origin_x = -1.0
-            lines = block['lines']
-            for line in lines:
-                spans = line['spans']
-                if spans:
-                    line_origin = spans[0]['origin']
-                    if line_origin[1] == origin_y:
-                        # not a new line
-                        text = text[:-1] + "\t"
-                    else:
-                        if line_origin[0] > origin_x and origin_x != -1.0:
-                            # new paragraph
-                            text = text[:-1] + "\n"
-                    origin_y = line_origin[1]
-                    origin_x = line_origin[0]
-                    
-                    for span in spans:
-                        text += span['text']
-                    if text[-1] == "-":
-                        text = text[:-1]
-                    else:
-                        text+=" "
-            text=text[:-1]
-        return text
+        timeSaved = 0.0
+        for checkName, skippedPages in self.triageInfo["skippedChecks"].items():
+            if checkName in self.__checkTimes:
+                totalTime, runs = self.__checkTimes[checkName]
+                timeSaved += totalTime / runs * skippedPages
+        return timeSaved
 
 
 
-    def __emptySectionCheck(self):
+    def __prepareArtifacts(self, pageContext : PageContext, artifacts : list):
         """
-        Check for absence of text between (sub)section titles on current page. Highlights all empty (sub)sections.
+        Extracts page artifacts (in given order) that are not extracted yet. Document artifacts are found by __getDocInfo before pages are checked.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            artifacts (list): Required artifacts (PageArtifact) in dependency order.
         """
-        isPreviousNewChapterTitle=False
-        self.__getPageDictionary()
-        blocks = self.__currDict['blocks']
-        for blockNumber in range(len(blocks)):
-            if self.__isTitleBlock(blockNumber):
-                blockText = self.__getBlockText(blockNumber)
-                x = re.search("\t\d+$", blockText) # example: Úvod   2
-                if self.__isPreviousTitle and not isPreviousNewChapterTitle and not x:
-                    y1=blocks[blockNumber-1]['bbox'][3]
-                    y2=blocks[blockNumber]['bbox'][1]
-                    if y1 < y2:
-                        rect = fitz.Rect(self.__border[0],y1,self.__border[1],y2)
-                        if rect.is_valid and rect[0] < rect[2] and rect[1] < rect[3]:
-                            self.mistakes_found = True
-                            mistakeType = TypographyMistakes.MistakeType.EMPTY_SECTION
-                            self.typographyMistakes.addMistake(mistakeType, self.__currPage.number+1)
-                            self.__highlight([rect],mistakeType.highlightColor(), mistakeType.popupText(), mistakeType.popupTitle())
+        for artifact in artifacts:
+            if artifact == PageArtifact.TEXT_PAGE:
+                self.__getTextPage(pageContext)
+            elif artifact == PageArtifact.EMBEDDED_PDFS:
+                if self.__embeddedPdfAsImage:
+                    self.__getPageEmbeddedPdfs(pageContext)
+            elif artifact == PageArtifact.DICTIONARY:
+                self.__getPageDictionary(pageContext)
+            elif artifact == PageArtifact.BLOCK_FEATURES:
+                self.__getPageBlockFeatures(pageContext)
+            elif artifact == PageArtifact.TEXT_CONTENT:
+                self.__getPageTextContent(pageContext)
+            elif artifact == PageArtifact.TEXT_FINDINGS:
+                self.__getPageTextFindings(pageContext)
+            elif artifact == PageArtifact.PIXMAP:
+                self.__getPixmap(pageContext)
 
-                x = re.search("^(?:(?:Kapitola|Chapter) \d+|(?:Příloha|Appendix|Príloha) [A-Z])$", blockText) # example: Kapitola 4; Chapter 4; Appendix D; Príloha D; Příloha D
-                if  x:
-                    isPreviousNewChapterTitle = True
-                else:
-                    isPreviousNewChapterTitle = False
-                self.__isPreviousTitle = True
+
+
+    def __runPageCheck(self, pageContext : PageContext, check : check_registry.PageCheck):
+        """
+        Prepares artifacts of a check and runs it on current page. State of stateful check is taken from and stored to __checkStates.
+        Time of the check is added to times of checks (see __addCheckTime).
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            check (check_registry.PageCheck): Run check.
+        """
+        if pageContext.page.number == 0 and not check.firstPage:
+            return
+        start = time.perf_counter()
+        self.__prepareArtifacts(pageContext, check.artifacts)
+        if check.stateful:
+            self.__checkStates[check.name] = check.function(pageContext, self.__checkStates.get(check.name, False))
+        else:
+            check.function(pageContext)
+        self.__addCheckTime(pageContext.page.number, check.name, time.perf_counter() - start)
+
+
+
+    def getPageResults(self, pageNumbers : list[int], settings : dict):
+        """
+        Map phase of parallel annotating. Checks specified pages and records found mistakes and annotations instead of writing them.
+        Checks depending on previous pages (TOC check and empty section check) are recorded for every possible state of previous pages.
+        Document is not changed.
+
+        Args:
+            pageNumbers (list[int]): Indexes of checked pages.
+            settings (dict): General information of the document and check settings created by annotating Checker.
+
+        Returns:
+            list[dict]: One result for every checked page. Results are merged into annotated document by __reducePageResult.
+        """
+        self.__border = settings['border']
+        self.borderNotFound = settings['borderNotFound']
+        self.__regularFontId = self.__getFontId(settings['regularFont']) if settings['regularFont'] != None else None
+        self.__embeddedPdfAsImage = settings['embeddedPdfAsImage']
+        self.__overflowEngine = settings['overflowEngine']
+        self.__adaptiveDpi = settings['adaptiveDpi']
+        self.__nearWhiteThreshold = settings['nearWhiteThreshold']
+        self.__scannedPages = settings['scannedPages']
+        self.__checks = self.__createCheckRegistry()
+        checks = self.__getEnabledChecks(settings['checks'])
+        chaptersArtifacts = check_registry.getRequiredArtifacts(self.CHAPTERS_ARTIFACTS) if settings['gatherChaptersInfo'] else None
+        return [self.__getPageResult(PageContext(self.__document[pageNumber], recording=True), checks, chaptersArtifacts) for pageNumber in pageNumbers]
+
+
+
+    def __getPageResult(self, pageContext : PageContext, checks : list, chaptersArtifacts : list):
+        """
+        Checks one page and records found mistakes and annotations. Uses only state of the page context, so pages can be checked concurrently.
+        Stateful checks are recorded for both states left by the previous page (their time is the average time of both runs).
+        Checks skipped by triage (see __getTriagedChecks) are not run.
+
+        Args:
+            pageContext (PageContext): Context of checked page, must be recording.
+            checks (list): Enabled checks (check_registry.PageCheck) in order in which they are run.
+            chaptersArtifacts (list): Artifacts required by gathering of chapters information, None if chapters information is not gathered.
+
+        Returns:
+            dict: Result of the page, see getPageResults.
+        """
+        steps = []
+        checkTimes = {}
+        for check in self.__getTriagedChecks(pageContext.page.number, checks):
+            if pageContext.page.number == 0 and not check.firstPage:
+                continue
+            start = time.perf_counter()
+            self.__prepareArtifacts(pageContext, check.artifacts)
+            if check.stateful:
+                steps.append((None, pageContext.records))
+                branches = {}
+                for state in (False, True):
+                    pageContext.records = []
+                    branches[state] = (pageContext.records, check.function(pageContext, state))
+                steps.append((check.name, branches))
+                pageContext.records = []
+                checkTimes[check.name] = (time.perf_counter() - start) / 2
             else:
-                isPreviousNewChapterTitle = False
-                self.__isPreviousTitle = False
+                check.function(pageContext)
+                checkTimes[check.name] = time.perf_counter() - start
+        steps.append((None, pageContext.records))
+        pageContext.records = None
+
+        chapter = None
+        if chaptersArtifacts != None:
+            self.__prepareArtifacts(pageContext, chaptersArtifacts)
+            chapter = self.__getPageChapterFeatures(pageContext)
+        return {
+            "page" : pageContext.page.number,
+            "steps" : steps,
+            "chapter" : chapter,
+            "overflowScanInfo" : pageContext.overflowScanInfo,
+            "checkTimes" : checkTimes
+        }
 
 
 
-    def __resetCurrVars(self):
+    def __replayRecords(self, pageContext : PageContext, records : list):
         """
-        Resets all class variables starting with "curr".
+        Writes recorded annotations and mistakes to current page.
+
+        Args:
+            pageContext (PageContext): Context of checked page.
+            records (list): Annotations and mistakes recorded by getPageResults.
         """
-        self.__currPage = None
-        self.__currDict = None
-        self.__currPixmap = None
-        self.__currTextPage = None
-        self.__currPageEmbeddedPdfs = None
-        self.__currPageTextContent = None
+        for record in records:
+            if record[0] == "highlight":
+                self.mistakes_found = True
+                self.__highlight(pageContext, *record[1:])
+            elif record[0] == "line":
+                self.__overflowLine(pageContext, *record[1:])
+            elif record[0] == "arrow":
+                self.__drawArrow(pageContext, *record[1:])
+            elif record[0] == "mistake":
+                self.mistakes_found = True
+                self.__addMistake(pageContext, record[1], record[2])
+
+
+
+    def __reducePageResult(self, pageResult : dict):
+        """
+        Reduce phase of parallel annotating. Merges result of one page into annotated document.
+        Results must be merged in order of pages, because state of previous pages decides which recorded branch is used.
+
+        Args:
+            pageResult (dict): Result of one page created by getPageResults.
+
+        Returns:
+            dict: Findings of the page, see iterFindings.
+        """
+        pageContext = PageContext(self.__document[pageResult['page']])
+        for checkName, records in pageResult['steps']:
+            if checkName != None:
+                # recorded branches of stateful check, branch of current state is used
+                records, self.__checkStates[checkName] = records[self.__checkStates.get(checkName, False)]
+            self.__replayRecords(pageContext, records)
+
+        chapter = None
+        if pageResult['chapter'] != None:
+            chapter = self.__updateCurrChapter(pageContext, pageResult['chapter'])
+        if pageResult['overflowScanInfo'] != None:
+            self.overflowScanInfo.append(pageResult['overflowScanInfo'])
+        for checkName, checkTime in pageResult['checkTimes'].items():
+            self.__addCheckTime(pageResult['page'], checkName, checkTime)
+        return self.__getPageFindings(pageContext, chapter)
+
+
+
+    def __getWorkerSettings(self, checks : list, gatherChaptersInfo : bool):
+        """
+        Creates settings of worker processes (see getPageResults). General information of the document must be already found.
+
+        Args:
+            checks (list): Enabled checks (check_registry.PageCheck).
+            gatherChaptersInfo (bool): Determines if information about chapters will be gathered.
+
+        Returns:
+            dict: General information of the document and check settings.
+        """
+        return {
+            "checks" : [check.name for check in checks],
+            "gatherChaptersInfo" : gatherChaptersInfo,
+            "border" : self.__border,
+            "borderNotFound" : self.borderNotFound,
+            "regularFont" : self.__fontKeys[self.__regularFontId] if self.__regularFontId != None else None, # font ids are not shared between processes
+            "embeddedPdfAsImage" : self.__embeddedPdfAsImage,
+            "overflowEngine" : self.__overflowEngine,
+            "adaptiveDpi" : self.__adaptiveDpi,
+            "nearWhiteThreshold" : self.__nearWhiteThreshold,
+            "scannedPages" : self.__scannedPages
+        }
+
+
+
+    def __iterFindingsParallel(self, checks : list, gatherChaptersInfo : bool, workers : int):
+        """
+        Checks all pages of document in worker processes (map) and merges their results in order of pages (reduce).
+        General information of the document must be already found.
+        When the generator is closed before the last page, pages not started by worker processes yet are cancelled.
+
+        Args:
+            checks (list): Enabled checks (check_registry.PageCheck).
+            gatherChaptersInfo (bool): Determines if information about chapters will be gathered.
+            workers (int): Count of worker processes.
+
+        Yields:
+            dict: Findings of every page in order of pages, see iterFindings.
+        """
+        settings = self.__getWorkerSettings(checks, gatherChaptersInfo)
+        pageNumbers = list(range(len(self.__document)))
+        shardSize = math.ceil(len(pageNumbers) / (workers * self.SHARDS_PER_WORKER))
+        shards = [pageNumbers[i:i+shardSize] for i in range(0, len(pageNumbers), shardSize)]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=initPageWorker, initargs=(self.__pdfPath,)) as executor:
+            try:
+                for pageResults in executor.map(checkPageShard, shards, repeat(settings)):
+                    for pageResult in pageResults:
+                        yield self.__reducePageResult(pageResult)
+            finally:
+                executor.shutdown(cancel_futures=True)
+
+
+
+    def __skipPage(self, pageNumber : int, reason : string):
+        """
+        Marks page, which was not checked, in typographyMistakes and by note on the page.
+        State of stateful checks and chapters information are not changed by the page.
+
+        Args:
+            pageNumber (int): Index of skipped page.
+            reason (string): Reason why the page was skipped (page_watchdog.TIMEOUT or page_watchdog.CRASH).
+
+        Returns:
+            dict: Findings of the page, see iterFindings.
+        """
+        pageContext = PageContext(self.__document[pageNumber])
+        self.typographyMistakes.addSkippedPage(pageNumber+1, reason)
+        pageContext.annotations.addNote((pageContext.page.rect.x0 + 10, pageContext.page.rect.y0 + 10), self.__rgbToPdf(self.HIGH_ORANGE),
+                                        self.SKIPPED_PAGE_TEXT.format(reason, reason), "Varovani / Warning")
+        pageFindings = self.__getPageFindings(pageContext, None)
+        pageFindings['skipped'] = reason
+        return pageFindings
+
+
+
+    def __iterFindingsWatched(self, checks : list, gatherChaptersInfo : bool, workers : int, pageTimeout : float):
+        """
+        Checks every page in supervised worker process with time budget (see page_watchdog.PageWatchdog) and merges results in order of pages.
+        Pages are distributed to worker processes in turn. Page, whose worker process exceeds time budget or crashes, is skipped
+        (see __skipPage) and the worker process is replaced by a new one. General information of the document must be already found.
+
+        Args:
+            checks (list): Enabled checks (check_registry.PageCheck).
+            gatherChaptersInfo (bool): Determines if information about chapters will be gathered.
+            workers (int): Count of worker processes.
+            pageTimeout (float): Time budget of one page in seconds.
+
+        Yields:
+            dict: Findings of every page in order of pages, see iterFindings.
+        """
+        settings = self.__getWorkerSettings(checks, gatherChaptersInfo)
+        pageCount = len(self.__document)
+        watchdogs = []
+        try:
+            for pageNumber in range(min(workers, pageCount)):
+                watchdogs.append(page_watchdog.PageWatchdog(initPageWorker, (self.__pdfPath,), checkPageShard, pageTimeout))
+                watchdogs[-1].submit([pageNumber], settings)
+            for pageNumber in range(pageCount):
+                watchdog = watchdogs[pageNumber % len(watchdogs)]
+                pageResults, skipReason = watchdog.getResult()
+                if pageNumber + len(watchdogs) < pageCount:
+                    watchdog.submit([pageNumber + len(watchdogs)], settings)
+                if skipReason != None:
+                    yield self.__skipPage(pageNumber, skipReason)
+                else:
+                    yield self.__reducePageResult(pageResults[0])
+        finally:
+            for watchdog in watchdogs:
+                watchdog.close()
+
 
 
-    
     def __resetCheckerVars(self):
         """
         Resets all class variables for new annotating.
         """
-        self.__resetCurrVars()
         self.mistakes_found = False
         self.borderNotFound = False
         self.__border = (-1.0, -1.0)
-        self.__isContentPage = False
+        self.__checkStates = {}
+        self.requiredArtifacts = []
         self.__bibliographyPagePassed = False
-        self.__regularFont = None
-        self.__isPreviousTitle = False
+        self.__regularFontId = None
         self.__currChapterInfo = None
+        self.sampledPages = []
+        self.__scannedPages = {}
+        self.__checkTimes = {}
+        self.triageInfo = None
         self.chaptersInfo = (ChapterInfo(sequence=0, title="Before First Chapter"), [], ChapterInfo(sequence=-1, title="After Last Chapter"))
+        self.overflowScanInfo = []
+        self.annotationInfo = []
+
+
+
+    def __openIncrementalOutput(self, annotatedPath : string, separate : bool = False):
+        """
+        Prepares incremental saving (OutputMode.INCREMENTAL). Original file is copied to annotatedPath and the copy is opened instead of the original,
+        so that annotations are appended to the copy and the original file is not changed. Time of copying is stored in outputInfo.
+
+        Args:
+            annotatedPath (string): Path where annotated document will be stored.
+            separate (bool, optional): Determines if the copy is opened only for annotations and pages are checked in the original,
+                so that annotations already written are not taken as content of pages (for example by get_drawings). Defaults to False.
+        """
+        if not isinstance(annotatedPath, (str, os.PathLike)):
+            raise ValueError("incremental output needs path of annotated document")
+        if os.path.abspath(annotatedPath) == os.path.abspath(self.__document.name):
+            return # annotated document is the original
+        start = time.perf_counter()
+        if separate:
+            shutil.copyfile(self.__pdfPath, annotatedPath)
+            self.__outputDocument = fitz.Document(annotatedPath)
+        else:
+            self.__document.close()
+            shutil.copyfile(self.__pdfPath, annotatedPath)
+            self.__document = fitz.Document(annotatedPath)
+            self.__outputDocument = self.__document
+        self.outputInfo = {"copyTime" : round(time.perf_counter() - start, 6)}
+
+
+
+    def __saveDocument(self, annotatedPath, outputMode : OutputMode):
+        """
+        Saves and closes annotated document (and checked document, if it is separate). Information about saving is stored in outputInfo.
+        If document cannot be saved incrementally (for example it was repaired when opened), whole document is rewritten (OutputMode.FULL).
+
+        Args:
+            annotatedPath: Path or file-like object where annotated document will be stored, None -> annotated document is returned.
+            outputMode (OutputMode): Way the annotated document is saved.
+
+        Returns:
+            bytes: Annotated document if annotatedPath is None, otherwise None.
+        """
+        start = time.perf_counter()
+        options = dict(garbage=3, deflate=True) if outputMode == OutputMode.COMPRESSED else {}
+        data = None
+        if outputMode == OutputMode.INCREMENTAL and self.__outputDocument.can_save_incrementally():
+            self.__outputDocument.saveIncr()
+        elif outputMode == OutputMode.INCREMENTAL or annotatedPath == None or hasattr(annotatedPath, "write"):
+            # opened copy cannot be rewritten by save, file-like objects get bytes
+            if outputMode == OutputMode.INCREMENTAL:
+                outputMode = OutputMode.FULL
+            data = self.__outputDocument.tobytes(**options)
+        else:
+            self.__outputDocument.save(annotatedPath, **options)
+        if self.__outputDocument is not self.__document:
+            self.__document.close()
+        self.__outputDocument.close()
+
+        if data == None:
+            size = os.path.getsize(annotatedPath)
+        else:
+            size = len(data)
+            if hasattr(annotatedPath, "write"):
+                annotatedPath.write(data)
+            elif annotatedPath != None:
+                with open(annotatedPath, "wb") as file:
+                    file.write(data)
+
+        if self.outputInfo == None:
+            self.outputInfo = {}
+        self.outputInfo.update({
+            "mode" : outputMode.name,
+            "size" : size,
+            "time" : round(time.perf_counter() - start, 6)
+        })
+        return data if annotatedPath == None else None
+
+
+
+    def __updateMemoryInfo(self):
+        """
+        Samples current resident set size of the process and updates its peak and its largest growth during one page in memoryInfo.
+
+        Returns:
+            int|None: Current resident set size in bytes, None if it cannot be read on this system.
+        """
+        rss = memory_usage.getCurrentRss()
+        if rss == None:
+            return None
+        if self.__lastRss != None:
+            self.memoryInfo["maxPageGrowth"] = max(self.memoryInfo["maxPageGrowth"], rss - self.__lastRss)
+        self.memoryInfo["peakRss"] = max(self.memoryInfo["peakRss"], rss)
+        self.__lastRss = rss
+        return rss
+
+
+
+    def __releasePageMemory(self, annotatedPath : string):
+        """
+        Releases memory after a checked page in streaming mode. Extracted objects of the page are not cached in streaming mode,
+        so only after every STREAM_CHUNK_PAGES pages annotations are flushed to annotated document by incremental saving,
+        the documents are reopened, so that MuPDF releases all loaded objects (pages, annotations), and store of MuPDF (fonts, images) is emptied.
+        Store is not emptied after every page, because fonts shared by pages would be loaded again for every page.
+        If document cannot be saved incrementally, annotations stay in memory until the document is saved.
+
+        Args:
+            annotatedPath (string): Path of annotated document opened by __openIncrementalOutput.
+        """
+        if self.memoryInfo["checkedPages"] % self.STREAM_CHUNK_PAGES != 0:
+            return
+        if self.__outputDocument.can_save_incrementally():
+            separate = self.__outputDocument is not self.__document
+            self.__outputDocument.saveIncr()
+            self.__outputDocument.close()
+            self.__outputDocument = fitz.Document(annotatedPath)
+            if separate:
+                self.__document.close()
+                self.__document = fitz.Document(self.__pdfPath)
+            else:
+                self.__document = self.__outputDocument
+            self.memoryInfo["flushes"] += 1
+        fitz.TOOLS.store_shrink(100)
 
 
 
@@ -1408,15 +2703,223 @@ class Checker:
 
 
 
+    def __startChecking(self, embeddedPdfAsImage : bool, enabled : dict, gatherChaptersInfo : bool, overflowEngine : OverflowEngine, adaptiveDpi : int,
+                        nearWhiteThreshold : int, pageCacheBudget : int, pageTimeout : float):
+        """
+        Prepares new annotating: resets class variables, creates registry of checks, classifies pages as scanned or born-digital (see document_triage)
+        and finds general information of the document needed by enabled checks. Names of artifacts required by enabled checks are stored in requiredArtifacts,
+        result of the triage in triageInfo. If pageTimeout is given, pages are classified and sampled in supervised worker process with the same time budget as checks of pages.
+
+        Args:
+            enabled (dict): Determines for every check (by its name) if it is enabled.
+            Other arguments: See annotate.
+
+        Returns:
+            list[check_registry.PageCheck]: Enabled checks in order in which they are run, checks that need border are left out if border was not found.
+        """
+        self.__resetCheckerVars()
+        self.__pageCache = page_cache.PageCache(pageCacheBudget)
+        self.__embeddedPdfAsImage = embeddedPdfAsImage
+        self.__overflowEngine = overflowEngine
+        self.__adaptiveDpi = adaptiveDpi
+        self.__nearWhiteThreshold = nearWhiteThreshold
+        self.__checks = self.__createCheckRegistry()
+        names = [name for name, isEnabled in enabled.items() if isEnabled]
+        checks = self.__getEnabledChecks(names)
+        if not checks:
+            return checks
+        watchdog = None if pageTimeout == None else page_watchdog.PageWatchdog(initPageWorker, (self.__pdfPath,), runPageTask, pageTimeout)
+        try:
+            triage = document_triage.DocumentTriage(self.__document, None if watchdog == None else lambda pageNumber: self.__getWatchedPageTriage(watchdog, pageNumber))
+            self.__scannedPages = triage.getScannedPages()
+            self.triageInfo = triage.toDict()
+            self.triageInfo.update({"skippedChecks" : {}, "timeSaved" : 0.0})
+            consumedArtifacts = check_registry.getRequiredArtifacts(self.CHAPTERS_ARTIFACTS) + self.CHAPTERS_LAZY_ARTIFACTS if gatherChaptersInfo else None
+            artifacts = self.__checks.getArtifacts(checks, consumedArtifacts)
+            if PageArtifact.BORDER in artifacts or PageArtifact.REGULAR_FONT in artifacts:
+                self.__getDocInfo(PageArtifact.BORDER in artifacts, PageArtifact.REGULAR_FONT in artifacts, watchdog)
+                checks = self.__getEnabledChecks(names)
+        finally:
+            if watchdog != None:
+                watchdog.close()
+        self.requiredArtifacts = [artifact.name for artifact in self.__checks.getArtifacts(checks, consumedArtifacts)]
+        return checks
+
+
+
+    def __iterFindingsSequential(self, checks : list, gatherChaptersInfo : bool):
+        """
+        Checks all pages of document in this process. General information of the document must be already found.
+
+        Args:
+            checks (list): Enabled checks (check_registry.PageCheck).
+            gatherChaptersInfo (bool): Determines if information about chapters will be gathered.
+
+        Yields:
+            dict: Findings of every page in order of pages, see iterFindings.
+        """
+        chaptersArtifacts = check_registry.getRequiredArtifacts(self.CHAPTERS_ARTIFACTS) if gatherChaptersInfo else None
+        for pageNumber in range(len(self.__document)):
+            pageContext = self.__getPageContext(pageNumber)
+            for check in self.__getTriagedChecks(pageNumber, checks):
+                self.__runPageCheck(pageContext, check)
+
+            chapter = None
+            if gatherChaptersInfo:
+                self.__prepareArtifacts(pageContext, chaptersArtifacts)
+                chapter = self.__updateCurrChapter(pageContext)
+
+            if pageContext.overflowScanInfo != None:
+                self.overflowScanInfo.append(pageContext.overflowScanInfo)
+            self.__cachePageContext(pageContext)
+            yield self.__getPageFindings(pageContext, chapter)
+
+
+
+    def __iterCheckFindings(self, checks : list, gatherChaptersInfo : bool, workers : int, pageTimeout : float):
+        """
+        Runs given checks on all pages (one pass over the document) and yields findings of every page in order of pages.
+        Checks skipped by triage on yielded pages are counted in triageInfo. Annotating must be started by __startChecking.
+
+        Args:
+            checks (list): Checks (check_registry.PageCheck) run on every page.
+            gatherChaptersInfo (bool): Determines if information about chapters will be gathered.
+            workers (int): Count of worker processes, see annotate.
+            pageTimeout (float): Time budget of one page in seconds, see annotate.
+
+        Yields:
+            dict: Findings of every page, see iterFindings.
+        """
+        if pageTimeout != None:
+            self.__pageCache.clear() # pages are extracted again in worker processes
+            pageFindingsStream = self.__iterFindingsWatched(checks, gatherChaptersInfo, workers, pageTimeout)
+        elif workers > 1 and len(self.__document) > 1:
+            self.__pageCache.clear() # pages are extracted again in worker processes
+            pageFindingsStream = self.__iterFindingsParallel(checks, gatherChaptersInfo, workers)
+        else:
+            pageFindingsStream = self.__iterFindingsSequential(checks, gatherChaptersInfo)
+
+        try:
+            for pageFindings in pageFindingsStream:
+                self.__countTriagedChecks(pageFindings['page']-1, checks)
+                yield pageFindings
+        finally:
+            pageFindingsStream.close()
+
+
+
+    def iterFindings(self, embeddedPdfAsImage : bool = True, borderCheck : bool = True, hyphenCheck : bool = True, imageWidthCheck : bool = True,
+                     TOCCheck : bool = True, spaceBracketCheck : bool = True, emptySectionCheck : bool = True, badReferenceCheck : bool = True,
+                     gatherChaptersInfo : bool = True, overflowEngine : OverflowEngine = OverflowEngine.MARGIN_CLIP, adaptiveDpi : int = 24,
+                     nearWhiteThreshold : int = 250, workers : int = 1, pageCacheBudget : int = PAGE_CACHE_BUDGET, pageTimeout : float = None):
+        """
+        Examines whole document and yields findings of every page as soon as the page is checked (in order of pages).
+        Annotations are not written to the document, annotate writes them and saves the document.
+        Class variables (typographyMistakes, chaptersInfo, mistakes_found, ...) are updated along the way,
+        so after the generator is closed early, they contain information about already yielded pages only.
+        Every page check is run with artifacts it declares (see __createCheckRegistry), artifacts are extracted once per page in dependency order
+        and only if an enabled check needs them (names of required artifacts are stored in requiredArtifacts). If no check is enabled, nothing is yielded.
+        Before pages are checked, pages are classified as scanned or born-digital by cheap triage (see document_triage). On scanned pages, checks of graphics
+        of the page (border check, image width check) are skipped and checks reading text are run only if the page has text layer (OCR).
+        Result of the triage, counts of skipped checks and estimated time saved by them (see __getTriageTimeSaved) are stored in triageInfo.
+
+        Args:
+            See annotate.
+
+        Yields:
+            dict: Findings of one page:
+                "page" (int): Number of the page (starting at 1).
+                "findings" (list[dict]): Found mistakes, every one with "type" (name of TypographyMistakes.MistakeType), "severity" ("severe" or "warning"),
+                "page" and "rects" (list of rectangles (x0, y0, x1, y1)).
+                "chapter" (dict): Change of chapter information made by the page (see __updateCurrChapter), None if chapters information is not gathered.
+                "annotations" (annotation_batch.AnnotationBatch): Annotations of the page, not written yet.
+                "skipped" (string): Only if the page was not checked, reason why it was skipped (page_watchdog.TIMEOUT or page_watchdog.CRASH).
+        """
+        enabled = dict(borderCheck=borderCheck, hyphenCheck=hyphenCheck, badReferenceCheck=badReferenceCheck, imageWidthCheck=imageWidthCheck, TOCCheck=TOCCheck,
+                       spaceBracketCheck=spaceBracketCheck, emptySectionCheck=emptySectionCheck)
+        checks = self.__startChecking(embeddedPdfAsImage, enabled, gatherChaptersInfo, overflowEngine, adaptiveDpi, nearWhiteThreshold, pageCacheBudget, pageTimeout)
+        if checks:
+            yield from self.__iterCheckFindings(checks, gatherChaptersInfo, workers, pageTimeout)
+            self.triageInfo["timeSaved"] = round(self.__getTriageTimeSaved(), 6)
+        self.pageCacheInfo = self.__pageCache.getInfo()
+
+
+
+    def __writeFindings(self, pageFindingsStream, annotatedPath : string, memoryLimit : int):
+        """
+        Writes annotations of all pages yielded by pageFindingsStream. In streaming mode (memoryLimit is given) releases memory after every page
+        and stops when the next page would probably exceed the limit (see annotate).
+
+        Args:
+            pageFindingsStream: Generator of findings of pages (see __iterCheckFindings).
+            annotatedPath (string): Path where annotated document will be stored.
+            memoryLimit (int): Maximum resident set size of the process in bytes, None -> no limit.
+        """
+        self.memoryInfo["checkedPages"] = 0
+        for pageFindings in pageFindingsStream:
+            self.__writeAnnotations(self.__outputDocument[pageFindings['page']-1], pageFindings['annotations'])
+            self.memoryInfo["checkedPages"] += 1
+            if memoryLimit != None:
+                self.__releasePageMemory(annotatedPath)
+            rss = self.__updateMemoryInfo()
+            if memoryLimit != None and rss != None and rss + self.memoryInfo["maxPageGrowth"] > memoryLimit \
+                    and self.memoryInfo["checkedPages"] < self.memoryInfo["pages"]:
+                # the next page would probably exceed the limit -> partial results
+                self.memoryInfo["partial"] = True
+                pageFindingsStream.close()
+                break
+
+
+
+    def __publishTier(self, checks : list, startTime : float, published : bool, tierCallback):
+        """
+        Adds information about finished tier of tiered annotating to tierInfo and passes it to tierCallback.
+
+        Args:
+            checks (list): Checks (check_registry.PageCheck) of the tier.
+            startTime (float): Time (time.perf_counter) when annotating started.
+            published (bool): Determines if annotated document with findings of the tier is saved.
+            tierCallback: Function called with information about the tier, None -> not called.
+        """
+        self.tierInfo.append({
+            "tier" : checks[0].tier,
+            "checks" : [check.name for check in checks],
+            "time" : round(time.perf_counter() - startTime, 6),
+            "mistakesCount" : self.typographyMistakes.toDict()["totalMistakesCount"],
+            "published" : published
+        })
+        if tierCallback != None:
+            tierCallback(self.tierInfo[-1])
+
+
+
     def annotate(self ,annotatedPath : string, embeddedPdfAsImage : bool = True, borderCheck : bool = True, hyphenCheck : bool = True, imageWidthCheck : bool = True,
                  TOCCheck : bool = True, spaceBracketCheck : bool = True, emptySectionCheck : bool = True, badReferenceCheck : bool = True, 
-                 gatherChaptersInfo : bool = True):
+                 gatherChaptersInfo : bool = True, overflowEngine : OverflowEngine = OverflowEngine.MARGIN_CLIP, adaptiveDpi : int = 24,
+                 nearWhiteThreshold : int = 250, workers : int = 1, pageCacheBudget : int = PAGE_CACHE_BUDGET, outputMode : OutputMode = OutputMode.FULL,
+                 memoryLimit : int = None, pageTimeout : float = None, tiered : bool = False, tierCallback = None):
         """
         Examines whole document and checks for mistakes. If a mistake occurred, it will be marked as annotation at appropriate place.
         Class variable mistakes_found indicates whether at least one mistake was marked.
+        Findings of pages are taken from iterFindings and their annotations are written page by page.
+        Peak resident set size of the process and other information about memory are stored in memoryInfo.
+        Checks skipped on scanned pages and result of triage of pages are described by iterFindings.
+
+        If memoryLimit is given, document is checked in streaming mode: pages are checked sequentially without cache of extracted pages
+        and after every STREAM_CHUNK_PAGES pages annotations are flushed to annotatedPath (OutputMode.INCREMENTAL) and memory of MuPDF is released.
+        If checking of the next page would probably exceed the limit (resident set size grew by the largest growth during one page so far),
+        checking stops and the document is saved with findings of already checked pages (memoryInfo["partial"] is True).
+
+        If pageTimeout is given, every page is checked in supervised worker process (see page_watchdog.PageWatchdog), which is killed and replaced
+        when the page is not checked in pageTimeout seconds. Such page is skipped, it is listed in skipped pages of typographyMistakes and marked by a note.
+
+        If tiered is True, checks are run in tiers (see check_registry.PageCheck.tier): fast text checks (and gathering of chapters information) on all pages first,
+        then checks rendering pages (border check and image width check) on all pages. Pages are checked in the original document, annotations are written to its copy.
+        After every tier, findings found so far are published: the copy is saved incrementally to annotatedPath (OutputMode.INCREMENTAL), information about the tier is added to tierInfo
+        and passed to tierCallback, which can read results of the tier (typographyMistakes, chaptersInfo, ...) before next tier starts.
 
         Args:
-            annotatedPath (string): Path where annotated document will be stored.
+            annotatedPath (string): Path or file-like object (for example io.BytesIO) where annotated document will be stored. None -> annotated document is returned as bytes.
             embeddedPdfAsImage (bool, optional): Determines if embedded PDFs inside document will be taken as images. Defaults to True.
             borderCheck (bool, optional): Determines if document will be scanned for any out of border content (overflow). Defaults to True.
             hyphenCheck (bool, optional): Determines if document will be scanned for wrong usage of hyphen. Defaults to True.
@@ -1426,42 +2929,132 @@ class Checker:
             emptySectionCheck (bool, optional): Determines if document will be scanned for absence of text between (sub)section titles. Defaults to True.
             badReferenceCheck (bool, optional): Determines if document will be scanned for missing references (indicated by '??'). Defaults to True.
             gatherChaptersInfo (bool, optional): Determines if information about chapters will be gathered. Defaults to True.
-        """
-        self.__resetCheckerVars()
-        self.__embeddedPdfAsImage = embeddedPdfAsImage
-        if borderCheck or hyphenCheck or imageWidthCheck or TOCCheck or spaceBracketCheck or emptySectionCheck or badReferenceCheck:
-            findBorder = borderCheck or imageWidthCheck or emptySectionCheck
-            if findBorder or emptySectionCheck:
-                self.__getDocInfo(findBorder, emptySectionCheck)
-
-            self.__resetCurrVars()
-            for self.__currPage in self.__document:
-                if borderCheck and not self.borderNotFound:
-                    self.__overflowPageCheck()
-
-                if hyphenCheck:
-                    self.__hyphenPageCheck()
-
-                if badReferenceCheck:
-                    self.__doubleQuestionMarkPageCheck()
-
-                if imageWidthCheck and not self.borderNotFound:
-                    self.__imageWidthPageCheck()
+            overflowEngine (OverflowEngine, optional): Method used to find out of border content. Defaults to OverflowEngine.MARGIN_CLIP.
+            adaptiveDpi (int, optional): Resolution of the first (low resolution) pass of OverflowEngine.ADAPTIVE. Defaults to 24.
+            nearWhiteThreshold (int, optional): Gray value (0-255) from which pixels are taken as white by OverflowEngine.ADAPTIVE. Defaults to 250.
+            workers (int, optional): Count of worker processes checking pages in parallel. 1 -> pages are checked sequentially in this process. Defaults to 1.
+            pageCacheBudget (int, optional): Memory budget (in bytes) of cache of extracted pages, see PageCache. Defaults to PAGE_CACHE_BUDGET.
+            outputMode (OutputMode, optional): Way the annotated document is saved, OutputMode.INCREMENTAL needs path. Defaults to OutputMode.FULL.
+            memoryLimit (int, optional): Maximum resident set size of the process in bytes, enables streaming mode (annotatedPath must be path, workers, pageCacheBudget
+                and outputMode are ignored). The limit is enforced only on systems where resident set size can be read (Linux, Windows). Defaults to None (no limit).
+            pageTimeout (float, optional): Time budget of checking of one page in seconds, pages are checked in supervised worker processes (count given by workers,
+                pageCacheBudget is ignored). Triage of pages and sampling of pages for general information of the document are supervised in the same way,
+                page exceeding the time budget there is taken as born-digital, respectively is not sampled. Defaults to None (no time budget).
+            tiered (bool, optional): Determines if checks are run in tiers (annotatedPath must be path, outputMode is ignored). Defaults to False.
+            tierCallback (optional): Function called with information about every finished tier (item of tierInfo), used only if tiered is True. Defaults to None.
 
-                if TOCCheck:
-                    self.__TOCSectionsCheck()
-
-                if spaceBracketCheck:
-                    self.__spaceBracketCheck()
-
-                if emptySectionCheck:
-                    if self.__currPage.number > 0:
-                        self.__emptySectionCheck()
-            
-                if gatherChaptersInfo:
-                    self.__updateCurrChapter()
-
-                self.__resetCurrVars()
-
-        self.__document.save(annotatedPath)
-        self.__document.close()
+        Returns:
+            bytes: Annotated document if annotatedPath is None, otherwise None.
+        """
+        startTime = time.perf_counter()
+        self.outputInfo = None
+        self.tierInfo = []
+        if memoryLimit != None:
+            workers = 1
+            pageCacheBudget = 0
+        if memoryLimit != None or tiered:
+            outputMode = OutputMode.INCREMENTAL
+        if outputMode == OutputMode.INCREMENTAL:
+            self.__openIncrementalOutput(annotatedPath, separate=tiered)
+        self.memoryInfo = {
+            "limit" : memoryLimit,
+            "peakRss" : 0,
+            "maxPageGrowth" : 0,
+            "pages" : len(self.__document),
+            "checkedPages" : 0,
+            "flushes" : 0,
+            "partial" : False
+        }
+        self.__lastRss = None
+        self.__updateMemoryInfo()
+
+        enabled = dict(borderCheck=borderCheck, hyphenCheck=hyphenCheck, badReferenceCheck=badReferenceCheck, imageWidthCheck=imageWidthCheck, TOCCheck=TOCCheck,
+                       spaceBracketCheck=spaceBracketCheck, emptySectionCheck=emptySectionCheck)
+        checks = self.__startChecking(embeddedPdfAsImage, enabled, gatherChaptersInfo, overflowEngine, adaptiveDpi, nearWhiteThreshold, pageCacheBudget, pageTimeout)
+        tiers = self.__checks.getTiers(checks) if tiered else [checks] if checks else []
+        for tier, tierChecks in enumerate(tiers):
+            self.__writeFindings(self.__iterCheckFindings(tierChecks, gatherChaptersInfo and tier == 0, workers, pageTimeout), annotatedPath, memoryLimit)
+            if tier == len(tiers) - 1 or self.memoryInfo["partial"]:
+                break
+            if tiered:
+                # provisional annotated document with findings of finished tiers
+                published = bool(self.__outputDocument.can_save_incrementally())
+                if published:
+                    self.__outputDocument.saveIncr()
+                self.__publishTier(tierChecks, startTime, published, tierCallback)
+        if checks:
+            self.triageInfo["timeSaved"] = round(self.__getTriageTimeSaved(), 6)
+        self.pageCacheInfo = self.__pageCache.getInfo()
+        self.memoryInfo["processPeakRss"] = memory_usage.getPeakRss()
+        data = self.__saveDocument(annotatedPath, outputMode)
+        if tiered and tiers:
+            self.__publishTier(tierChecks, startTime, True, tierCallback)
+        return data
+
+
+
+# ---------------------------------------------- PARALLEL WORKER ---------------------------------------------
+
+## Checker of the worker process, every worker process has its own opened document
+workerChecker : Checker = None
+
+def initPageWorker(pdfPath : string):
+    """
+    Initializes worker process of parallel annotating. Opens document in the worker process.
+
+    Args:
+        pdfPath (string): Path to the checked PDF.
+    """
+    global workerChecker
+    workerChecker = Checker(pdfPath)
+
+def checkPageShard(pageNumbers : list[int], settings : dict):
+    """
+    Checks one shard of pages in worker process of parallel annotating.
+
+    Args:
+        pageNumbers (list[int]): Indexes of checked pages.
+        settings (dict): General information of the document and check settings.
+
+    Returns:
+        list[dict]: Results of checked pages, see Checker.getPageResults.
+    """
+    return workerChecker.getPageResults(pageNumbers, settings)
+
+def triagePage(pageNumber : int):
+    """
+    Classifies one page by triage in supervised worker process.
+
+    Args:
+        pageNumber (int): Index of examined page.
+
+    Returns:
+        document_triage.PageTriage: Classification of the page, see Checker.getPageTriage.
+    """
+    return workerChecker.getPageTriage(pageNumber)
+
+def samplePage(pageNumber : int, settings : dict):
+    """
+    Examines one page for general information of the document in supervised worker process.
+
+    Args:
+        pageNumber (int): Index of examined page.
+        settings (dict): Settings of sampling.
+
+    Returns:
+        tuple: Information of the page, see Checker.getPageSample.
+    """
+    return workerChecker.getPageSample(pageNumber, settings)
+
+def runPageTask(function, *args):
+    """
+    Runs one task of supervised worker process (see page_watchdog.PageWatchdog), so one worker process can run tasks of different kinds.
+
+    Args:
+        function: Function of the task, for example triagePage or samplePage.
+        args: Arguments of the function.
+
+    Returns:
+        Result of the function.
+    """
+    return function(*args)
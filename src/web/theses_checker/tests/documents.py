@@ -0,0 +1,103 @@
+#----------------------------------------------------------------------------
+# File          : documents.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import fitz
+
+## Size of A4 page in points
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+## Left and right border of text of synthetic pages
+BORDER_LEFT = 72
+BORDER_RIGHT = 523
+## Paragraph of synthetic pages, it contains mistakes of all text checks: hyphen, bad reference and missing space before bracket
+PARAGRAPH = ("Theses are checked for typography mistakes - every page is examined. Figure ??(a) shows the layout of a page and "
+             "the text refers to it(see chapter 2). The rest of the paragraph is only filler text, which makes the block wide "
+             "enough to reach the right border of the text, so that the border of the document can be found by sampling.")
+
+
+def addTextPage(document : fitz.Document, title : str = None, paragraphs : int = 4, overflow : bool = False) -> fitz.Page:
+    """
+    Adds born-digital page with paragraphs of text between BORDER_LEFT and BORDER_RIGHT.
+
+    Args:
+        document (fitz.Document): Document to which the page is added.
+        title (str, optional): Heading at the top of the page. Defaults to None (no heading).
+        paragraphs (int, optional): Count of paragraphs. Defaults to 4.
+        overflow (bool, optional): Determines if a filled rectangle reaching out of the right border is drawn. Defaults to False.
+
+    Returns:
+        fitz.Page: Added page.
+    """
+    page = document.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    y = 72
+    if title != None:
+        page.insert_text((BORDER_LEFT, y + 20), title, fontsize=20)
+        y += 50
+    for _ in range(paragraphs):
+        page.insert_textbox(fitz.Rect(BORDER_LEFT, y, BORDER_RIGHT, y + 110), PARAGRAPH, fontsize=11, align=fitz.TEXT_ALIGN_JUSTIFY)
+        y += 120
+    if overflow:
+        page.draw_rect(fitz.Rect(BORDER_LEFT + 100, y, PAGE_WIDTH - 20, y + 40), color=(0, 0, 0), fill=(0.2, 0.2, 0.2))
+    return page
+
+
+def addScannedPage(document : fitz.Document, ocrText : str = None) -> fitz.Page:
+    """
+    Adds page covered by one image (scanned page), optionally with invisible text layer (OCR).
+
+    Args:
+        document (fitz.Document): Document to which the page is added.
+        ocrText (str, optional): Text of invisible text layer. Defaults to None (no text layer).
+
+    Returns:
+        fitz.Page: Added page.
+    """
+    page = document.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    pixmap = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 60, 85), False)
+    pixmap.clear_with(230)
+    page.insert_image(page.rect, pixmap=pixmap)
+    if ocrText != None:
+        page.insert_textbox(fitz.Rect(BORDER_LEFT, 72, BORDER_RIGHT, PAGE_HEIGHT - 72), ocrText, fontsize=11, render_mode=3)
+    return page
+
+
+def createThesis(path : str, pages : int = 6, overflowPages : tuple = (3,)):
+    """
+    Creates born-digital thesis-like document: title page, pages of chapters with text and overflowing drawings on given pages.
+
+    Args:
+        path (str): Path where the document is saved.
+        pages (int, optional): Count of pages. Defaults to 6.
+        overflowPages (tuple, optional): Indexes of pages with content out of the right border. Defaults to (3,).
+    """
+    document = fitz.open()
+    addTextPage(document, title="Thesis", paragraphs=1)
+    for pageNumber in range(1, pages):
+        addTextPage(document, title="Chapter {}".format(pageNumber) if pageNumber % 2 == 1 else None, overflow=pageNumber in overflowPages)
+    document.save(path)
+    document.close()
+
+
+def getResult(checker, annotatedPath : str) -> tuple:
+    """
+    Gets comparable result of annotating: found mistakes, information about chapters and annotations of annotated document.
+
+    Args:
+        checker (Checker): Checker, which annotated the document.
+        annotatedPath (str): Path of annotated document.
+
+    Returns:
+        tuple: (mistakes_found, typography mistakes, chapters information, annotations as (page, type, rectangle)).
+    """
+    chapters = [checker.chaptersInfo[0]] + checker.chaptersInfo[1] + [checker.chaptersInfo[2]]
+    chaptersInfo = [(chapter.title, chapter.pages.toDict(), vars(chapter.textInfo), chapter.pictures) for chapter in chapters]
+    with fitz.Document(annotatedPath) as document:
+        annotations = [(page.number, annot.type[0], tuple(round(value, 2) for value in annot.rect)) for page in document for annot in page.annots()]
+    return (checker.mistakes_found, checker.typographyMistakes.toDict(), chaptersInfo, annotations)
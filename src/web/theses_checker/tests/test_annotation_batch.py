@@ -0,0 +1,74 @@
+#----------------------------------------------------------------------------
+# File          : test_annotation_batch.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import unittest
+import fitz
+from ..bl import annotation_batch
+
+## Colors in format used in PDF
+RED = (1.0, 0.0, 0.0)
+BLUE = (0.0, 0.0, 1.0)
+
+
+
+class AnnotationBatchTest(unittest.TestCase):
+    """
+    Merging of findings of one page into annotations.
+    """
+
+    def setUp(self):
+        self.document = fitz.open()
+        self.page = self.document.new_page()
+        self.batch = annotation_batch.AnnotationBatch()
+
+
+    def tearDown(self):
+        self.document.close()
+
+
+    def getAnnotations(self) -> list:
+        return sorted((annot.type[1], tuple(round(value) for value in annot.rect)) for annot in self.page.annots())
+
+
+    def test_adjacentHighlightsOfSameStyleAreMerged(self):
+        self.batch.addHighlight([10, 10, 50, 20], RED)
+        self.batch.addHighlight([(50.5, 10, 90, 20)], RED)
+        self.batch.addHighlight([95, 10, 120, 20], RED)
+        self.batch.addHighlight([10, 10, 50, 20], BLUE)
+        self.batch.addHighlight([10, 10, 50, 20], RED, "text")
+        self.assertEqual(len(self.batch.highlights), 4)
+        self.assertEqual(self.batch.highlights[0][0], [(10, 10, 50, 20), (50.5, 10, 90, 20)])
+        self.assertEqual(self.batch.findings, 5)
+
+
+    def test_overlappingLinesAreMerged(self):
+        self.batch.addLines(100, [(0, 100, 10, 120), (0, 130, 10, 150), (0, 300, 10, 310)], RED)
+        self.assertEqual(annotation_batch.mergeSegments(self.batch.lines[(100, RED)]), [[80, 170], [280, 330]])
+        self.assertEqual(self.batch.write(self.page), 2)
+        self.assertEqual([rect[1::2] for _, rect in self.getAnnotations()], [(79, 171), (279, 331)])
+
+
+    def test_writeCreatesAnnotationsAndEmptiesBatch(self):
+        self.batch.addHighlight([10, 10, 50, 20], RED, "text", "title")
+        self.batch.addLines(100, [(0, 100, 10, 120)], RED)
+        self.batch.addArrow(100, 150, 200, BLUE)
+        self.batch.addNote((300, 300), BLUE, "note")
+        self.assertEqual(self.batch.write(self.page), 4)
+        self.assertEqual([annotType for annotType, _ in self.getAnnotations()], ["Highlight", "Ink", "Line", "Text"])
+        highlight = next(annot for annot in self.page.annots() if annot.type[1] == "Highlight")
+        self.assertEqual((highlight.info["title"], highlight.info["content"]), ("title", "text"))
+        self.assertEqual(self.batch.write(self.page), 0)
+        self.assertEqual(len(self.getAnnotations()), 4)
+
+
+    def test_isAdjacent(self):
+        self.assertTrue(annotation_batch.isAdjacent((0, 0, 10, 10), (11, 0, 20, 10)))
+        self.assertFalse(annotation_batch.isAdjacent((0, 0, 10, 10), (11.5, 0, 20, 10)))
+        self.assertTrue(annotation_batch.isAdjacent((0, 0, 10, 10), (5, 5, 6, 6)))
@@ -0,0 +1,105 @@
+#----------------------------------------------------------------------------
+# File          : test_check_registry.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import os
+import tempfile
+import unittest
+from ..bl import check_registry
+from ..bl.check_registry import PageArtifact
+from ..bl.theses_checker import Checker, OverflowEngine
+from . import documents
+
+
+
+class RequiredArtifactsTest(unittest.TestCase):
+    """
+    Artifacts are required together with their dependencies in dependency order.
+    """
+
+    def test_dependenciesAreAdded(self):
+        self.assertEqual(check_registry.getRequiredArtifacts([PageArtifact.TEXT_FINDINGS]),
+                         [PageArtifact.TEXT_PAGE, PageArtifact.EMBEDDED_PDFS, PageArtifact.DICTIONARY, PageArtifact.TEXT_FINDINGS])
+        self.assertEqual(check_registry.getRequiredArtifacts([PageArtifact.PIXMAP, PageArtifact.BORDER]), [PageArtifact.BORDER, PageArtifact.PIXMAP])
+        self.assertEqual(check_registry.getRequiredArtifacts([]), [])
+
+
+    def test_dependenciesPrecedeArtifacts(self):
+        for artifact in PageArtifact:
+            required = check_registry.getRequiredArtifacts([artifact])
+            for position, requiredArtifact in enumerate(required):
+                for dependency in check_registry.DEPENDENCIES.get(requiredArtifact, []):
+                    self.assertLess(required.index(dependency), position)
+
+
+    def test_lazyArtifactsLeaveOutArtifacts(self):
+        check = check_registry.PageCheck("check", None, [PageArtifact.DICTIONARY], [PageArtifact.BLOCK_FEATURES])
+        self.assertEqual(check.artifacts, [PageArtifact.TEXT_PAGE, PageArtifact.EMBEDDED_PDFS, PageArtifact.DICTIONARY])
+        self.assertEqual(check.lazyArtifacts, [PageArtifact.BLOCK_FEATURES])
+
+
+
+class CheckRegistryTest(unittest.TestCase):
+    """
+    Registration of checks, their order, tiers and artifacts.
+    """
+
+    def setUp(self):
+        self.registry = check_registry.CheckRegistry()
+        self.registry.register(check_registry.PageCheck("text", None, [PageArtifact.TEXT_FINDINGS]))
+        self.registry.register(check_registry.PageCheck("border", None, [PageArtifact.BORDER, PageArtifact.PIXMAP], tier=check_registry.RASTER_TIER, needsTextLayer=False))
+        self.registry.register(check_registry.PageCheck("toc", None, [], [PageArtifact.BLOCK_FEATURES], stateful=True))
+
+
+    def test_duplicateNameIsRejected(self):
+        with self.assertRaises(ValueError):
+            self.registry.register(check_registry.PageCheck("text", None, []))
+
+
+    def test_checksAreInOrderOfRegistration(self):
+        self.assertEqual([check.name for check in self.registry.getEnabled(["toc", "unknown", "text", "border"])], ["text", "border", "toc"])
+
+
+    def test_tiers(self):
+        tiers = self.registry.getTiers(self.registry.getEnabled(["toc", "border", "text"]))
+        self.assertEqual([[check.name for check in tier] for tier in tiers], [["text", "toc"], ["border"]])
+        self.assertEqual(self.registry.getTiers([]), [])
+
+
+    def test_artifactsIncludeLazyAndOuterArtifacts(self):
+        self.assertEqual(self.registry.getArtifacts(self.registry.getEnabled(["toc"])),
+                         [PageArtifact.TEXT_PAGE, PageArtifact.EMBEDDED_PDFS, PageArtifact.DICTIONARY, PageArtifact.BLOCK_FEATURES])
+        self.assertEqual(self.registry.getArtifacts(self.registry.getEnabled(["border"]), [PageArtifact.TEXT_CONTENT]),
+                         [PageArtifact.BORDER, PageArtifact.TEXT_PAGE, PageArtifact.EMBEDDED_PDFS, PageArtifact.DICTIONARY, PageArtifact.TEXT_CONTENT, PageArtifact.PIXMAP])
+
+
+
+class CheckerArtifactsTest(unittest.TestCase):
+    """
+    Checks of Checker declare artifacts which are extracted only when needed.
+    """
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.pdfPath = os.path.join(self.tmpDir.name, "thesis.pdf")
+        documents.createThesis(self.pdfPath, pages=3)
+
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+
+    def test_onlyRequiredArtifactsAreExtracted(self):
+        checker = Checker(self.pdfPath)
+        list(checker.iterFindings(borderCheck=False, imageWidthCheck=False, TOCCheck=False, emptySectionCheck=False, hyphenCheck=False,
+                                  spaceBracketCheck=False, gatherChaptersInfo=False))
+        self.assertEqual(checker.requiredArtifacts, ["TEXT_PAGE", "EMBEDDED_PDFS", "DICTIONARY", "TEXT_FINDINGS"])
+        list(checker.iterFindings(hyphenCheck=False, imageWidthCheck=False, TOCCheck=False, spaceBracketCheck=False, emptySectionCheck=False,
+                                  badReferenceCheck=False, gatherChaptersInfo=False, overflowEngine=OverflowEngine.NUMPY))
+        self.assertEqual(checker.requiredArtifacts, ["BORDER", "PIXMAP"])
@@ -0,0 +1,142 @@
+#----------------------------------------------------------------------------
+# File          : test_concurrency.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import fitz
+from ..bl.theses_checker import Checker
+from . import documents
+
+
+class FontInterningTest(unittest.TestCase):
+    """
+    Font interning table of one Checker shared by several threads.
+    """
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.pdfPath = os.path.join(self.tmpDir.name, "thesis.pdf")
+        documents.createThesis(self.pdfPath, pages=2)
+        self.switchInterval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6) # threads are switched as often as possible
+
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switchInterval)
+        self.tmpDir.cleanup()
+
+
+    def test_concurrentFontIdsAreConsistent(self):
+        checker = Checker(self.pdfPath)
+        getFontId = checker._Checker__getFontId
+        fontKeys = [("Font{}".format(number % 50), 10.0 + number % 7, 0) for number in range(2000)]
+        barrier = threading.Barrier(8)
+
+        def intern(offset):
+            barrier.wait()
+            return [(fontKey, getFontId(fontKey)) for fontKey in fontKeys[offset:] + fontKeys[:offset]]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(intern, range(0, 2000, 250)))
+
+        distinctKeys = set(fontKeys)
+        ids = {}
+        for result in results:
+            for fontKey, fontId in result:
+                self.assertEqual(ids.setdefault(fontKey, fontId), fontId)
+        self.assertEqual(sorted(ids.values()), list(range(len(distinctKeys))))
+        for fontKey, fontId in ids.items():
+            self.assertEqual(checker._Checker__fontKeys[fontId], fontKey)
+
+
+
+class ThreadedCheckersTest(unittest.TestCase):
+    """
+    Checkers running concurrently in threads of one process must find the same as serial runs.
+    """
+
+    ## Count of concurrent runs of every document
+    RUNS = 3
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.pdfPaths = []
+        for number, overflowPages in enumerate([(3,), (1, 4)]):
+            self.pdfPaths.append(os.path.join(self.tmpDir.name, "thesis{}.pdf".format(number)))
+            documents.createThesis(self.pdfPaths[-1], pages=5 + number, overflowPages=overflowPages)
+
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+
+    def annotate(self, job : tuple):
+        pdfPath, run = job
+        checker = Checker(pdfPath, seed=0)
+        annotatedPath = "{}_{}_{}.pdf".format(pdfPath[:-4], run, threading.get_ident())
+        checker.annotate(annotatedPath)
+        return documents.getResult(checker, annotatedPath)
+
+
+    def test_threadedResultsEqualSerialResults(self):
+        serialResults = {pdfPath : self.annotate((pdfPath, "serial")) for pdfPath in self.pdfPaths}
+        jobs = [(pdfPath, run) for pdfPath in self.pdfPaths for run in range(self.RUNS)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threadedResults = list(executor.map(self.annotate, jobs))
+        for (pdfPath, run), result in zip(jobs, threadedResults):
+            self.assertEqual(result, serialResults[pdfPath])
+        self.assertTrue(all(result[1]["totalMistakesCount"] > 0 for result in serialResults.values()))
+
+
+
+class SpawnedWorkersTest(unittest.TestCase):
+    """
+    Worker processes started by the spawn start method (default on Windows and macOS) import the checker again instead of inheriting it,
+    checking in them must find the same as serial checking.
+    """
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.pdfPath = os.path.join(self.tmpDir.name, "thesis.pdf")
+        documents.createThesis(self.pdfPath, pages=4, overflowPages=(1, 3))
+        self.startMethod = multiprocessing.get_start_method(allow_none=True)
+        multiprocessing.set_start_method("spawn", force=True)
+
+
+    def tearDown(self):
+        multiprocessing.set_start_method(self.startMethod, force=True)
+        self.tmpDir.cleanup()
+
+
+    def annotate(self, run : str, **kwargs) -> tuple:
+        checker = Checker(self.pdfPath, seed=0)
+        annotatedPath = "{}_{}.pdf".format(self.pdfPath[:-4], run)
+        checker.annotate(annotatedPath, **kwargs)
+        return checker, documents.getResult(checker, annotatedPath)
+
+
+    def test_spawnedWorkersEqualSerialResults(self):
+        _, serialResult = self.annotate("serial")
+        _, parallelResult = self.annotate("parallel", workers=2)
+        _, watchedResult = self.annotate("watched", pageTimeout=60)
+        self.assertEqual(parallelResult, serialResult)
+        self.assertEqual(watchedResult, serialResult)
+
+
+    def test_spawnedWorkerIsRestartedAfterTimeout(self):
+        checker, result = self.annotate("timeout", pageTimeout=0)
+        self.assertEqual(result[1]["skippedPages"], [{"page" : page, "status" : "skipped (timeout)"} for page in range(1, 5)])
+        self.assertEqual(checker.triageInfo["unexaminedPages"], 4)
+        self.assertEqual([annotation[:2] for annotation in result[3]], [(page, fitz.PDF_ANNOT_TEXT) for page in range(4)])
@@ -0,0 +1,66 @@
+#----------------------------------------------------------------------------
+# File          : test_content_stream.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import unittest
+from ..bl import content_stream
+
+
+
+class IterOperatorsTest(unittest.TestCase):
+    """
+    Walking through content streams operator by operator.
+    """
+
+    def test_operatorsWithOperands(self):
+        content = b"q 1 0 0 1 10 20 cm /Im1 Do Q"
+        self.assertEqual(list(content_stream.iterOperators(content)), [("q", []), ("cm", [1.0, 0.0, 0.0, 1.0, 10.0, 20.0]), ("Do", ["Im1"]), ("Q", [])])
+
+
+    def test_onlyWantedOperatorsAreYielded(self):
+        content = b"q\n2 0 0 2 0 0 cm\r\n/Fm0 Do Q BT /F1 12 Tf (text) Tj ET"
+        self.assertEqual(list(content_stream.iterOperators(content, {"cm", "Do"})), [("cm", [2.0, 0.0, 0.0, 2.0, 0.0, 0.0]), ("Do", ["Fm0"])])
+
+
+    def test_stringsAndCommentsAreNotOperators(self):
+        content = b"BT (1 0 0 1 5 5 cm (nested) \\) /X Do) Tj ET % 1 0 0 1 5 5 cm\n/Y Do"
+        self.assertEqual(list(content_stream.iterOperators(content, {"cm", "Do"})), [("Do", ["Y"])])
+
+
+    def test_inlineImageDataIsSkipped(self):
+        content = b"q BI /W 1 /H 1 ID \x00 Do cm EIx EI Q"
+        self.assertEqual(list(content_stream.iterOperators(content)), [("q", []), ("BI", []), ("ID", ["W", 1.0, "H", 1.0]), ("EI", []), ("Q", [])])
+        self.assertEqual(list(content_stream.iterOperators(content, {"Do", "cm", "Q"})), [("Q", [])])
+
+
+    def test_namesAreDecoded(self):
+        self.assertEqual(list(content_stream.iterOperators(b"/A#20B Do")), [("Do", ["A B"])])
+
+
+    def test_arrayItemsAreNotOperators(self):
+        self.assertEqual(list(content_stream.iterOperators(b"[/Pattern true] 0 d /X Do", {"d", "Do"})), [("d", [None, "Pattern", None, 0.0]), ("Do", ["X"])])
+
+
+
+class ContentStreamTest(unittest.TestCase):
+    """
+    Other helpers of content streams.
+    """
+
+    def test_mayContainInlineImage(self):
+        self.assertTrue(content_stream.mayContainInlineImage(b"q BI /W 1 ID x EI Q"))
+        self.assertTrue(content_stream.mayContainInlineImage(b"BI"))
+        self.assertFalse(content_stream.mayContainInlineImage(b"/BI Do /BIG Do ABI"))
+
+
+    def test_matrices(self):
+        translate = (1, 0, 0, 1, 10, 20)
+        scale = (2, 0, 0, 3, 0, 0)
+        self.assertEqual(content_stream.transformPoint(content_stream.multiplyMatrices(translate, scale), 1, 1), (22, 63))
+        self.assertEqual(content_stream.transformPoint(content_stream.multiplyMatrices(scale, translate), 1, 1), (12, 23))
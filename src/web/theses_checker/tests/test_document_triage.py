@@ -0,0 +1,116 @@
+#----------------------------------------------------------------------------
+# File          : test_document_triage.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import unittest
+import fitz
+from ..bl import document_triage
+from . import documents
+
+
+
+class PageTriageTest(unittest.TestCase):
+    """
+    Classification of pages as scanned or born-digital.
+    """
+
+    def setUp(self):
+        self.document = fitz.open()
+
+
+    def tearDown(self):
+        self.document.close()
+
+
+    def test_bornDigitalPage(self):
+        pageTriage = document_triage.PageTriage(documents.addTextPage(self.document))
+        self.assertEqual((pageTriage.type, pageTriage.textLayer, pageTriage.imageCoverage), (document_triage.BORN_DIGITAL, True, 0.0))
+
+
+    def test_scannedPageWithoutTextLayer(self):
+        pageTriage = document_triage.PageTriage(documents.addScannedPage(self.document))
+        self.assertEqual((pageTriage.type, pageTriage.textLayer, pageTriage.chars), (document_triage.SCANNED, False, 0))
+        self.assertGreaterEqual(pageTriage.imageCoverage, document_triage.SCANNED_COVERAGE)
+
+
+    def test_scannedPageWithOcrTextLayer(self):
+        pageTriage = document_triage.PageTriage(documents.addScannedPage(self.document, documents.PARAGRAPH))
+        self.assertEqual((pageTriage.type, pageTriage.textLayer, pageTriage.visibleChars), (document_triage.SCANNED, True, 0))
+
+
+    def test_scannedPageWithPageNumber(self):
+        page = documents.addScannedPage(self.document)
+        page.insert_text((290, 820), "12")
+        pageTriage = document_triage.PageTriage(page)
+        self.assertEqual((pageTriage.type, pageTriage.textLayer), (document_triage.SCANNED, False))
+
+
+    def test_textOverBackgroundImageIsBornDigital(self):
+        page = documents.addTextPage(self.document)
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 85), False)
+        pixmap.clear_with(255)
+        page.insert_image(page.rect, pixmap=pixmap, overlay=False)
+        pageTriage = document_triage.PageTriage(page)
+        self.assertGreaterEqual(pageTriage.imageCoverage, document_triage.SCANNED_COVERAGE)
+        self.assertEqual((pageTriage.type, pageTriage.textLayer), (document_triage.BORN_DIGITAL, True))
+
+
+    def test_unexaminedPageIsBornDigital(self):
+        pageTriage = document_triage.PageTriage(None)
+        self.assertEqual((pageTriage.examined, pageTriage.type, pageTriage.textLayer), (False, document_triage.BORN_DIGITAL, True))
+
+
+
+class DocumentTriageTest(unittest.TestCase):
+    """
+    Classification of documents and ranges of pages.
+    """
+
+    def setUp(self):
+        self.document = fitz.open()
+        documents.addTextPage(self.document, title="Thesis")
+        documents.addTextPage(self.document)
+        documents.addScannedPage(self.document)
+        documents.addScannedPage(self.document)
+        documents.addScannedPage(self.document, documents.PARAGRAPH)
+        documents.addTextPage(self.document)
+
+
+    def tearDown(self):
+        self.document.close()
+
+
+    def test_mixedDocument(self):
+        triage = document_triage.DocumentTriage(self.document)
+        self.assertEqual(triage.getDocumentType(), document_triage.MIXED)
+        self.assertEqual(triage.getScannedPages(), {2 : False, 3 : False, 4 : True})
+        self.assertEqual(triage.getRanges(), [
+            {"first" : 1, "last" : 2, "type" : document_triage.BORN_DIGITAL, "textLayer" : True},
+            {"first" : 3, "last" : 4, "type" : document_triage.SCANNED, "textLayer" : False},
+            {"first" : 5, "last" : 5, "type" : document_triage.SCANNED, "textLayer" : True},
+            {"first" : 6, "last" : 6, "type" : document_triage.BORN_DIGITAL, "textLayer" : True}])
+        info = triage.toDict()
+        self.assertEqual((info["pages"], info["scannedPages"], info["pagesWithoutTextLayer"], info["unexaminedPages"]), (6, 3, 2, 0))
+
+
+    def test_documentTypes(self):
+        scanned = fitz.open()
+        documents.addScannedPage(scanned)
+        self.assertEqual(document_triage.DocumentTriage(scanned).getDocumentType(), document_triage.SCANNED)
+        bornDigital = fitz.open()
+        documents.addTextPage(bornDigital)
+        self.assertEqual(document_triage.DocumentTriage(bornDigital).getDocumentType(), document_triage.BORN_DIGITAL)
+
+
+    def test_pagesExaminedByFunction(self):
+        def examinePage(pageNumber):
+            return document_triage.PageTriage(self.document[pageNumber] if pageNumber != 3 else None)
+        triage = document_triage.DocumentTriage(self.document, examinePage)
+        self.assertEqual(triage.getScannedPages(), {2 : False, 4 : True})
+        self.assertEqual(triage.toDict()["unexaminedPages"], 1)
@@ -0,0 +1,126 @@
+#----------------------------------------------------------------------------
+# File          : test_overflow_scan.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import random
+import unittest
+import fitz
+from ..bl import overflow_scan
+
+## White color of RGB pixmaps
+WHITE = (255, 255, 255)
+
+
+def createPixmap(rect : tuple, blackRects : list = (), colorspace = fitz.csRGB) -> fitz.Pixmap:
+    """
+    Creates white pixmap with black rectangles.
+
+    Args:
+        rect (tuple): Position of the pixmap (x0, y0, x1, y1).
+        blackRects (list, optional): Black rectangles (x0, y0, x1, y1) in page coordinates, right and bottom sides are exclusive. Defaults to ().
+        colorspace (optional): Colorspace of the pixmap. Defaults to fitz.csRGB.
+
+    Returns:
+        fitz.Pixmap: Created pixmap.
+    """
+    pixmap = fitz.Pixmap(colorspace, fitz.IRect(rect), False)
+    pixmap.clear_with(255)
+    for blackRect in blackRects:
+        pixmap.set_rect(fitz.IRect(blackRect), (0,) * pixmap.n)
+    return pixmap
+
+
+
+class OverflowRectsTest(unittest.TestCase):
+    """
+    Scanning of pixmaps for content out of borders.
+    """
+
+    def test_rightOverflow(self):
+        pixmap = createPixmap((0, 0, 100, 50), [(80, 10, 90, 20)])
+        self.assertEqual(overflow_scan.getRightOverflowRects(pixmap, 70, 1, WHITE), [[71, 9, 90, 20]])
+
+
+    def test_leftOverflow(self):
+        pixmap = createPixmap((0, 0, 100, 50), [(5, 30, 10, 35)])
+        self.assertEqual(overflow_scan.getLeftOverflowRects(pixmap, 20, 1, WHITE), [[4, 29, 20, 35]])
+
+
+    def test_contentInsideBordersIsNotOverflow(self):
+        pixmap = createPixmap((0, 0, 100, 50), [(20, 0, 71, 50)])
+        self.assertEqual(overflow_scan.getRightOverflowRects(pixmap, 70, 1, WHITE), [])
+        self.assertEqual(overflow_scan.getLeftOverflowRects(pixmap, 20, 1, WHITE), [])
+
+
+    def test_separatedRowsAreSeparateRects(self):
+        pixmap = createPixmap((0, 0, 100, 50), [(75, 5, 80, 10), (85, 8, 95, 12), (75, 30, 78, 31)])
+        self.assertEqual(overflow_scan.getRightOverflowRects(pixmap, 70, 0, WHITE), [[71, 5, 94, 11], [71, 30, 77, 30]])
+
+
+    def test_clippedPixmapGivesPageCoordinates(self):
+        blackRects = [(80, 10, 90, 20), (72, 40, 74, 45)]
+        pixmap = createPixmap((0, 0, 100, 50), blackRects)
+        clip = createPixmap((71, 0, 100, 50), blackRects)
+        self.assertEqual(overflow_scan.getRightOverflowRects(clip, 70, 1, WHITE), overflow_scan.getRightOverflowRects(pixmap, 70, 1, WHITE))
+
+
+    def test_nearWhiteTolerance(self):
+        pixmap = createPixmap((0, 0, 30, 10), colorspace=fitz.csGRAY)
+        pixmap.set_rect(fitz.IRect(25, 2, 27, 4), (250,))
+        self.assertEqual(overflow_scan.getRightOverflowRects(pixmap, 20, 0, (255,)), [[21, 2, 26, 3]])
+        self.assertEqual(overflow_scan.getRightOverflowRects(pixmap, 20, 0, (255,), 5), [])
+
+
+    def test_pixelwiseScanGivesSameResult(self):
+        generator = random.Random(0)
+        for _ in range(20):
+            blackRects = []
+            for _ in range(generator.randint(0, 6)):
+                x, y = generator.randrange(100), generator.randrange(50)
+                blackRects.append((x, y, x + generator.randint(1, 10), y + generator.randint(1, 5)))
+            pixmap = createPixmap((0, 0, 100, 50), blackRects)
+            self.assertEqual(overflow_scan.getRightOverflowRectsPixelwise(pixmap, 70, 1, WHITE), overflow_scan.getRightOverflowRects(pixmap, 70, 1, WHITE))
+            self.assertEqual(overflow_scan.getLeftOverflowRectsPixelwise(pixmap, 20, 1, WHITE), overflow_scan.getLeftOverflowRects(pixmap, 20, 1, WHITE))
+
+
+
+class CandidateBandsTest(unittest.TestCase):
+    """
+    Finding of rows with content in low resolution pixmaps.
+    """
+
+    def test_bandsAreExtendedAndMerged(self):
+        pixmap = createPixmap((0, 0, 10, 40), [(2, 5, 4, 7), (6, 30, 7, 31)], fitz.csGRAY)
+        self.assertEqual(overflow_scan.getCandidateBands(pixmap, 1.0, (255,)), [(4.0, 8.0), (29.0, 32.0)])
+        self.assertEqual(overflow_scan.getCandidateBands(pixmap, 1.0, (255,), 30), [(4.0, 32.0)])
+
+
+    def test_bandsAreInPageCoordinates(self):
+        pixmap = createPixmap((0, 10, 10, 20), [(0, 12, 10, 13)], fitz.csGRAY)
+        self.assertEqual(overflow_scan.getCandidateBands(pixmap, 2.0, (255,)), [(5.5, 7.0)])
+
+
+    def test_whitePixmapHasNoBands(self):
+        self.assertEqual(overflow_scan.getCandidateBands(createPixmap((0, 0, 10, 40), colorspace=fitz.csGRAY), 1.0, (255,)), [])
+
+
+
+class BoxOverflowTest(unittest.TestCase):
+    """
+    Finding of overflow from bounding boxes of page content.
+    """
+
+    def test_overlappingBoxesAreMerged(self):
+        boxes = [(10, 10, 90, 20), (50, 15, 95, 25), (10, 40, 60, 50), (30, 60, 80, 62)]
+        self.assertEqual(overflow_scan.getRightOverflowRectsFromBoxes(boxes, 70, 1), [[71, 9, 96, 26], [71, 59, 81, 63]])
+
+
+    def test_leftOverflow(self):
+        boxes = [(5, 10, 90, 20), (15, 30, 60, 40)]
+        self.assertEqual(overflow_scan.getLeftOverflowRectsFromBoxes(boxes, 10, 1), [[4, 9, 10, 21]])
@@ -0,0 +1,62 @@
+#----------------------------------------------------------------------------
+# File          : test_page_cache.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import unittest
+from ..bl import page_cache
+
+
+
+class PageCacheTest(unittest.TestCase):
+    """
+    Cache of extracted pages with memory budget.
+    """
+
+    def test_entriesAreKeyedByPageAndFlags(self):
+        cache = page_cache.PageCache(100)
+        cache.put(1, (True,), "a", 10)
+        self.assertEqual(cache.get(1, (True,)), "a")
+        self.assertIsNone(cache.get(1, (False,)))
+        self.assertIsNone(cache.get(2, (True,)))
+        info = cache.getInfo()
+        self.assertEqual((info["hits"], info["misses"]), (1, 2))
+
+
+    def test_leastRecentlyUsedEntryIsEvicted(self):
+        cache = page_cache.PageCache(30)
+        for pageNumber in range(3):
+            cache.put(pageNumber, (), pageNumber, 10)
+        cache.get(0, ())
+        cache.put(3, (), 3, 10)
+        self.assertIsNone(cache.get(1, ()))
+        self.assertEqual([cache.get(pageNumber, ()) for pageNumber in (0, 2, 3)], [0, 2, 3])
+        self.assertEqual((cache.size, cache.evictions), (30, 1))
+
+
+    def test_replacedEntryUpdatesSize(self):
+        cache = page_cache.PageCache(100)
+        cache.put(0, (), "a", 40)
+        cache.put(0, (), "b", 20)
+        self.assertEqual((cache.get(0, ()), cache.size, len(cache.entries)), ("b", 20, 1))
+
+
+    def test_entryOverBudgetIsNotKept(self):
+        cache = page_cache.PageCache(0)
+        cache.put(0, (), "a", 1)
+        self.assertIsNone(cache.get(0, ()))
+        self.assertEqual(cache.size, 0)
+
+
+    def test_clearKeepsCounters(self):
+        cache = page_cache.PageCache(100)
+        cache.put(0, (), "a", 10)
+        cache.get(0, ())
+        cache.clear()
+        self.assertIsNone(cache.get(0, ()))
+        self.assertEqual((cache.size, cache.hits, cache.misses), (0, 1, 1))
@@ -0,0 +1,72 @@
+#----------------------------------------------------------------------------
+# File          : test_rect_index.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import math
+import random
+import unittest
+import numpy
+from ..bl import rect_index
+
+
+
+class IsCloseTest(unittest.TestCase):
+    """
+    Comparison of coordinates with tolerance.
+    """
+
+    def test_sameAsNumpy(self):
+        values = [0.0, 1e-9, 1.0, 1.00001, 1.0000101, -5.0, 100.0, 100.001, math.inf, -math.inf, math.nan]
+        for a in values:
+            for b in values:
+                self.assertEqual(rect_index.isClose(a, b), bool(numpy.isclose(a, b, rtol=rect_index.RTOL, atol=rect_index.ATOL)), (a, b))
+
+
+    def test_paddingIsTolerance(self):
+        self.assertTrue(rect_index.isClose(200.0 + rect_index.getPadding(200.0), 200.0))
+        self.assertFalse(rect_index.isClose(200.0 + 2 * rect_index.getPadding(200.0), 200.0))
+
+
+
+class RectIndexTest(unittest.TestCase):
+    """
+    Spatial index must give the same result as comparison with every indexed rectangle.
+    """
+
+    def assertSameAsBruteForce(self, rects : list, tested : list):
+        index = rect_index.RectIndex(rects)
+        for rect in tested:
+            expected = any(rect_index.rectRelativePosition(rect, other) == 0 for other in rects)
+            self.assertEqual(index.containsRect(rect), expected, rect)
+
+
+    def test_randomRects(self):
+        generator = random.Random(0)
+        def randomRect():
+            x, y = generator.uniform(0, 500), generator.uniform(0, 800)
+            return (x, y, x + generator.uniform(0, 200), y + generator.uniform(0, 200))
+        rects = [randomRect() for _ in range(40)]
+        tested = [randomRect() for _ in range(500)] + [(rect[0] + 1, rect[1] + 1, rect[2] - 1, rect[3] - 1) for rect in rects]
+        self.assertSameAsBruteForce(rects, tested)
+
+
+    def test_specialRects(self):
+        rects = [(10, 10, 100, 100), (200, 10, 150, 100), (-math.inf, 300, math.inf, 400), (math.nan, 0, 10, 10)]
+        tested = [(20, 20, 30, 30), (160, 20, 190, 30), (0, 310, 1e6, 390), (1, 1, 5, 5), (30, 30, 20, 20), (10 - 1e-6, 10, 100 + 1e-6, 100), (5, 5, 50, 50)]
+        self.assertSameAsBruteForce(rects, tested)
+
+
+    def test_rectOnToleranceIsInside(self):
+        index = rect_index.RectIndex([(10, 10, 100, 100)])
+        self.assertTrue(index.containsRect((10 - 1e-7, 10, 100 + 1e-4, 100)))
+        self.assertFalse(index.containsRect((10, 10, 100.01, 100)))
+
+
+    def test_emptyIndex(self):
+        self.assertFalse(rect_index.RectIndex([]).containsRect((0, 0, 1, 1)))
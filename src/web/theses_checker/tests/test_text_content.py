@@ -0,0 +1,64 @@
+#----------------------------------------------------------------------------
+# File          : test_text_content.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import os
+import re
+import tempfile
+import unittest
+import fitz
+from ..bl.theses_checker import Checker
+from . import documents
+
+
+
+class DehyphenatedBlockTextTest(unittest.TestCase):
+    """
+    Text of blocks joined in Python from lines of the shared dictionary compared with text of blocks extracted by MuPDF.
+    """
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        pdfPath = os.path.join(self.tmpDir.name, "thesis.pdf")
+        documents.createThesis(pdfPath, pages=1)
+        self.checker = Checker(pdfPath)
+        self.document = fitz.open()
+        self.page = documents.addTextPage(self.document, title="Chapter 1", paragraphs=2)
+        self.page.insert_textbox(fitz.Rect(72, 400, 300, 480), "Theses are pro-\ngrammed to be\nchecked by hand-\nmade tools", fontsize=11)
+        self.page.insert_textbox(fitz.Rect(72, 500, 300, 550), "Every well-\nknown mistake is well-", fontsize=11)
+
+
+    def tearDown(self):
+        self.document.close()
+        self.tmpDir.cleanup()
+
+
+    def getBlocks(self) -> list:
+        """
+        Gets text blocks of the page as (dictionary block, text of the block extracted by MuPDF with TEXT_DEHYPHENATE).
+        """
+        textPage = self.page.get_textpage(flags=Checker.TEXT_FLAGS | fitz.TEXT_DEHYPHENATE)
+        blocks = [block for block in textPage.extractDICT()['blocks'] if block['type'] == 0]
+        texts = [block[4] for block in textPage.extractBLOCKS() if block[6] == 0]
+        self.assertEqual(len(blocks), len(texts))
+        return list(zip(blocks, texts))
+
+
+    def test_sameAsMuPdfBlocks(self):
+        getBlockText = self.checker._Checker__getDehyphenatedBlockText
+        for block, mupdfText in self.getBlocks():
+            # hyphens at ends of lines, which MuPDF does not join, are joined in the expected text (not at the end of the block)
+            expected = re.sub("[^\\S\\n]", " ", mupdfText.rstrip("\n").replace("-\n", ""))
+            self.assertEqual(getBlockText(block), expected)
+
+
+    def test_hyphenatedLinesAreJoined(self):
+        texts = [self.checker._Checker__getDehyphenatedBlockText(block) for block, _ in self.getBlocks()]
+        self.assertIn("Theses are programmed to be\nchecked by handmade tools", texts)
+        self.assertIn("Every wellknown mistake is well-", texts)
@@ -0,0 +1,101 @@
+#----------------------------------------------------------------------------
+# File          : test_text_scan.py
+# Created By    : Michaela Macková
+# Login         : xmacko13
+# Email         : michaela.mackovaa@gmail.com
+# Created Date  : 18.10.2026
+# Last Updated  : 18.10.2026
+# License       : AGPL-3.0 license
+# ---------------------------------------------------------------------------
+
+import re
+import unittest
+from ..bl import text_scan
+from ..bl.theses_checker import Checker
+
+
+def createBlock(lines : list) -> dict:
+    """
+    Creates text block of "dict" with one span on every line.
+
+    Args:
+        lines (list): Text of every line.
+
+    Returns:
+        dict: Text block.
+    """
+    return {'lines' : [{'spans' : [{'text' : text}]} for text in lines]}
+
+
+def createRawBlock(lines : list) -> dict:
+    """
+    Creates text block of "rawdict" matching createBlock, every character is 10 points wide and every line is 20 points high.
+
+    Args:
+        lines (list): Text of every line.
+
+    Returns:
+        dict: Text block.
+    """
+    return {'lines' : [{'spans' : [{'chars' : [{'bbox' : (10*x, 20*y, 10*x + 10, 20*y + 12)} for x in range(len(text))]}]}
+                       for y, text in enumerate(lines)]}
+
+
+
+class ScanRulesTest(unittest.TestCase):
+    """
+    Scanning of text for all text rules.
+    """
+
+    def test_overlappingMatchesOfDifferentRulesAreKept(self):
+        findings = text_scan.scanRules(Checker.TEXT_RULES_PATTERN, "Figure ??(a) and x - y")
+        self.assertEqual(findings, {"HYPHEN" : [(18, 21)], "BAD_REFERENCE" : [(7, 9)], "SPACE_BRACKET" : [(8, 10)]})
+
+
+    def test_overlappingMatchesOfRulesAreKept(self):
+        pattern = text_scan.compileRules({"A" : "ab", "B" : "bc", "C" : "x"})
+        self.assertEqual(text_scan.scanRules(pattern, "abcabc"), {"A" : [(0, 2), (3, 5)], "B" : [(1, 3), (4, 6)], "C" : []})
+
+
+    def test_rulesMatchingAtSamePositionAreKept(self):
+        pattern = text_scan.compileRules({"A" : "ab", "B" : "a", "C" : "a?b"})
+        self.assertEqual(text_scan.scanRules(pattern, "abb"), {"A" : [(0, 2)], "B" : [(0, 1)], "C" : [(0, 2), (2, 3)]})
+
+
+    def test_matchesOfOneRuleDoNotOverlap(self):
+        pattern = text_scan.compileRules({"A" : "aa", "B" : "a+"})
+        self.assertEqual(text_scan.scanRules(pattern, "aaaaa"), {"A" : [(0, 2), (2, 4)], "B" : [(0, 5)]})
+
+
+    def test_sameAsSeparateScans(self):
+        rules = {"A" : "a[ab]", "B" : "b+a?", "C" : "\\S(?:\\(|\\[)", "D" : " - "}
+        text = "aab - (ab[ba(bba - b)aaba"
+        findings = text_scan.scanRules(text_scan.compileRules(rules), text)
+        self.assertEqual(findings, {name : [match.span() for match in re.finditer(rule, text)] for name, rule in rules.items()})
+
+
+
+class CharIndexTest(unittest.TestCase):
+    """
+    Text of page mapped to bounding boxes of characters.
+    """
+
+    def setUp(self):
+        self.blocks = [["ab", "cd"], ["ef"]]
+        self.index = text_scan.CharIndex([createBlock(lines) for lines in self.blocks])
+
+
+    def test_textIsJoinedBySeparators(self):
+        self.assertEqual(self.index.text, "ab cd\nef\n")
+        self.assertEqual(self.index.lines, [0, 0, None, 1, 1, None, 2, 2, None])
+
+
+    def test_rectsAreMergedByLines(self):
+        self.index.addBoxes([createRawBlock(lines) for lines in self.blocks])
+        start = self.index.text.index("b")
+        self.assertEqual(self.index.getRects(start, start + 4), [[10, 0, 20, 12], [0, 20, 20, 32]])
+
+
+    def test_separatorsHaveNoRect(self):
+        self.index.addBoxes([createRawBlock(lines) for lines in self.blocks])
+        self.assertEqual(self.index.getRects(5, 6), [])
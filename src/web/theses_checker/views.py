@@ -54,13 +54,15 @@ def checkPDF(request):
         exception = "File '" + request.FILES['file'].name + "' could not be parsed. Document does not contain any pages."
         return render(request, '500.html', {'exception': exception}, status=500)
     
-    checker.annotate(os.path.join(pdf_dir, pdf_name))
+    checker.annotate(os.path.join(pdf_dir, pdf_name), memoryLimit=settings.CHECKER_MEMORY_LIMIT, pageTimeout=settings.CHECKER_PAGE_TIMEOUT)
 
     json_dir = os.path.join(settings.BASE_DIR, 'files', 'json')
     json_name = pdf_name[:-4]
     chaptersInfo = {
         json_name: DocumentInfoAdvanced(checker.chaptersInfo[0], checker.chaptersInfo[1], checker.chaptersInfo[2]).toDict(),
-        json_name + " (typography)": checker.typographyMistakes.toDict()
+        json_name + " (typography)": checker.typographyMistakes.toDict(),
+        json_name + " (memory)": checker.memoryInfo,
+        json_name + " (triage)": checker.triageInfo
     }
     auxiliary_functions.saveDictAsJSON(chaptersInfo, os.path.join(json_dir, json_name + '.json'))
 
@@ -98,6 +100,20 @@ def show_annotated(request, pdf_name):
         typography_dict = {}
         typography_available = False
 
+    try:
+        memory_dict = json_dict[json_title + " (memory)"]
+        memory_available = True
+    except:
+        memory_dict = {}
+        memory_available = False
+
+    try:
+        triage_dict = json_dict[json_title + " (triage)"]
+        triage_available = triage_dict != None
+    except:
+        triage_dict = {}
+        triage_available = False
+
     
     return render(request, 'theses_checker/annotated.html', {
         'pdf_name': pdf_name,
@@ -105,6 +121,10 @@ def show_annotated(request, pdf_name):
         'info' : info_dict,
         'typography_available' : typography_available,
         'typography' : typography_dict,
+        'memory_available' : memory_available,
+        'memory' : memory_dict,
+        'triage_available' : triage_available,
+        'triage' : triage_dict,
     })
 
 
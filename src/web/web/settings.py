@@ -38,6 +38,16 @@ OPERATING_SYSTEM = config('OPERATING_SYSTEM', cast=Choices(['Linux', 'Windows'])
 # TODO: set in file .env: Allowed values: None or integer number
 MAX_STORAGE_SPACE : (int|None) = None if config('MAX_STORAGE_SPACE', default=None) == None else config('MAX_STORAGE_SPACE', cast=int)
 
+# CHECKER_MEMORY_LIMIT (int|None): maximum memory (resident set size) in bytes of process checking a document, if exceeded, only already checked pages are annotated,
+#                                  if None, memory is not limited (WARNING: only for Linux and Windows, for other systems ignored)
+# TODO: set in file .env: Allowed values: None or integer number
+CHECKER_MEMORY_LIMIT : (int|None) = None if config('CHECKER_MEMORY_LIMIT', default=None) == None else config('CHECKER_MEMORY_LIMIT', cast=int)
+
+# CHECKER_PAGE_TIMEOUT (float|None): maximum time in seconds of checking of one page, if exceeded, the page is skipped,
+#                                    if None, time of checking is not limited
+# TODO: set in file .env: Allowed values: None or number
+CHECKER_PAGE_TIMEOUT : (float|None) = None if config('CHECKER_PAGE_TIMEOUT', default=None) == None else config('CHECKER_PAGE_TIMEOUT', cast=float)
+
 # TODO: set in file .env
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='.localhost, 127.0.0.1, [::1]', cast=Csv())
 